@@ -0,0 +1,59 @@
+"""Benchmark Connexion and Celery app factories.
+
+Apps are created repeatedly from within a deep call stack, mimicking app
+creation in large test suites or long import chains, both with debug
+logging enabled and disabled.
+
+Usage::
+
+    python benchmarks/benchmark_app_factories.py [--number N] [--depth N]
+"""
+
+import argparse
+import logging
+from timeit import repeat
+from typing import Callable
+
+from foca.factories.celery_app import create_celery_app
+from foca.factories.connexion_app import create_connexion_app
+from foca.models.config import (Config, JobsConfig)
+
+
+def call_nested(func: Callable, depth: int) -> None:
+    """Call function from within a call stack of the given depth."""
+    if depth > 0:
+        return call_nested(func, depth - 1)
+    func()
+
+
+def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=100)
+    parser.add_argument("--depth", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    config = Config(jobs=JobsConfig())
+    flask_app = create_connexion_app(config).app
+    factories = {
+        "create_connexion_app": lambda: create_connexion_app(config),
+        "create_celery_app": lambda: create_celery_app(flask_app),
+    }
+    logging.basicConfig(handlers=[logging.NullHandler()])
+    for level in (logging.INFO, logging.DEBUG):
+        logging.getLogger("foca").setLevel(level)
+        for name, factory in factories.items():
+            timings = repeat(
+                lambda: call_nested(factory, args.depth),
+                number=args.number,
+                repeat=args.repeat,
+            )
+            print(
+                f"{name:<22} {logging.getLevelName(level):<6} "
+                f"{min(timings) / args.number * 1000:.2f}ms per app"
+            )
+
+
+if __name__ == "__main__":
+    main()
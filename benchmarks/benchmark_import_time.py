@@ -0,0 +1,94 @@
+"""Benchmark import time of FOCA modules.
+
+Each statement is executed in a fresh interpreter, with ``-X importtime``,
+and the cumulative import time of all top-level imports is reported,
+together with the optional dependencies that were imported along the way.
+
+Usage::
+
+    python benchmarks/benchmark_import_time.py [--repeat N]
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import (List, Tuple)
+
+STATEMENTS = [
+    "import foca",
+    "import foca.utils.misc",
+    "import foca.models.config",
+    "from foca import Foca",
+    "import foca.database.register_mongodb",
+    "import foca.security.access_control.register_access_control",
+    "import foca.factories.celery_app",
+]
+
+OPTIONAL_DEPENDENCIES = [
+    "casbin",
+    "celery",
+    "connexion",
+    "cryptography",
+    "flask_authz",
+    "flask_cors",
+    "flask_pymongo",
+    "jwt",
+    "pymongo",
+    "requests",
+]
+
+
+def measure(statement: str) -> Tuple[float, List[str]]:
+    """Measure import time of statement in a fresh interpreter.
+
+    Args:
+        statement: Python statement to execute.
+
+    Returns:
+        Tuple of cumulative import time, in seconds, and list of optional
+        dependencies imported by `statement`.
+    """
+    check = (
+        f"{statement}; import sys; "
+        f"print(','.join(m for m in {OPTIONAL_DEPENDENCIES!r} "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", check],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line.split("|")
+        # top-level imports are not indented
+        if fields[2].startswith("  ") or not fields[1].strip().isdigit():
+            continue
+        total += int(fields[1])
+    imported = [m for m in result.stdout.strip().split(",") if m]
+    return total / 1e6, imported
+
+
+def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for statement in STATEMENTS:
+        timings = []
+        imported: List[str] = []
+        for _ in range(args.repeat):
+            timing, imported = measure(statement)
+            timings.append(timing)
+        print(
+            f"{statement:<62} best of {args.repeat}: {min(timings):.3f}s "
+            f"[{', '.join(imported)}]"
+        )
+
+
+if __name__ == "__main__":
+    main()
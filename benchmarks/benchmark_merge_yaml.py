@@ -0,0 +1,113 @@
+"""Benchmark parsing and merging of large OpenAPI specifications.
+
+Compares :py:meth:`foca.config.config_parser.ConfigParser.merge_yaml` with
+the previous implementation, which parsed each file with the pure-Python
+YAML loader and merged the documents via ``addict`` (only if installed).
+
+Usage::
+
+    python benchmarks/benchmark_merge_yaml.py [--paths N] [--repeat N]
+"""
+
+import argparse
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import repeat
+from typing import Dict, List
+
+import yaml
+
+from foca.config.config_parser import ConfigParser
+
+
+def generate_spec(n_paths: int, offset: int = 0) -> Dict:
+    """Generate an OpenAPI 3 specification with `n_paths` path items."""
+    spec: Dict = {
+        "openapi": "3.0.0",
+        "info": {"title": "Benchmark", "version": "1.0.0"},
+        "paths": {},
+        "components": {"schemas": {}},
+    }
+    for i in range(offset, offset + n_paths):
+        spec["components"]["schemas"][f"Item{i}"] = {
+            "type": "object",
+            "required": ["id", "name"],
+            "properties": {
+                "id": {"type": "integer", "format": "int64"},
+                "name": {"type": "string"},
+                "tags": {"type": "array", "items": {"type": "string"}},
+            },
+        }
+        spec["paths"][f"/items{i}/{{id}}"] = {
+            "get": {
+                "operationId": f"getItem{i}",
+                "parameters": [{
+                    "name": "id",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "integer"},
+                }],
+                "responses": {
+                    "200": {
+                        "description": "Item.",
+                        "content": {"application/json": {"schema": {
+                            "$ref": f"#/components/schemas/Item{i}",
+                        }}},
+                    },
+                },
+            },
+        }
+    return spec
+
+
+def merge_yaml_previous(*args: Path) -> Dict:
+    """Previous implementation of ``ConfigParser.merge_yaml``."""
+    from addict import Dict as Addict  # type: ignore
+
+    args_list = list(args)
+    if not args_list:
+        return {}
+    with open(args_list.pop(0)) as _file:
+        yaml_dict = Addict(yaml.safe_load(_file))
+    for arg in args_list:
+        with open(arg) as _file:
+            yaml_dict.update(Addict(yaml.safe_load(_file)))
+    return yaml_dict.to_dict()
+
+
+def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paths", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmp_dir:
+        paths: List[Path] = []
+        for index in range(2):
+            path = Path(tmp_dir) / f"spec_{index}.yaml"
+            with open(path, "w") as _file:
+                yaml.safe_dump(
+                    generate_spec(args.paths, offset=index * args.paths // 2),
+                    _file,
+                )
+            paths.append(path)
+
+        candidates = {"merge_yaml": ConfigParser.merge_yaml}
+        try:
+            import addict  # type: ignore # noqa: F401
+            candidates["previous (addict)"] = merge_yaml_previous
+        except ImportError:
+            print("'addict' not installed; skipping previous implementation")
+
+        for name, func in candidates.items():
+            timings = repeat(
+                lambda: func(*paths),  # type: ignore[operator]
+                number=1,
+                repeat=args.repeat,
+            )
+            print(f"{name:<20} best of {args.repeat}: {min(timings):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark registration of many large OpenAPI specifications.
+
+Compares :py:func:`foca.api.register_openapi.register_openapi` with specs
+loaded and processed one after another and concurrently, in a pool of
+worker processes. Processed specs are removed before each run, so that each
+run starts cold. Registration from previously processed specs is timed
+separately.
+
+Usage::
+
+    python benchmarks/benchmark_register_openapi.py [--specs N] [--paths N]
+        [--workers N] [--repeat N]
+"""
+
+import argparse
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import repeat
+from typing import List
+
+from connexion import App
+import yaml
+
+from benchmark_merge_yaml import generate_spec
+from foca.api.register_openapi import register_openapi
+from foca.models.config import SpecConfig
+
+
+def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--specs", type=int, default=12)
+    parser.add_argument("--paths", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmp_dir:
+        specs: List[SpecConfig] = []
+        for index in range(args.specs):
+            path = Path(tmp_dir) / f"spec_{index}.yaml"
+            spec = generate_spec(args.paths)
+            spec["servers"] = [{"url": f"/api{index}"}]
+            with open(path, "w") as _file:
+                yaml.safe_dump(spec, _file)
+            specs.append(SpecConfig(
+                path=path,
+                add_operation_fields={
+                    "x-openapi-router-controller": "controllers",
+                },
+                connexion={"resolver_error": 501},
+            ))
+
+        def register(workers: int, cold: bool = True) -> None:
+            """Register all specs with a new app."""
+            if cold:
+                for spec in specs:
+                    Path(spec.path_out).unlink(  # type: ignore[arg-type]
+                        missing_ok=True,
+                    )
+            register_openapi(app=App(__name__), specs=specs, workers=workers)
+
+        candidates = {
+            "serial": lambda: register(workers=1),
+            f"{args.workers} workers": lambda: register(workers=args.workers),
+            "processed": lambda: register(workers=1, cold=False),
+        }
+        for name, func in candidates.items():
+            timings = repeat(func, number=1, repeat=args.repeat)
+            print(f"{name:<20} best of {args.repeat}: {min(timings):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark validation of request and response bodies.
+
+Compares validation of payloads of increasing size against a petstore-like
+schema with a validator created per payload (as done by Connexion for
+responses), a validator created once and a compiled validation function
+(cf. :py:func:`foca.api.validation.compile_schema`).
+
+Usage::
+
+    python benchmarks/benchmark_validation.py [--items N] [--number N]
+        [--repeat N]
+"""
+
+import argparse
+from timeit import repeat
+from typing import Callable, Dict, List
+
+from connexion.json_schema import Draft4ResponseValidator
+from jsonschema import draft4_format_checker
+
+from foca.api.validation import compile_schema
+
+SCHEMA: Dict = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "required": ["id", "name"],
+        "properties": {
+            "id": {"type": "integer", "format": "int64"},
+            "name": {"type": "string"},
+            "tag": {"type": "string"},
+            "tags": {"type": "array", "items": {"type": "string"}},
+        },
+    },
+}
+
+
+def generate_payload(items: int) -> List[Dict]:
+    """Generate list of pets."""
+    return [
+        {"id": index, "name": f"pet_{index}", "tags": ["a", "b", "c"]}
+        for index in range(items)
+    ]
+
+
+def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    cached = compile_schema(
+        SCHEMA,
+        validator=Draft4ResponseValidator,
+        compiled=False,
+    )
+    compiled = compile_schema(SCHEMA, validator=Draft4ResponseValidator)
+
+    for items in args.items:
+        payload = generate_payload(items)
+        candidates: Dict[str, Callable[[], None]] = {
+            "per payload": lambda: Draft4ResponseValidator(
+                SCHEMA,
+                format_checker=draft4_format_checker,
+            ).validate(payload),
+            "cached": lambda: cached(payload),
+            "compiled": lambda: compiled(payload),
+        }
+        for name, func in candidates.items():
+            timings = repeat(func, number=args.number, repeat=args.repeat)
+            per_call = min(timings) / args.number * 1e6
+            print(f"{items:>5} items {name:<12} {per_call:10.1f}us")
+
+
+if __name__ == "__main__":
+    main()
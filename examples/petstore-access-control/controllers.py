@@ -9,6 +9,7 @@ from exceptions import NotFound
 from foca.security.access_control.register_access_control import (
     check_permissions
 )
+from foca.utils.db import SequenceAllocator
 
 logger = logging.getLogger(__name__)
 
@@ -35,12 +36,8 @@ def addPet(pet):
         current_app.config.foca.db.dbs['petstore-access-control']
         .collections['pets'].client
     )
-    counter = 0
-    ctr = db_collection.find({}).sort([('$natural', -1)])
-    if not db_collection.count_documents({}) == 0:
-        counter = ctr[0].get('id') + 1
     record = {
-        "id": counter,
+        "id": _get_pet_ids().next(),
         "name": pet['name'],
         "tag": pet['tag']
     }
@@ -81,3 +78,17 @@ def deletePet(id):
     )
     response = make_response('', 204)
     return response
+
+
+def _get_pet_ids() -> SequenceAllocator:
+    """Get allocator of pet identifiers shared by all requests."""
+    if 'pet_ids' not in current_app.extensions:
+        current_app.extensions['pet_ids'] = SequenceAllocator(
+            collection=(
+                current_app.config.foca.db.dbs['petstore-access-control']
+                .collections['counters'].client
+            ),
+            name='pets',
+            block_size=10,
+        )
+    return current_app.extensions['pet_ids']
@@ -6,6 +6,7 @@ from flask import (current_app, make_response)
 from pymongo.collection import Collection
 
 from exceptions import NotFound
+from foca.utils.db import SequenceAllocator, stream_json_array
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +23,7 @@ def findPets(limit=None, tags=None):
         filter_dict,
         {'_id': False}
     ).sort([('$natural', -1)]).limit(limit)
-    return list(records)
+    return stream_json_array(records)
 
 
 def addPet(pet):
@@ -30,12 +31,8 @@ def addPet(pet):
         current_app.config.foca.db.dbs['petstore']
         .collections['pets'].client
     )
-    counter = 0
-    ctr = db_collection.find({}).sort([('$natural', -1)])
-    if not db_collection.count_documents({}) == 0:
-        counter = ctr[0].get('id') + 1
     record = {
-        "id": counter,
+        "id": _get_pet_ids().next(),
         "name": pet['name'],
         "tag": pet['tag']
     }
@@ -74,3 +71,17 @@ def deletePet(id):
     )
     response = make_response('', 204)
     return response
+
+
+def _get_pet_ids() -> SequenceAllocator:
+    """Get allocator of pet identifiers shared by all requests."""
+    if 'pet_ids' not in current_app.extensions:
+        current_app.extensions['pet_ids'] = SequenceAllocator(
+            collection=(
+                current_app.config.foca.db.dbs['petstore']
+                .collections['counters'].client
+            ),
+            name='pets',
+            block_size=10,
+        )
+    return current_app.extensions['pet_ids']
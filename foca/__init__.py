@@ -1,3 +1,17 @@
 """FOCA root package."""
 
-from foca.foca import Foca  # noqa: F401
+from importlib import import_module
+from typing import (Any, TYPE_CHECKING)
+
+if TYPE_CHECKING:
+    from foca.foca import Foca  # noqa: F401
+
+
+def __getattr__(name: str) -> Any:
+    """Import :py:class:`foca.foca.Foca` on first access, so that importing
+    FOCA subpackages (e.g., ``foca.utils``) does not import Connexion and all
+    other dependencies required for setting up an app.
+    """
+    if name == "Foca":
+        return import_module("foca.foca").Foca
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
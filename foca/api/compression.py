@@ -0,0 +1,285 @@
+"""Compression of responses."""
+
+import logging
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+import zlib
+
+from flask import Flask, request, Response
+
+from foca.models.config import CompressionAlgorithmEnum, CompressionConfig
+from foca.utils.cache import LRUCache
+
+# Use optional compression libraries if available
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
+
+# Get logger instance
+logger = logging.getLogger(__name__)
+
+# Maximum number of compressed static files kept in memory
+STATIC_CACHE_SIZE = 256
+
+# Status codes of responses with bodies that must not be compressed
+_EXCLUDED_STATUS_CODES = frozenset({204, 206, 304})
+
+
+class _Compressor():
+    """Incremental compressor.
+
+    Args:
+        algorithm: Compression algorithm.
+        level: Compression level; if ``None``, the default level of the
+            algorithm is used.
+    """
+
+    def __init__(
+        self,
+        algorithm: CompressionAlgorithmEnum,
+        level: Optional[int] = None,
+    ) -> None:
+        """Constructor method."""
+        self._flush: Callable[[], bytes]
+        self._finish: Callable[[], bytes]
+        if algorithm is CompressionAlgorithmEnum.br:
+            compressor = brotli.Compressor(
+                quality=4 if level is None else min(level, 11),
+            )
+            self._compress = compressor.process
+            self._flush = compressor.flush
+            self._finish = compressor.finish
+        elif algorithm is CompressionAlgorithmEnum.zstd:
+            zstd_compressobj = zstandard.ZstdCompressor(
+                level=3 if level is None else min(level, 22),
+            ).compressobj()
+            self._compress = zstd_compressobj.compress
+            self._flush = lambda: zstd_compressobj.flush(
+                zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            )
+            self._finish = zstd_compressobj.flush
+        else:
+            compressobj = zlib.compressobj(
+                6 if level is None else min(level, 9),
+                zlib.DEFLATED,
+                16 + zlib.MAX_WBITS,
+            )
+            self._compress = compressobj.compress
+            self._flush = lambda: compressobj.flush(zlib.Z_SYNC_FLUSH)
+            self._finish = compressobj.flush
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        """Compress chunk of data.
+
+        Args:
+            data: Data to be compressed.
+            flush: Whether all data compressed so far is to be returned, so
+                that the client can decompress it.
+
+        Returns:
+            Compressed data; may be empty if `flush` is not set.
+        """
+        compressed = self._compress(data)
+        if flush:
+            compressed += self._flush()
+        return compressed
+
+    def finish(self) -> bytes:
+        """Finish compression.
+
+        Returns:
+            Remaining compressed data.
+        """
+        return self._finish()
+
+
+def get_algorithms(
+    algorithms: Iterable[CompressionAlgorithmEnum],
+) -> List[CompressionAlgorithmEnum]:
+    """Get compression algorithms whose dependencies are installed.
+
+    Args:
+        algorithms: Requested compression algorithms.
+
+    Returns:
+        Available algorithms, in requested order.
+    """
+    available = []
+    for algorithm in algorithms:
+        if (
+            algorithm is CompressionAlgorithmEnum.br and brotli is None or
+            algorithm is CompressionAlgorithmEnum.zstd and zstandard is None
+        ):
+            logger.warning(
+                f"Compression algorithm '{algorithm.value}' skipped: "
+                "optional dependency not installed"
+            )
+            continue
+        available.append(algorithm)
+    return available
+
+
+def compress(
+    data: bytes,
+    algorithm: CompressionAlgorithmEnum,
+    level: Optional[int] = None,
+) -> bytes:
+    """Compress data.
+
+    Args:
+        data: Data to be compressed.
+        algorithm: Compression algorithm.
+        level: Compression level; if ``None``, the default level of the
+            algorithm is used.
+
+    Returns:
+        Compressed data.
+
+    Example:
+
+        >>> import gzip
+        >>> data = compress(b"foca", CompressionAlgorithmEnum.gzip)
+        >>> gzip.decompress(data)
+        b'foca'
+    """
+    compressor = _Compressor(algorithm, level)
+    return compressor.compress(data) + compressor.finish()
+
+
+def register_compression(app: Flask, conf: CompressionConfig) -> Flask:
+    """Register handler compressing responses with Flask app.
+
+    Responses are compressed if their MIME type is listed in the
+    configuration, their status code indicates a body and the client accepts
+    one of the configured algorithms. Response bodies smaller than the
+    configured minimum size are not compressed. Streamed responses are
+    compressed chunk by chunk, as they are sent. Compressed static files,
+    e.g., the assets of the Swagger UI, are kept in memory, so that each
+    file is compressed only once.
+
+    Args:
+        app: Flask application instance.
+        conf: Compression configuration.
+
+    Returns:
+        Flask application instance with registered handler.
+    """
+    algorithms = get_algorithms(conf.algorithms)
+    if not algorithms:
+        logger.warning("No compression algorithm available.")
+        return app
+    encodings: Dict[str, CompressionAlgorithmEnum] = {
+        algorithm.value: algorithm for algorithm in algorithms
+    }
+    mimetypes = frozenset(conf.mimetypes)
+    static_cache = LRUCache(max_entries=STATIC_CACHE_SIZE)
+
+    def _compress_response(response: Response) -> Response:
+        """Compress response, if applicable."""
+        if (
+            response.mimetype not in mimetypes or
+            response.status_code in _EXCLUDED_STATUS_CODES or
+            not 200 <= response.status_code < 300 or
+            "Content-Encoding" in response.headers
+        ):
+            return response
+        response.vary.add("Accept-Encoding")
+        encoding = request.accept_encodings.best_match(list(encodings))
+        if encoding is None:
+            return response
+        algorithm = encodings[encoding]
+
+        if response.direct_passthrough:
+            _compress_static(response, algorithm, conf.level, static_cache)
+        elif response.is_streamed:
+            close = getattr(response.response, "close", None)
+            if close is not None:
+                response.call_on_close(close)
+            response.response = _compress_stream(
+                response.iter_encoded(),
+                algorithm,
+                conf.level,
+            )
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            if len(data) < conf.min_size:
+                return response
+            response.set_data(compress(data, algorithm, conf.level))
+        response.headers["Content-Encoding"] = encoding
+        _weaken_etag(response)
+        return response
+
+    app.after_request(_compress_response)
+    logger.debug(
+        "Registered response compression with Flask app: "
+        f"{', '.join(encodings)}"
+    )
+    return app
+
+
+def _compress_static(
+    response: Response,
+    algorithm: CompressionAlgorithmEnum,
+    level: Optional[int],
+    cache: LRUCache,
+) -> None:
+    """Compress file response, reusing previously compressed data.
+
+    Args:
+        response: File response.
+        algorithm: Compression algorithm.
+        level: Compression level.
+        cache: Cache of compressed files, keyed by request path, entity tag
+            and algorithm.
+    """
+    etag, _ = response.get_etag()
+    key = (request.path, etag, algorithm)
+    data = cache.get(key) if etag is not None else None
+    response.direct_passthrough = False
+    if data is None:
+        data = compress(response.get_data(), algorithm, level)
+        if etag is not None:
+            cache.set(key, data)
+    else:
+        response.close()
+    response.set_data(data)
+
+
+def _compress_stream(
+    chunks: Iterable[bytes],
+    algorithm: CompressionAlgorithmEnum,
+    level: Optional[int],
+) -> Iterator[bytes]:
+    """Compress streamed response chunk by chunk.
+
+    Args:
+        chunks: Chunks of response body.
+        algorithm: Compression algorithm.
+        level: Compression level.
+
+    Yields:
+        Compressed chunks, each of which can be decompressed by the client
+        as it arrives.
+    """
+    compressor = _Compressor(algorithm, level)
+    for chunk in chunks:
+        if chunk:
+            yield compressor.compress(chunk, flush=True)
+    yield compressor.finish()
+
+
+def _weaken_etag(response: Response) -> None:
+    """Mark entity tag of compressed response as weak, as the compressed
+    representation differs from the uncompressed one.
+
+    Args:
+        response: Compressed response.
+    """
+    etag, weak = response.get_etag()
+    if etag is not None and not weak:
+        response.set_etag(etag, weak=True)
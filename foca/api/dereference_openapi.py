@@ -0,0 +1,235 @@
+"""Dereference JSON references in OpenAPI specifications."""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+from urllib.parse import unquote, urlparse
+
+import yaml
+
+from foca.config.config_parser import SafeLoader
+
+# Get logger instance
+logger = logging.getLogger(__name__)
+
+# Location of a node: path of the containing document and sequence of
+# (unescaped) JSON pointer reference tokens
+_Location = Tuple[Path, Tuple[str, ...]]
+
+
+class SpecDereferencer():
+    """Resolve JSON references (``$ref``) in an OpenAPI specification.
+
+    References to other parts of the specification and to other local files,
+    given relative to the referencing file, are replaced by the referenced
+    objects, which are themselves dereferenced. Each referenced object is
+    dereferenced only once, and identical referenced objects are replaced by
+    a single, shared object. References that would lead to infinite
+    recursion are kept as references; references to objects in other files
+    are rewritten as absolute ``file:`` URIs in that case. References to
+    remote documents (e.g., via ``http:``) are kept as is.
+
+    Args:
+        path: Path of the specification file. References to other files are
+            resolved relative to the parent directory of this path.
+
+    Attributes:
+        path: Path of the specification file. References to other files are
+            resolved relative to the parent directory of this path.
+        files: Dictionary of paths of all referenced files and hexadecimal
+            SHA-256 digests of their contents.
+        circular: List of references that were kept because they are
+            circular.
+
+    Example:
+
+        >>> SpecDereferencer(path=Path("/path/to/specs.yaml")).dereference({
+        ...     "definitions": {
+        ...         "Id": {"type": "string"},
+        ...         "Pet": {"items": {"$ref": "#/definitions/Id"}},
+        ...     },
+        ... })
+        {'definitions': {'Id': {'type': 'string'}, 'Pet': {'items': {'type': \
+'string'}}}}
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Constructor method."""
+        self.path: Path = Path(path).resolve()
+        self.files: Dict[str, str] = {}
+        self.circular: List[str] = []
+        self._docs: Dict[Path, Any] = {}
+        self._resolved: Dict[_Location, Any] = {}
+        self._active: Set[_Location] = set()
+        self._interned: Dict[str, Any] = {}
+
+    def dereference(self, spec: Dict) -> Dict:
+        """Dereference specification.
+
+        Args:
+            spec: Specification to be dereferenced. Not modified.
+
+        Returns:
+            Dereferenced specification.
+
+        Raises:
+            OSError: Referenced file cannot be read.
+            ValueError: Referenced file cannot be parsed or reference cannot
+                be resolved.
+        """
+        self._docs[self.path] = spec
+        spec_dereferenced = self._resolve_node(spec, (self.path, ()))
+        if self.circular:
+            logger.debug(f"Kept circular references: {self.circular}")
+        return spec_dereferenced
+
+    def _resolve_node(self, node: Any, location: _Location) -> Any:
+        """Dereference node and its children.
+
+        Args:
+            node: Node to be dereferenced.
+            location: Location of `node`.
+
+        Returns:
+            Dereferenced node.
+        """
+        if isinstance(node, dict):
+            if isinstance(node.get("$ref"), str):
+                return self._resolve_ref(node["$ref"], location[0])
+            if location in self._resolved:
+                return self._resolved[location]
+            self._active.add(location)
+            try:
+                return {
+                    key: self._resolve_node(
+                        val,
+                        (location[0], location[1] + (str(key),)),
+                    )
+                    for key, val in node.items()
+                }
+            finally:
+                self._active.discard(location)
+        if isinstance(node, list):
+            return [
+                self._resolve_node(
+                    val,
+                    (location[0], location[1] + (str(index),)),
+                )
+                for index, val in enumerate(node)
+            ]
+        return node
+
+    def _resolve_ref(self, ref: str, doc: Path) -> Any:
+        """Resolve reference.
+
+        Args:
+            ref: Reference to be resolved.
+            doc: Path of the document containing the reference.
+
+        Returns:
+            Dereferenced object or reference, if circular or remote.
+
+        Raises:
+            ValueError: Reference cannot be resolved.
+        """
+        uri, _, fragment = ref.partition("#")
+        if uri:
+            if urlparse(uri).scheme:
+                return {"$ref": ref}
+            doc = (doc.parent / unquote(uri)).resolve()
+        tokens = tuple(
+            token.replace("~1", "/").replace("~0", "~")
+            for token in unquote(fragment).split("/")[1:]
+        )
+        location = (doc, tokens)
+
+        # Keep circular references
+        if location in self._active:
+            ref_kept = self._get_ref(location)
+            if ref_kept not in self.circular:
+                self.circular.append(ref_kept)
+            return {"$ref": ref_kept}
+
+        if location not in self._resolved:
+            node = self._load(doc)
+            for token in tokens:
+                try:
+                    if isinstance(node, list):
+                        node = node[int(token)]
+                    else:
+                        node = node[token]
+                except (IndexError, KeyError, TypeError, ValueError) as exc:
+                    raise ValueError(
+                        f"reference '{ref}' in file '{doc}' could not be "
+                        "resolved"
+                    ) from exc
+            self._active.add(location)
+            try:
+                self._resolved[location] = self._intern(
+                    self._resolve_node(node, location)
+                )
+            finally:
+                self._active.discard(location)
+        return self._resolved[location]
+
+    def _load(self, doc: Path) -> Any:
+        """Load referenced document.
+
+        Args:
+            doc: Path of the document.
+
+        Returns:
+            Parsed document.
+
+        Raises:
+            OSError: Document cannot be read.
+            ValueError: Document cannot be parsed.
+        """
+        if doc not in self._docs:
+            try:
+                with open(doc, "rb") as doc_file:
+                    content = doc_file.read()
+            except OSError as exc:
+                raise OSError(f"file '{doc}' could not be read") from exc
+            try:
+                self._docs[doc] = yaml.load(content, Loader=SafeLoader)
+            except yaml.YAMLError as exc:
+                raise ValueError(
+                    f"file '{doc}' is not valid YAML"
+                ) from exc
+            self.files[str(doc)] = hashlib.sha256(content).hexdigest()
+        return self._docs[doc]
+
+    def _intern(self, node: Any) -> Any:
+        """Replace object with identical object seen before, if available.
+
+        Args:
+            node: Dereferenced object.
+
+        Returns:
+            `node` or identical object seen before.
+        """
+        if not isinstance(node, dict):
+            return node
+        key = json.dumps(node, sort_keys=True, default=str)
+        return self._interned.setdefault(key, node)
+
+    def _get_ref(self, location: _Location) -> str:
+        """Build reference to location.
+
+        Args:
+            location: Location of the referenced object.
+
+        Returns:
+            Reference relative to the specification if `location` is in the
+            specification, absolute ``file:`` URI otherwise.
+        """
+        fragment = "".join(
+            "/" + token.replace("~", "~0").replace("/", "~1")
+            for token in location[1]
+        )
+        if location[0] == self.path:
+            return f"#{fragment}"
+        return f"{location[0].as_uri()}#{fragment}"
@@ -0,0 +1,226 @@
+"""Entity tags and conditional requests."""
+
+from functools import wraps
+import logging
+from typing import Any, Callable, Optional
+
+from connexion.resolver import Resolution, Resolver
+from flask import Flask, g, request, Response
+from werkzeug.exceptions import PreconditionFailed
+
+# Get logger instance
+logger = logging.getLogger(__name__)
+
+# Operation Object field enabling/disabling entity tags
+ETAG_EXTENSION = "x-foca-etag"
+
+# Key of marker in `flask.Flask.extensions`
+_EXTENSION_KEY = "foca_etag"
+
+# Attribute of `flask.g` holding the entity tag set via `check_etag()`; set
+# to `None` for requests to operations with entity tags enabled
+_G_ATTRIBUTE = "_foca_etag"
+
+# Methods for which entity tags are added to responses
+_SAFE_METHODS = frozenset({"GET", "HEAD"})
+
+
+class _NotModified(Exception):
+    """Raised when the client's representation of a resource is current."""
+
+
+def check_etag(version: Any) -> None:
+    """Evaluate conditional request against the current version of the
+    requested resource.
+
+    To be called by controllers of operations with entity tags enabled, as
+    soon as the version of the requested resource is known (e.g., a revision
+    number or modification time stored alongside it). The string
+    representation of `version` is used as the entity tag of the response,
+    instead of a hash of the response body. For ``GET`` and ``HEAD``
+    requests, a ``304 Not Modified`` response is returned immediately if the
+    ``If-None-Match`` header matches, so that the resource need not be
+    loaded and serialized. For all other requests, the ``If-Match`` and
+    ``If-None-Match`` headers are evaluated to prevent lost updates.
+    ``If-None-Match`` headers are compared weakly, so that they also match
+    the weak entity tags of compressed responses (cf.
+    :py:func:`foca.api.compression.register_compression`), whereas
+    ``If-Match`` headers are compared strongly, as required for
+    preconditions of writes. Has no effect for operations with entity tags
+    disabled.
+
+    Args:
+        version: Current version of the requested resource, or ``None`` if
+            the resource does not exist.
+
+    Raises:
+        werkzeug.exceptions.PreconditionFailed: A write request's
+            ``If-Match`` header does not match `version`, or its
+            ``If-None-Match`` header does.
+
+    Example:
+
+        >>> def getPet(id):
+        ...     pet = pets.find_one({"id": id}, {"version": True})
+        ...     check_etag(pet["version"])
+        ...     return pets.find_one({"id": id}, {"_id": False})
+    """
+    if not hasattr(g, _G_ATTRIBUTE):
+        return
+    etag = None if version is None else str(version)
+    if request.method in _SAFE_METHODS:
+        setattr(g, _G_ATTRIBUTE, etag)
+        if etag is not None and request.if_none_match.contains_weak(etag):
+            raise _NotModified()
+        return
+    if request.if_match and (
+        etag is None or not request.if_match.contains(etag)
+    ):
+        raise PreconditionFailed("Resource was modified or does not exist.")
+    if etag is not None and request.if_none_match.contains_weak(etag):
+        raise PreconditionFailed("Resource exists.")
+
+
+def get_etag() -> Optional[str]:
+    """Get entity tag set via :py:func:`check_etag` for the current request.
+
+    Returns:
+        Entity tag, or ``None`` if it was not set or entity tags are disabled
+        for the requested operation.
+    """
+    return getattr(g, _G_ATTRIBUTE, None)
+
+
+def set_etag(etag: Optional[str]) -> None:
+    """Set entity tag of the current request, e.g., to the one recorded
+    alongside a cached response (cf.
+    :py:class:`foca.api.response_cache.CachingResolver`). Has no effect for
+    operations with entity tags disabled.
+
+    Args:
+        etag: Entity tag; if ``None``, the response is tagged with a hash of
+            its body.
+    """
+    if hasattr(g, _G_ATTRIBUTE):
+        setattr(g, _G_ATTRIBUTE, etag)
+
+
+class ETagResolver(Resolver):
+    """Resolve operations, wrapping the view functions of operations with
+    entity tags enabled.
+
+    Entity tags are enabled for all operations of a specification via
+    :py:attr:`foca.models.config.SpecConfig.etag` and can be enabled or
+    disabled for individual operations via the ``x-foca-etag`` field of the
+    Operation Object. Successful responses to ``GET`` and ``HEAD`` requests
+    to these operations are tagged with a hash of their body or, if set, the
+    version passed to :py:func:`check_etag`, and answered with ``304 Not
+    Modified`` if the ``If-None-Match`` header matches (cf.
+    :py:func:`register_etag_handler`).
+
+    Args:
+        enabled: Whether entity tags are enabled for operations without an
+            ``x-foca-etag`` field.
+        resolver: Resolver to which resolution of view functions is
+            delegated; defaults to Connexion's default resolver.
+
+    Attributes:
+        enabled: Whether entity tags are enabled for operations without an
+            ``x-foca-etag`` field.
+        resolver: Resolver to which resolution of view functions is
+            delegated.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        resolver: Optional[Resolver] = None,
+    ) -> None:
+        """Constructor method."""
+        super().__init__()
+        self.enabled: bool = enabled
+        self.resolver: Resolver = resolver or Resolver()
+
+    def resolve(self, operation) -> Resolution:
+        """Resolve operation.
+
+        Args:
+            operation: Connexion operation.
+
+        Returns:
+            Resolution of the operation.
+        """
+        resolution = self.resolver.resolve(operation)
+        if not operation._operation.get(ETAG_EXTENSION, self.enabled):
+            return resolution
+        logger.debug(f"Entity tags enabled for '{resolution.operation_id}'")
+        return Resolution(
+            _tag_view(resolution.function),
+            resolution.operation_id,
+        )
+
+
+def _tag_view(function: Callable) -> Callable:
+    """Wrap view function so that entity tags are added to its responses.
+
+    Args:
+        function: View function.
+
+    Returns:
+        Wrapped view function.
+    """
+    @wraps(function)
+    def wrapper(*args, **kwargs) -> Any:
+        setattr(g, _G_ATTRIBUTE, None)
+        try:
+            return function(*args, **kwargs)
+        except _NotModified:
+            response = Response(status=304)
+            response.set_etag(getattr(g, _G_ATTRIBUTE))
+            return response
+
+    return wrapper
+
+
+def register_etag_handler(app: Flask) -> Flask:
+    """Register handler adding entity tags to responses of operations with
+    entity tags enabled.
+
+    Args:
+        app: Flask application instance.
+
+    Returns:
+        Flask application instance with registered handler.
+    """
+    if _EXTENSION_KEY not in app.extensions:
+        app.after_request(_add_etag)
+        app.extensions[_EXTENSION_KEY] = True
+        logger.debug("Registered entity tag handler with Flask app.")
+    return app
+
+
+def _add_etag(response: Response) -> Response:
+    """Add entity tag to response and evaluate ``If-None-Match`` header.
+
+    Args:
+        response: Response to a request.
+
+    Returns:
+        Response with entity tag or ``304 Not Modified`` response.
+    """
+    if (
+        not hasattr(g, _G_ATTRIBUTE) or
+        request.method not in _SAFE_METHODS or
+        response.status_code != 200 or
+        response.is_streamed or
+        response.direct_passthrough
+    ):
+        return response
+    etag = getattr(g, _G_ATTRIBUTE)
+    if "ETag" not in response.headers:
+        if etag is None:
+            response.add_etag()
+        else:
+            response.set_etag(etag)
+    response.make_conditional(request)
+    return response
@@ -1,105 +1,400 @@
 """Register and modify OpenAPI specifications."""
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import hashlib
+import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict, List
+from tempfile import NamedTemporaryFile
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from connexion import App
+from connexion.resolver import Resolver
+import yaml
 
-from foca.models.config import SpecConfig
-from foca.config.config_parser import ConfigParser
+from foca.api.dereference_openapi import SpecDereferencer
+from foca.api.etag import ETagResolver, register_etag_handler
+from foca.api.response_cache import CachingResolver, get_response_cache
+from foca.api.spec_passes import (
+    apply_spec_passes,
+    get_spec_passes,
+    SpecPass,
+)
+from foca.api.validation import (
+    CompiledRequestBodyValidator,
+    CompiledResponseValidator,
+    SampledResponseValidator,
+)
+from foca.models.config import ResponseCacheConfig, SpecConfig
+from foca.config.config_parser import ConfigParser, SafeLoader
+from foca.utils.cache import LRUCache
+from foca.utils.db import register_page_token_secret
+from foca.version import __version__
+
+# Use libyaml-based dumper if available
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper  # type: ignore[assignment]
 
 # Get logger instance
 logger = logging.getLogger(__name__)
 
-# Path Item object fields which contain an Operation object (ie: HTTP verbs).
-# Reference: https://swagger.io/specification/v3/#path-item-object
-_OPERATION_OBJECT_FIELDS = frozenset({
-    "get", "put", "post", "delete", "options", "head", "patch", "trace",
-})
+# Prefix of first line of processed specification files, followed by the hash
+# of the inputs the specification was generated from
+_SPEC_HASH_PREFIX = "# foca-spec-hash: "
+
+# Prefix of optional second line of processed specification files, followed
+# by hashes of all files referenced from the specification, in JSON format
+_SPEC_REFS_PREFIX = "# foca-spec-refs: "
 
 
 def register_openapi(
         app: App,
         specs: List[SpecConfig],
+        workers: int = 1,
+        response_cache: Optional[ResponseCacheConfig] = None,
 ) -> App:
     """
     Register OpenAPI specifications with Connexion application instance.
 
+    Specifications are modified by the passes configured for each
+    specification, followed by any custom passes registered via
+    :py:func:`foca.api.spec_passes.register_spec_pass`. Specifications are
+    loaded and processed concurrently in a pool of `workers` processes, if
+    more than one worker is requested, and registered in the order in which
+    they are listed. Responses of operations with an ``x-foca-cache`` field
+    are cached (cf. :py:class:`foca.api.response_cache.CachingResolver`).
+    Entity tags are added to responses of operations for which they are
+    enabled (cf. :py:class:`foca.api.etag.ETagResolver`). Keys configured
+    for signing continuation tokens of paginated operations are registered
+    (cf. :py:func:`foca.utils.db.register_page_token_secret`). If processed
+    specifications cannot be written to their output paths, a warning is
+    logged and the specifications are registered nonetheless.
+
     Args:
         app: Connexion application instance.
         specs: Sequence of :py:class:`foca.models.config.SpecConfig` instances
             describing OpenAPI 2.x and/or 3.x specifications to be registered
             with `app`.
+        workers: Maximum number of processes used to load and process
+            specifications.
+        response_cache: Configuration of the response cache shared by all
+            specifications.
 
     Returns:
         Connexion application instance with registered OpenAPI specifications.
 
     Raises:
-        OSError: Modified specification cannot be written.
+        OSError: Specification cannot be read.
+        ValueError: Specification cannot be parsed or contains an invalid
+            ``x-foca-cache`` field, or the environment variable holding the
+            key for signing continuation tokens is not set.
         yaml.YAMLError: Modified specification cannot be serialized.
     """
-    # Iterate over OpenAPI specs
-    for spec in specs:
-
-        # Merge specs
-        list_specs = [spec.path] if isinstance(spec.path, Path) else spec.path
-        spec_parsed: Dict = ConfigParser.merge_yaml(*list_specs)
-        logger.debug(f"Parsed spec: {list_specs}")
-
-        # Add/replace root objects
-        if spec.append is not None:
-            for item in spec.append:
-                spec_parsed.update(item)
-            logger.debug(f"Appended spec: {spec.append}")
-
-        # Add/replace fields to Operation Objects
-        if spec.add_operation_fields is not None:
-            for key, val in spec.add_operation_fields.items():
-                for path_item_object in spec_parsed.get('paths', {}).values():
-                    for operation, operation_object in path_item_object.items():
-                        if operation not in _OPERATION_OBJECT_FIELDS:
-                            continue
-                        operation_object[key] = val
-            logger.debug(
-                f"Added operation fields: {spec.add_operation_fields}"
-            )
+    # Load OpenAPI specs
+    passes = [get_spec_passes(spec) for spec in specs]
+    if workers > 1 and len(specs) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(specs)),
+        ) as executor:
+            loaded = list(executor.map(_load_spec, specs, passes))
+        logger.debug(f"Loaded specs in {min(workers, len(specs))} processes")
+    else:
+        loaded = [
+            _load_spec(spec, spec_passes)
+            for spec, spec_passes in zip(specs, passes)
+        ]
 
-        # Add fields to security definitions/schemes
-        if not spec.disable_auth and spec.add_security_fields is not None:
-            for key, val in spec.add_security_fields.items():
-                # OpenAPI 2
-                sec_defs = spec_parsed.get('securityDefinitions', {})
-                for sec_def in sec_defs.values():
-                    sec_def[key] = val
-                # OpenAPI 3
-                sec_schemes = spec_parsed.get(
-                    'components', {'securitySchemes': {}}
-                ).get('securitySchemes', {})  # type: ignore
-                for sec_scheme in sec_schemes.values():
-                    sec_scheme[key] = val
-            logger.debug(f"Added security fields: {spec.add_security_fields}")
-
-        # Remove security definitions/schemes and fields
-        elif spec.disable_auth:
-            # Open API 2
-            spec_parsed.pop('securityDefinitions', None)
-            # Open API 3
-            spec_parsed.get('components', {}).pop('securitySchemes', None)
-            # Open API 2/3
-            spec_parsed.pop('security', None)
-            for path_item_object in spec_parsed.get('paths', {}).values():
-                for operation_object in path_item_object.values():
-                    operation_object.pop('security', None)
-            logger.debug("Removed security fields")
+    cache = get_response_cache(app.app, response_cache)
+    register_etag_handler(app.app)
+
+    # Iterate over OpenAPI specs
+    for spec, (spec_parsed, spec_hash, cached, refs) in zip(specs, loaded):
 
         # Attach specs to connexion App
         logger.debug(f"Modified specs: {spec_parsed}")
         spec.connexion = {} if spec.connexion is None else spec.connexion
-        app.add_api(
+        api = app.add_api(
             specification=spec_parsed,
-            **spec.model_dump().get('connexion', {}),
+            **_get_connexion_kwargs(spec, cache=cache),
         )
+        if spec.pagination is not None:
+            register_page_token_secret(
+                app=app.app,
+                blueprint=api.blueprint.name,
+                secret=spec.pagination.secret,
+                secret_env=spec.pagination.secret_env,
+            )
+
+        # Write processed specs only once they were successfully validated
+        if not cached:
+            _write_processed_spec(spec, spec_hash, spec_parsed, refs)
         logger.info(f"API endpoints added from spec: {spec.path_out}")
 
     return app
+
+
+def _get_connexion_kwargs(
+    spec: SpecConfig,
+    cache: Optional[LRUCache] = None,
+) -> Dict:
+    """Get keyword arguments for registering specification with Connexion.
+
+    Args:
+        spec: :py:class:`foca.models.config.SpecConfig` instance describing
+            the OpenAPI 2.x or 3.x specification to be registered.
+        cache: Cache for responses of operations with an ``x-foca-cache``
+            field.
+
+    Returns:
+        Keyword arguments for `connexion.apps.flask_app.add_api()`.
+    """
+    kwargs: Dict = spec.model_dump().get('connexion') or {}
+    validator_map: Dict = dict(kwargs.get('validator_map') or {})
+    if spec.compiled_validation:
+        validator_map['body'] = CompiledRequestBodyValidator
+        validator_map['response'] = CompiledResponseValidator
+    if spec.response_validation is not None:
+        kwargs['validate_responses'] = True
+        validator_map['response'] = partial(
+            SampledResponseValidator,
+            sample_rate=spec.response_validation.sample_rate,
+            fail=spec.response_validation.fail,
+            compiled=spec.compiled_validation,
+        )
+    if validator_map:
+        kwargs['validator_map'] = validator_map
+    resolver = kwargs.get('resolver')
+    if resolver is not None and not isinstance(resolver, Resolver):
+        resolver = Resolver(resolver)
+    if cache is not None:
+        resolver = CachingResolver(cache=cache, resolver=resolver)
+    kwargs['resolver'] = ETagResolver(enabled=spec.etag, resolver=resolver)
+    return kwargs
+
+
+def _load_spec(
+    spec: SpecConfig,
+    passes: Sequence[SpecPass],
+) -> Tuple[Dict, str, bool, Dict[str, str]]:
+    """Load processed specification from previous run or process
+    specification.
+
+    Args:
+        spec: :py:class:`foca.models.config.SpecConfig` instance describing
+            the OpenAPI 2.x or 3.x specification to be processed.
+        passes: Passes to be applied to the specification, in order.
+
+    Returns:
+        Tuple of processed specification, hash of its inputs, whether it was
+        loaded from a previous run and, if dereferenced, dictionary of paths
+        of referenced files and hexadecimal SHA-256 digests of their
+        contents.
+    """
+    spec_hash = _get_spec_hash(spec, passes)
+    spec_parsed = _load_processed_spec(spec, spec_hash)
+    if spec_parsed is not None:
+        return spec_parsed, spec_hash, True, {}
+
+    spec_parsed = _process_spec(spec, passes)
+    refs: Dict[str, str] = {}
+
+    # Dereference specs
+    if spec.dereference:
+        dereferencer = SpecDereferencer(path=_get_spec_paths(spec)[0])
+        spec_parsed = dereferencer.dereference(spec_parsed)
+        refs = dereferencer.files
+        logger.debug(f"Dereferenced spec: {spec_parsed}")
+
+    return spec_parsed, spec_hash, False, refs
+
+
+def _process_spec(spec: SpecConfig, passes: Sequence[SpecPass]) -> Dict:
+    """Parse, merge and modify OpenAPI specification.
+
+    Args:
+        spec: :py:class:`foca.models.config.SpecConfig` instance describing
+            the OpenAPI 2.x or 3.x specification to be processed.
+        passes: Passes to be applied to the specification, in order.
+
+    Returns:
+        Processed specification.
+    """
+    # Merge specs
+    list_specs = _get_spec_paths(spec)
+    spec_parsed: Dict = ConfigParser.merge_yaml(*list_specs)
+    logger.debug(f"Parsed spec: {list_specs}")
+
+    # Modify specs
+    return apply_spec_passes(spec_parsed, passes)
+
+
+def _get_spec_paths(spec: SpecConfig) -> List[Path]:
+    """Get paths of specification files.
+
+    Args:
+        spec: :py:class:`foca.models.config.SpecConfig` instance describing
+            the OpenAPI 2.x or 3.x specification to be processed.
+
+    Returns:
+        List of paths of specification files.
+    """
+    return [spec.path] if isinstance(spec.path, Path) else spec.path
+
+
+def _get_spec_hash(spec: SpecConfig, passes: Sequence[SpecPass]) -> str:
+    """Compute hash of all inputs determining a processed specification.
+
+    The hash covers the FOCA version, the contents (but not the locations)
+    of all specification files, in order, and all passes and settings that
+    modify the specification.
+
+    Args:
+        spec: :py:class:`foca.models.config.SpecConfig` instance describing
+            the OpenAPI 2.x or 3.x specification to be processed.
+        passes: Passes to be applied to the specification, in order.
+
+    Returns:
+        Hexadecimal SHA-256 digest.
+
+    Raises:
+        OSError: Specification cannot be read.
+    """
+    digest = hashlib.sha256(__version__.encode())
+    list_specs = _get_spec_paths(spec)
+    for path in list_specs:
+        try:
+            with open(path, "rb") as spec_file:
+                digest.update(hashlib.sha256(spec_file.read()).digest())
+        except OSError as exc:
+            raise OSError(f"file '{path}' could not be read") from exc
+    settings = {
+        "passes": [
+            [spec_pass.name, spec_pass.get_cache_key()] for spec_pass in passes
+        ],
+        "dereference": spec.dereference,
+    }
+    digest.update(
+        json.dumps(settings, sort_keys=True, default=_get_json_key).encode()
+    )
+    return digest.hexdigest()
+
+
+def _get_json_key(obj: Any) -> str:
+    """Get stable representation of object that is not JSON-serializable.
+
+    Args:
+        obj: Object to be represented.
+
+    Returns:
+        Qualified name for classes and functions, representation of the
+        object otherwise.
+    """
+    if hasattr(obj, "__module__") and hasattr(obj, "__qualname__"):
+        return f"{obj.__module__}.{obj.__qualname__}"
+    return repr(obj)
+
+
+def _load_processed_spec(spec: SpecConfig, spec_hash: str) -> Optional[Dict]:
+    """Load processed specification written by a previous run.
+
+    Args:
+        spec: :py:class:`foca.models.config.SpecConfig` instance describing
+            the OpenAPI 2.x or 3.x specification to be processed.
+        spec_hash: Hash of the inputs of the processed specification, as
+            returned by :py:func:`_get_spec_hash`.
+
+    Returns:
+        Processed specification or ``None`` if no processed specification is
+        available at ``spec.path_out`` or if it was generated from different
+        inputs, including referenced files.
+    """
+    if spec.path_out is None:
+        return None
+    try:
+        with open(spec.path_out) as spec_file:
+            if spec_file.readline().rstrip("\n") != (
+                f"{_SPEC_HASH_PREFIX}{spec_hash}"
+            ):
+                return None
+            content = spec_file.read()
+        if content.startswith(_SPEC_REFS_PREFIX):
+            refs = json.loads(
+                content[len(_SPEC_REFS_PREFIX):content.index("\n")]
+            )
+            for path, ref_hash in refs.items():
+                with open(path, "rb") as ref_file:
+                    if hashlib.sha256(ref_file.read()).hexdigest() != ref_hash:
+                        return None
+        spec_parsed = yaml.load(content, Loader=SafeLoader)
+    except (OSError, UnicodeDecodeError, ValueError, yaml.YAMLError):
+        return None
+    if not isinstance(spec_parsed, dict):
+        return None
+    logger.debug(f"Loaded processed spec: {spec.path_out}")
+    return spec_parsed
+
+
+def _write_processed_spec(
+    spec: SpecConfig,
+    spec_hash: str,
+    spec_parsed: Dict,
+    refs: Optional[Dict[str, str]] = None,
+) -> None:
+    """Write processed specification, together with the hash of its inputs.
+
+    The file is written atomically, so that concurrently starting workers
+    never read partially written files. If the file cannot be written, e.g.,
+    because its directory is not writable, a warning is logged, as the
+    processed specification is only cached for faster startup.
+
+    Args:
+        spec: :py:class:`foca.models.config.SpecConfig` instance describing
+            the OpenAPI 2.x or 3.x specification to be processed.
+        spec_hash: Hash of the inputs of the processed specification, as
+            returned by :py:func:`_get_spec_hash`.
+        spec_parsed: Processed specification.
+        refs: Dictionary of paths of files referenced from the specification
+            and hexadecimal SHA-256 digests of their contents.
+
+    Raises:
+        yaml.YAMLError: Modified specification cannot be serialized.
+    """
+    if spec.path_out is None:
+        return
+    try:
+        content = yaml.dump(spec_parsed, Dumper=SafeDumper)
+    except yaml.YAMLError as exc:
+        raise yaml.YAMLError(
+            f"modified specification '{spec.path_out}' could not be "
+            "serialized"
+        ) from exc
+    tmp_path = None
+    try:
+        with NamedTemporaryFile(
+            "w",
+            dir=spec.path_out.parent,
+            prefix=f".{spec.path_out.name}.",
+            delete=False,
+        ) as tmp_file:
+            tmp_path = tmp_file.name
+            tmp_file.write(f"{_SPEC_HASH_PREFIX}{spec_hash}\n")
+            if refs:
+                tmp_file.write(
+                    f"{_SPEC_REFS_PREFIX}{json.dumps(refs, sort_keys=True)}\n"
+                )
+            tmp_file.write(content)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, spec.path_out)
+    except OSError as exc:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        logger.warning(
+            f"Modified specification could not be written to file "
+            f"'{spec.path_out}': {exc}"
+        )
+        return
+    logger.debug(f"Wrote processed spec: {spec.path_out}")
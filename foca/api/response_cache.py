@@ -0,0 +1,330 @@
+"""Declarative in-memory caching of API responses."""
+
+from collections.abc import Iterator
+from copy import deepcopy
+from functools import wraps
+import json
+import logging
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from connexion import context
+from connexion.lifecycle import ConnexionResponse
+from connexion.resolver import Resolution, Resolver
+from flask import current_app, Flask, request
+from pydantic import ValidationError
+from werkzeug.wrappers import Response
+
+from foca.api.etag import get_etag, set_etag
+from foca.models.config import OperationCacheConfig, ResponseCacheConfig
+from foca.security.access_control.constants import ACCESS_CONTROL_ATTRIBUTE
+from foca.utils.cache import LRUCache
+from foca.utils.metrics import metrics
+
+# Get logger instance
+logger = logging.getLogger(__name__)
+
+# Operation Object field enabling caching of responses
+CACHE_EXTENSION = "x-foca-cache"
+
+# Name of counter of cache hits and misses
+METRIC_RESPONSE_CACHE = "foca_response_cache_total"
+
+# Key of response cache in `flask.Flask.extensions`
+_EXTENSION_KEY = "foca_response_cache"
+
+# Sentinel for cache misses
+_MISSING = object()
+
+
+def get_response_cache(
+    app: Flask,
+    conf: Optional[ResponseCacheConfig] = None,
+) -> LRUCache:
+    """Get response cache of app, creating it if necessary.
+
+    Args:
+        app: Flask application instance.
+        conf: Configuration of the cache; only used if the cache is created.
+
+    Returns:
+        Response cache shared by all operations of the app.
+    """
+    if _EXTENSION_KEY not in app.extensions:
+        conf = conf or ResponseCacheConfig()
+        app.extensions[_EXTENSION_KEY] = LRUCache(
+            max_entries=conf.max_entries,
+            ttl=conf.ttl,
+        )
+    return app.extensions[_EXTENSION_KEY]
+
+
+def invalidate_response_cache(
+    *tags: str,
+    operation_id: Optional[str] = None,
+) -> int:
+    """Remove cached responses of the current app.
+
+    To be called by controllers that modify resources whose representations
+    may be cached. If neither tags nor an operation identifier are given,
+    all responses are removed.
+
+    Args:
+        *tags: Responses with any of these tags are removed (cf.
+            :py:class:`foca.models.config.OperationCacheConfig`).
+        operation_id: Responses of the operation with this identifier are
+            removed, e.g., ``controllers.listPets``.
+
+    Returns:
+        Number of removed responses.
+
+    Example:
+
+        >>> def addPet(pet):
+        ...     pets.insert_one(pet)
+        ...     invalidate_response_cache("pets")
+        ...     return pet
+    """
+    cache = get_response_cache(current_app)
+    if not tags and operation_id is None:
+        count = len(cache)
+        cache.clear()
+    else:
+        if operation_id is not None:
+            tags = (*tags, operation_id)
+        count = cache.invalidate(tags=tags)
+    logger.debug(f"Removed {count} cached responses")
+    return count
+
+
+class CachingResolver(Resolver):
+    """Resolve operations, wrapping the view functions of operations with an
+    ``x-foca-cache`` field so that their responses are cached.
+
+    Only ``GET`` operations are cached; the field is ignored for other
+    operations. Cache keys are built from the operation identifier, the
+    request path and query, the values of the request headers listed in
+    ``vary`` and the values of the token claims listed in ``claims`` (cf.
+    :py:class:`foca.models.config.OperationCacheConfig`). If no claims are
+    listed, responses to authenticated requests are cached per caller, as
+    identified by the subject of their token, so that responses are not
+    served to other callers; as cached responses skip the view function,
+    access checks of the view function, e.g., via ``check_permissions()``
+    (cf. :py:mod:`foca.security.access_control.register_access_control`),
+    are not repeated for cache hits. Only successful
+    responses are cached; responses returned as response objects or
+    iterators (e.g., streamed responses) are not cached. Responses are
+    copied when cached and when served from the cache, so that changes to
+    returned objects do not affect cached responses. Cached responses skip
+    the view function, but are still serialized and, if configured,
+    validated by Connexion. Entity tags set by the view function via
+    :py:func:`foca.api.etag.check_etag` are cached alongside the response
+    and set again for cached responses.
+
+    Args:
+        cache: Response cache.
+        resolver: Resolver to which resolution of view functions is
+            delegated; defaults to Connexion's default resolver.
+
+    Attributes:
+        cache: Response cache.
+        resolver: Resolver to which resolution of view functions is
+            delegated.
+    """
+
+    def __init__(
+        self,
+        cache: LRUCache,
+        resolver: Optional[Resolver] = None,
+    ) -> None:
+        """Constructor method."""
+        super().__init__()
+        self.cache: LRUCache = cache
+        self.resolver: Resolver = resolver or Resolver()
+
+    def resolve(self, operation) -> Resolution:
+        """Resolve operation.
+
+        Args:
+            operation: Connexion operation.
+
+        Returns:
+            Resolution of the operation.
+
+        Raises:
+            ValueError: The ``x-foca-cache`` field of the operation is
+                invalid.
+        """
+        resolution = self.resolver.resolve(operation)
+        settings = operation._operation.get(CACHE_EXTENSION)
+        if settings in (None, False):
+            return resolution
+        if operation.method.lower() != "get":
+            logger.warning(
+                f"Field '{CACHE_EXTENSION}' ignored for operation "
+                f"'{resolution.operation_id}': only GET operations are cached"
+            )
+            return resolution
+        if settings is True:
+            settings = {}
+        elif isinstance(settings, (int, float)):
+            settings = {"ttl": settings}
+        try:
+            conf = OperationCacheConfig(**settings)
+        except (TypeError, ValidationError) as exc:
+            raise ValueError(
+                f"Invalid field '{CACHE_EXTENSION}' of operation "
+                f"'{resolution.operation_id}': {exc}"
+            ) from exc
+        if (
+            getattr(resolution.function, ACCESS_CONTROL_ATTRIBUTE, False)
+            and not conf.claims
+            and not conf.vary
+        ):
+            logger.warning(
+                f"Responses of '{resolution.operation_id}' are cached, but "
+                "access to it is checked by the view function, which is "
+                "skipped for cached responses: unless requests are "
+                "authenticated with tokens, responses may be served to "
+                f"callers without access. List the claims or request "
+                f"headers identifying callers in field '{CACHE_EXTENSION}'."
+            )
+        logger.debug(f"Responses of '{resolution.operation_id}' are cached")
+        function = self._cache_view(
+            function=resolution.function,
+            operation_id=resolution.operation_id,
+            conf=conf,
+        )
+        return Resolution(function, resolution.operation_id)
+
+    def _cache_view(
+        self,
+        function: Callable,
+        operation_id: str,
+        conf: OperationCacheConfig,
+    ) -> Callable:
+        """Wrap view function so that its return values are cached.
+
+        Args:
+            function: View function.
+            operation_id: Identifier of the operation.
+            conf: Cache configuration of the operation.
+
+        Returns:
+            Wrapped view function.
+        """
+        tags = (operation_id, *conf.tags)
+
+        @wraps(function)
+        def wrapper(*args, **kwargs) -> Any:
+            key = _get_cache_key(operation_id, conf)
+            entry = self.cache.get(key, _MISSING)
+            if entry is not _MISSING:
+                metrics.increment(
+                    METRIC_RESPONSE_CACHE,
+                    operation_id=operation_id,
+                    result="hit",
+                )
+                result, etag = entry
+                set_etag(etag)
+                return deepcopy(result)
+            metrics.increment(
+                METRIC_RESPONSE_CACHE,
+                operation_id=operation_id,
+                result="miss",
+            )
+            result = function(*args, **kwargs)
+            if _is_cacheable(result):
+                try:
+                    value = deepcopy(result)
+                except TypeError as exc:
+                    logger.debug(
+                        f"Response of '{operation_id}' not cached: {exc}"
+                    )
+                    return result
+                self.cache.set(
+                    key,
+                    (value, get_etag()),
+                    ttl=conf.ttl,
+                    tags=tags,
+                )
+            return result
+
+        return wrapper
+
+
+def _get_cache_key(
+    operation_id: str,
+    conf: OperationCacheConfig,
+) -> Tuple[Hashable, ...]:
+    """Build cache key for current request.
+
+    Args:
+        operation_id: Identifier of the operation.
+        conf: Cache configuration of the operation.
+
+    Returns:
+        Cache key.
+    """
+    query = tuple(sorted(request.args.items(multi=True)))
+    headers = tuple(request.headers.get(name) for name in conf.vary)
+    token_info = _get_token_info()
+    claims: Tuple[Any, ...] = ()
+    if conf.claims:
+        claims = tuple(str(token_info.get(name)) for name in conf.claims)
+    elif token_info:
+        claims = (_get_identity(token_info),)
+    return (operation_id, request.path, query, headers, claims)
+
+
+def _get_identity(token_info: Dict) -> str:
+    """Get identity of caller from token claims.
+
+    Args:
+        token_info: Token claims.
+
+    Returns:
+        Subject of the token, as set by Connexion; all claims, if the token
+        has no subject.
+    """
+    identity = token_info.get("sub", token_info.get("uid"))
+    if identity is None:
+        return json.dumps(token_info, sort_keys=True, default=str)
+    return str(identity)
+
+
+def _get_token_info() -> Dict:
+    """Get claims of token validated for current request.
+
+    Returns:
+        Token claims; empty if the request was not authenticated.
+    """
+    try:
+        token_info = context.get("token_info") or {}
+    except (AttributeError, RuntimeError):
+        return {}
+    # Token info returned by `foca.security.auth.validate_token()`
+    return token_info.get("claims", token_info)
+
+
+def _is_cacheable(result: Any) -> bool:
+    """Check whether return value of view function can be cached.
+
+    Args:
+        result: Return value of view function.
+
+    Returns:
+        Whether `result` is a response body, optionally with a successful
+        status code and headers; iterators, such as generators and database
+        cursors, are consumed when the response is sent and are therefore
+        not cacheable.
+    """
+    if isinstance(result, (Response, ConnexionResponse)):
+        return False
+    body = result[0] if isinstance(result, tuple) and result else result
+    if isinstance(body, Iterator):
+        return False
+    if isinstance(result, tuple) and len(result) > 1:
+        status_code = result[1]
+        if isinstance(status_code, int):
+            return 200 <= status_code < 300
+    return True
@@ -0,0 +1,390 @@
+"""Transformation passes applied to OpenAPI specifications."""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from foca.models.config import PaginationConfig, SpecConfig
+from foca.utils.db import (
+    NEXT_PAGE_TOKEN_HEADER,
+    PAGE_LIMIT_PARAMETER,
+    PAGE_TOKEN_PARAMETER,
+)
+
+# Get logger instance
+logger = logging.getLogger(__name__)
+
+# Path Item object fields which contain an Operation object (ie: HTTP verbs).
+# Reference: https://swagger.io/specification/v3/#path-item-object
+OPERATION_OBJECT_FIELDS = frozenset({
+    "get", "put", "post", "delete", "options", "head", "patch", "trace",
+})
+
+# Operation Object field enabling injection of pagination parameters
+PAGINATE_EXTENSION = "x-foca-paginate"
+
+# Custom passes applied to all specifications, in order of registration
+_custom_passes: List["SpecPass"] = []
+
+
+class SpecPass():
+    """Base class for transformation passes applied to OpenAPI
+    specifications.
+
+    All passes applied to a specification are run in a single walk over the
+    specification: first, :py:meth:`visit_root` is called for each pass;
+    then, for each Path Item Object, :py:meth:`visit_path_item` is called
+    for each pass, followed by :py:meth:`visit_operation` for each of its
+    Operation Objects and each pass. Objects are modified in place.
+
+    Passes are part of the key of processed specifications (cf.
+    :py:attr:`foca.models.config.SpecConfig.path_out`): the processed
+    specification is regenerated whenever the name of a pass or the value
+    returned by :py:meth:`get_cache_key` changes. Passes must be picklable
+    if specifications are processed concurrently (cf.
+    :py:attr:`foca.models.config.APIConfig.workers`).
+
+    Example:
+
+        >>> class TimeoutPass(SpecPass):
+        ...     def __init__(self, timeout):
+        ...         self.timeout = timeout
+        ...     def visit_operation(self, path, method, operation):
+        ...         operation.setdefault("x-timeout", self.timeout)
+        >>> spec = {"paths": {"/pets": {"get": {}}}}
+        >>> apply_spec_passes(spec, [TimeoutPass(timeout=30)])
+        {'paths': {'/pets': {'get': {'x-timeout': 30}}}}
+    """
+
+    @property
+    def name(self) -> str:
+        """Name of the pass, used in logs and in the key of processed
+        specifications.
+        """
+        return f"{type(self).__module__}.{type(self).__qualname__}"
+
+    def get_cache_key(self) -> Any:
+        """Get settings of the pass that determine its output.
+
+        Returns:
+            JSON-serializable representation of the settings of the pass;
+            by default, the instance attributes.
+        """
+        return vars(self)
+
+    def visit_root(self, spec: Dict) -> None:
+        """Visit root of specification.
+
+        Args:
+            spec: Specification.
+        """
+
+    def visit_path_item(self, path: str, path_item: Dict) -> None:
+        """Visit Path Item Object.
+
+        Args:
+            path: Path of the Path Item Object.
+            path_item: Path Item Object.
+        """
+
+    def visit_operation(
+        self,
+        path: str,
+        method: str,
+        operation: Dict,
+    ) -> None:
+        """Visit Operation Object.
+
+        Args:
+            path: Path of the Path Item Object containing the operation.
+            method: HTTP method of the operation.
+            operation: Operation Object.
+        """
+
+
+class AppendPass(SpecPass):
+    """Add/replace fields in the root of specifications.
+
+    Args:
+        append: List of dictionaries of fields to be added/replaced, in
+            order.
+
+    Attributes:
+        append: List of dictionaries of fields to be added/replaced, in
+            order.
+    """
+
+    def __init__(self, append: List[Dict]) -> None:
+        """Constructor method."""
+        self.append: List[Dict] = append
+
+    def visit_root(self, spec: Dict) -> None:
+        """Add/replace root fields."""
+        for item in self.append:
+            spec.update(item)
+        logger.debug(f"Appended spec: {self.append}")
+
+
+class OperationFieldsPass(SpecPass):
+    """Add/replace fields in Operation Objects.
+
+    Args:
+        fields: Fields to be added/replaced.
+
+    Attributes:
+        fields: Fields to be added/replaced.
+    """
+
+    def __init__(self, fields: Dict) -> None:
+        """Constructor method."""
+        self.fields: Dict = fields
+
+    def visit_operation(
+        self,
+        path: str,
+        method: str,
+        operation: Dict,
+    ) -> None:
+        """Add/replace operation fields."""
+        operation.update(self.fields)
+
+
+class SecurityFieldsPass(SpecPass):
+    """Add/replace fields in security definitions (OpenAPI 2.x) or schemes
+    (OpenAPI 3.x).
+
+    Args:
+        fields: Fields to be added/replaced.
+
+    Attributes:
+        fields: Fields to be added/replaced.
+    """
+
+    def __init__(self, fields: Dict) -> None:
+        """Constructor method."""
+        self.fields: Dict = fields
+
+    def visit_root(self, spec: Dict) -> None:
+        """Add/replace fields in security definitions/schemes."""
+        # OpenAPI 2
+        sec_defs = spec.get('securityDefinitions', {})
+        # OpenAPI 3
+        sec_schemes = spec.get(
+            'components', {'securitySchemes': {}}
+        ).get('securitySchemes', {})
+        for sec_def in [*sec_defs.values(), *sec_schemes.values()]:
+            sec_def.update(self.fields)
+        logger.debug(f"Added security fields: {self.fields}")
+
+
+class DisableAuthPass(SpecPass):
+    """Remove security definitions/schemes and requirements."""
+
+    def visit_root(self, spec: Dict) -> None:
+        """Remove security definitions/schemes and global requirements."""
+        # Open API 2
+        spec.pop('securityDefinitions', None)
+        # Open API 3
+        spec.get('components', {}).pop('securitySchemes', None)
+        # Open API 2/3
+        spec.pop('security', None)
+        logger.debug("Removed security fields")
+
+    def visit_operation(
+        self,
+        path: str,
+        method: str,
+        operation: Dict,
+    ) -> None:
+        """Remove security requirements of operation."""
+        operation.pop('security', None)
+
+
+class PaginationPass(SpecPass):
+    """Add keyset pagination parameters and headers to operations with a
+    truthy ``x-foca-paginate`` field.
+
+    The query parameters ``limit`` and ``page_token`` are added to the
+    operation, unless defined for the operation or its path, and the
+    ``X-Next-Page-Token`` header is added to its successful responses,
+    unless already defined, cf.
+    :py:func:`foca.utils.db.paginate`.
+
+    Args:
+        conf: Pagination configuration.
+
+    Attributes:
+        conf: Pagination configuration.
+    """
+
+    def __init__(self, conf: PaginationConfig) -> None:
+        """Constructor method."""
+        self.conf: PaginationConfig = conf
+        self._openapi_3: bool = True
+        self._path_parameters: Set[Tuple[Any, Any]] = set()
+
+    def get_cache_key(self) -> Any:
+        """Get pagination settings affecting the specification."""
+        return self.conf.model_dump(include={"default_limit", "max_limit"})
+
+    def visit_root(self, spec: Dict) -> None:
+        """Determine version of specification."""
+        self._openapi_3 = "swagger" not in spec
+
+    def visit_path_item(self, path: str, path_item: Dict) -> None:
+        """Collect parameters shared by all operations of path."""
+        self._path_parameters = _get_parameter_keys(
+            path_item.get('parameters', [])
+        )
+
+    def visit_operation(
+        self,
+        path: str,
+        method: str,
+        operation: Dict,
+    ) -> None:
+        """Add pagination parameters and headers to operation."""
+        if not operation.get(PAGINATE_EXTENSION):
+            return
+        parameters = operation.setdefault('parameters', [])
+        defined = self._path_parameters | _get_parameter_keys(parameters)
+        for name, schema, description in (
+            (
+                PAGE_LIMIT_PARAMETER,
+                {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": self.conf.max_limit,
+                    "default": self.conf.default_limit,
+                },
+                "Maximum number of items to return.",
+            ),
+            (
+                PAGE_TOKEN_PARAMETER,
+                {"type": "string"},
+                "Continuation token returned in the "
+                f"'{NEXT_PAGE_TOKEN_HEADER}' header of the previous page.",
+            ),
+        ):
+            if (name, "query") not in defined:
+                parameters.append(self._get_object(
+                    schema,
+                    description,
+                    name=name,
+                    required=False,
+                    **{"in": "query"},
+                ))
+        for status, response in operation.get('responses', {}).items():
+            if not str(status).startswith("2") or '$ref' in response:
+                continue
+            response.setdefault('headers', {}).setdefault(
+                NEXT_PAGE_TOKEN_HEADER,
+                self._get_object(
+                    {"type": "string"},
+                    "Continuation token for requesting the next page; "
+                    "absent on the last page.",
+                ),
+            )
+        logger.debug(f"Added pagination parameters: {method.upper()} {path}")
+
+    def _get_object(self, schema: Dict, description: str, **fields) -> Dict:
+        """Create Parameter or Header Object for version of specification.
+
+        Args:
+            schema: Schema of the value.
+            description: Description of the value.
+            **fields: Additional fields.
+
+        Returns:
+            Parameter or Header Object.
+        """
+        if self._openapi_3:
+            return {**fields, "description": description, "schema": schema}
+        return {**fields, "description": description, **schema}
+
+
+def _get_parameter_keys(parameters: List[Dict]) -> Set[Tuple[Any, Any]]:
+    """Get names and locations of parameters.
+
+    Args:
+        parameters: Parameter Objects.
+
+    Returns:
+        Set of tuples of name and location of each parameter.
+    """
+    return {(param.get('name'), param.get('in')) for param in parameters}
+
+
+def register_spec_pass(spec_pass: SpecPass) -> None:
+    """Register custom pass to be applied to all OpenAPI specifications.
+
+    Custom passes are applied after the built-in passes configured via
+    :py:class:`foca.models.config.SpecConfig`, in order of registration.
+    Passes need to be registered before the app is created.
+
+    Args:
+        spec_pass: Pass to be applied.
+    """
+    _custom_passes.append(spec_pass)
+    logger.debug(f"Registered spec pass: {spec_pass.name}")
+
+
+def get_spec_passes(
+    spec: SpecConfig,
+    custom_passes: Optional[Sequence[SpecPass]] = None,
+) -> List[SpecPass]:
+    """Get passes to be applied to an OpenAPI specification.
+
+    Args:
+        spec: :py:class:`foca.models.config.SpecConfig` instance describing
+            the OpenAPI 2.x or 3.x specification to be processed.
+        custom_passes: Custom passes to be applied after the built-in passes.
+            If ``None``, all passes registered via
+            :py:func:`register_spec_pass` are applied.
+
+    Returns:
+        List of passes, in the order in which they are applied.
+    """
+    passes: List[SpecPass] = []
+    if spec.append is not None:
+        passes.append(AppendPass(append=spec.append))
+    if spec.add_operation_fields is not None:
+        passes.append(OperationFieldsPass(fields=spec.add_operation_fields))
+    if spec.pagination is not None:
+        passes.append(PaginationPass(conf=spec.pagination))
+    if spec.disable_auth:
+        passes.append(DisableAuthPass())
+    elif spec.add_security_fields is not None:
+        passes.append(SecurityFieldsPass(fields=spec.add_security_fields))
+    passes.extend(_custom_passes if custom_passes is None else custom_passes)
+    return passes
+
+
+def apply_spec_passes(spec: Dict, passes: Sequence[SpecPass]) -> Dict:
+    """Apply passes to an OpenAPI specification in a single walk.
+
+    Args:
+        spec: Specification to be modified in place.
+        passes: Passes to be applied, in order.
+
+    Returns:
+        Modified specification.
+    """
+    if not passes:
+        return spec
+    for spec_pass in passes:
+        spec_pass.visit_root(spec)
+    for path, path_item in (spec.get('paths') or {}).items():
+        if not isinstance(path_item, dict):
+            continue
+        for spec_pass in passes:
+            spec_pass.visit_path_item(path, path_item)
+        for method, operation in path_item.items():
+            if (
+                method not in OPERATION_OBJECT_FIELDS or
+                not isinstance(operation, dict)
+            ):
+                continue
+            for spec_pass in passes:
+                spec_pass.visit_operation(path, method, operation)
+    logger.debug(f"Applied spec passes: {[p.name for p in passes]}")
+    return spec
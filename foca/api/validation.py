@@ -0,0 +1,416 @@
+"""Validation of API requests and responses."""
+
+import json
+import logging
+from random import random
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from connexion.decorators.response import ResponseValidator
+from connexion.decorators.validation import RequestBodyValidator
+from connexion.exceptions import (
+    NonConformingResponseBody,
+    NonConformingResponseHeaders,
+)
+from connexion.json_schema import (
+    Draft4RequestValidator,
+    Draft4ResponseValidator,
+)
+from jsonschema import draft4_format_checker, ValidationError
+
+from foca.utils.metrics import metrics
+
+# Use code-generating JSON schema validator if available
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover
+    fastjsonschema = None
+
+# Get logger instance
+logger = logging.getLogger(__name__)
+
+# Operation Object field overriding the configured sample rate
+SAMPLE_RATE_EXTENSION = "x-foca-response-validation-sample-rate"
+
+# Name of counter of validated, skipped and invalid responses
+METRIC_RESPONSE_VALIDATION = "foca_response_validation_total"
+
+# Schema keywords with OpenAPI-specific semantics that are implemented by
+# Connexion's validators, but not by generic JSON schema validators
+_OPENAPI_KEYWORDS = (
+    '"nullable"', '"x-nullable"', '"readOnly"', '"writeOnly"',
+    '"x-writeOnly"', '"$ref"',
+)
+
+# Schema keywords that compiled validators evaluate differently from
+# `jsonschema`; unlike `jsonschema.draft4_format_checker`, `fastjsonschema`
+# rejects values with invalid formats (e.g., date-times)
+_UNCOMPILED_KEYWORDS = (*_OPENAPI_KEYWORDS, '"format"')
+
+
+def compile_schema(
+    schema: Dict,
+    validator: Optional[type] = None,
+    compiled: bool = True,
+) -> Callable[[Any], None]:
+    """Create validation function for JSON schema.
+
+    If `compiled` is set, the optional dependency ``fastjsonschema`` is
+    installed and the schema does not make use of OpenAPI-specific keywords
+    (``nullable``, ``readOnly``, ``writeOnly`` and unresolved ``$ref``s) or
+    formats, the schema is compiled to Python code. Otherwise, an instance
+    of `validator` is created. Compiled schemas accept and reject the same
+    instances as `validator`; instances rejected by the compiled schema are
+    validated again by `validator`, so that errors are the same, too.
+
+    Args:
+        schema: JSON schema (draft 4 or OpenAPI Schema Object).
+        validator: :py:mod:`jsonschema` validator class to use if the schema
+            is not compiled. Defaults to Connexion's request validator.
+        compiled: Whether the schema is to be compiled, if possible.
+
+    Returns:
+        Function that validates an instance against `schema` and raises
+        :py:class:`jsonschema.ValidationError` if it is invalid.
+
+    Example:
+
+        >>> validate = compile_schema({"type": "integer"})
+        >>> validate(1)
+        >>> validate("1")
+        Traceback (most recent call last):
+        ...
+        jsonschema.exceptions.ValidationError: '1' is not of type 'integer'
+        ...
+    """
+    validator_class = validator or Draft4RequestValidator
+    validate_uncompiled = validator_class(  # type: ignore[misc]
+        schema,
+        format_checker=draft4_format_checker,
+    ).validate
+    if compiled and fastjsonschema is not None:
+        serialized = json.dumps(schema, default=str)
+        if not any(
+            keyword in serialized for keyword in _UNCOMPILED_KEYWORDS
+        ):
+            try:
+                validate = fastjsonschema.compile(
+                    {
+                        "$schema": "http://json-schema.org/draft-04/schema#",
+                        **schema,
+                    },
+                    use_default=False,
+                )
+            except fastjsonschema.JsonSchemaDefinitionException as exc:
+                logger.debug(f"Schema could not be compiled: {exc}")
+            else:
+                return _wrap_compiled(validate, validate_uncompiled)
+    return validate_uncompiled
+
+
+def _wrap_compiled(
+    validate: Callable[[Any], Any],
+    validate_uncompiled: Callable[[Any], None],
+) -> Callable[[Any], None]:
+    """Raise :py:mod:`jsonschema` errors from compiled validation function.
+
+    Args:
+        validate: Validation function generated by ``fastjsonschema``.
+        validate_uncompiled: :py:mod:`jsonschema` validation function for
+            the same schema; used to describe errors.
+
+    Returns:
+        Validation function raising :py:class:`jsonschema.ValidationError`.
+    """
+    def _validate(instance: Any) -> None:
+        """Validate instance."""
+        try:
+            validate(instance)
+        except fastjsonschema.JsonSchemaValueException as exc:
+            validate_uncompiled(instance)
+            logger.debug(
+                f"Instance rejected by compiled schema only: {exc.message}"
+            )
+
+    return _validate
+
+
+class _FunctionValidator():
+    """Adapter exposing a validation function as a :py:mod:`jsonschema`
+    validator.
+
+    Args:
+        validate: Validation function.
+
+    Attributes:
+        validate: Validation function.
+    """
+
+    def __init__(self, validate: Callable[[Any], None]) -> None:
+        """Constructor method."""
+        self.validate: Callable[[Any], None] = validate
+
+
+class CompiledRequestBodyValidator(RequestBodyValidator):
+    """Validate request bodies with a compiled validation function.
+
+    Cf. :py:func:`compile_schema`. Arguments are passed through to
+    :py:class:`connexion.decorators.validation.RequestBodyValidator`.
+    """
+
+    def __init__(self, schema, consumes, api, is_null_value_valid=False,
+                 validator=None, strict_validation=False) -> None:
+        """Constructor method."""
+        super().__init__(
+            schema,
+            consumes,
+            api,
+            is_null_value_valid=is_null_value_valid,
+            validator=validator,
+            strict_validation=strict_validation,
+        )
+        self.validator = _FunctionValidator(
+            compile_schema(schema, validator=validator)
+        )
+
+
+class CompiledResponseValidator(ResponseValidator):
+    """Validate responses with validation functions that are created once
+    per status code and content type.
+
+    Connexion's response validator creates a new :py:mod:`jsonschema`
+    validator for each response; here, validators are cached and, if
+    requested, compiled (cf. :py:func:`compile_schema`).
+
+    Args:
+        operation: Connexion operation.
+        mimetype: Expected MIME type of responses.
+        validator: JSON schema validator class.
+        compiled: Whether schemas are to be compiled, if possible.
+
+    Attributes:
+        operation: Connexion operation.
+        mimetype: Expected MIME type of responses.
+        validator: JSON schema validator class.
+        compiled: Whether schemas are to be compiled, if possible.
+    """
+
+    def __init__(
+        self,
+        operation,
+        mimetype: str,
+        validator=None,
+        compiled: bool = True,
+    ) -> None:
+        """Constructor method."""
+        super().__init__(operation, mimetype, validator=validator)
+        self.compiled: bool = compiled
+        self._validators: Dict[
+            Tuple[str, str],
+            Tuple[Dict, Optional[Callable[[Any], None]]],
+        ] = {}
+
+    def validate_response(self, data, status_code, headers, url) -> bool:
+        """Validate response.
+
+        Args:
+            data: Response body.
+            status_code: Response status code.
+            headers: Response headers.
+            url: Request URL.
+
+        Returns:
+            ``True`` if the response conforms to the specification.
+
+        Raises:
+            connexion.exceptions.NonConformingResponseBody: The response body
+                does not conform to the specification.
+            connexion.exceptions.NonConformingResponseHeaders: The response
+                headers do not conform to the specification.
+        """
+        content_type = headers.get("Content-Type", self.mimetype)
+        content_type = content_type.rsplit(";", 1)[0]
+        response_definition, validate = self._get_validator(
+            str(status_code),
+            content_type,
+        )
+
+        if validate is not None:
+            try:
+                validate(self.operation.json_loads(data))
+            except ValidationError as exc:
+                logger.error(
+                    f"{url} validation error: {exc}",
+                    extra={'validator': 'response'},
+                )
+                raise NonConformingResponseBody(message=str(exc))
+
+        if response_definition and response_definition.get("headers"):
+            required_header_keys = {
+                key for (key, val) in response_definition["headers"].items()
+                if val.get("required", False)
+            }
+            missing_keys = required_header_keys - set(headers.keys())
+            if missing_keys:
+                raise NonConformingResponseHeaders(
+                    message=(
+                        "Keys in header don't match response specification. "
+                        f"Difference: {', '.join(missing_keys)}"
+                    ),
+                )
+        return True
+
+    def _get_validator(
+        self,
+        status_code: str,
+        content_type: str,
+    ) -> Tuple[Dict, Optional[Callable[[Any], None]]]:
+        """Get response definition and body validation function.
+
+        Args:
+            status_code: Response status code.
+            content_type: Response content type.
+
+        Returns:
+            Tuple of response definition and validation function or ``None``
+            if the response body is not to be validated.
+        """
+        key = (status_code, content_type)
+        if key not in self._validators:
+            response_definition = self.operation.response_definition(
+                status_code,
+                content_type,
+            )
+            response_schema = self.operation.response_schema(
+                status_code,
+                content_type,
+            )
+            validate = None
+            if self.is_json_schema_compatible(response_schema):
+                validate = compile_schema(
+                    response_schema,
+                    validator=self.validator or Draft4ResponseValidator,
+                    compiled=self.compiled,
+                )
+            self._validators[key] = (response_definition, validate)
+        return self._validators[key]
+
+
+class SampledResponseValidator(CompiledResponseValidator):
+    """Validate a random sample of responses against the API specification.
+
+    Responses are counted in the counter
+    :py:const:`METRIC_RESPONSE_VALIDATION` of the shared
+    :py:data:`foca.utils.metrics.metrics` registry, labelled by
+    ``operation_id`` and ``result`` (one of ``valid``, ``invalid`` and
+    ``skipped``). Responses that do not conform to the specification are
+    logged and, unless `fail` is set, passed on to the client.
+
+    Args:
+        operation: Connexion operation.
+        mimetype: Expected MIME type of responses.
+        validator: JSON schema validator class.
+        sample_rate: Fraction of responses to be validated. Overridden by
+            the value of the ``x-foca-response-validation-sample-rate`` field
+            of the Operation Object, if set.
+        fail: Whether responses that do not conform to the specification
+            are replaced by an error response.
+        compiled: Whether schemas are to be compiled, if possible.
+
+    Attributes:
+        operation: Connexion operation.
+        mimetype: Expected MIME type of responses.
+        validator: JSON schema validator class.
+        sample_rate: Fraction of responses to be validated.
+        fail: Whether responses that do not conform to the specification
+            are replaced by an error response.
+        compiled: Whether schemas are to be compiled, if possible.
+    """
+
+    def __init__(
+        self,
+        operation,
+        mimetype: str,
+        validator=None,
+        sample_rate: float = 1.0,
+        fail: bool = False,
+        compiled: bool = False,
+    ) -> None:
+        """Constructor method."""
+        super().__init__(
+            operation,
+            mimetype,
+            validator=validator,
+            compiled=compiled,
+        )
+        raw_operation = getattr(operation, "_operation", None) or {}
+        self.sample_rate: float = float(
+            raw_operation.get(SAMPLE_RATE_EXTENSION, sample_rate)
+        )
+        self.fail: bool = fail
+
+    def validate_response(self, data, status_code, headers, url) -> bool:
+        """Validate response, if sampled.
+
+        Args:
+            data: Response body.
+            status_code: Response status code.
+            headers: Response headers.
+            url: Request URL.
+
+        Returns:
+            ``True``, unless `fail` is set and the response does not conform
+            to the specification.
+
+        Raises:
+            connexion.exceptions.NonConformingResponse: The response does not
+                conform to the specification and `fail` is set.
+        """
+        operation_id: Optional[str] = self.operation.operation_id
+        if self.sample_rate < 1 and random() >= self.sample_rate:
+            metrics.increment(
+                METRIC_RESPONSE_VALIDATION,
+                operation_id=operation_id,
+                result="skipped",
+            )
+            return True
+        try:
+            super().validate_response(data, status_code, headers, url)
+        except (
+            NonConformingResponseBody,
+            NonConformingResponseHeaders,
+        ) as exc:
+            metrics.increment(
+                METRIC_RESPONSE_VALIDATION,
+                operation_id=operation_id,
+                result="invalid",
+            )
+            logger.warning(
+                f"Response of operation '{operation_id}' does not conform to "
+                f"specification: {exc.detail}"
+            )
+            if self.fail:
+                raise
+            return True
+        metrics.increment(
+            METRIC_RESPONSE_VALIDATION,
+            operation_id=operation_id,
+            result="valid",
+        )
+        return True
+
+    def __call__(self, function: Callable) -> Callable:
+        """Decorate view function, unless no responses are to be validated.
+
+        Args:
+            function: View function.
+
+        Returns:
+            Decorated view function.
+        """
+        if self.sample_rate <= 0:
+            return function
+        return super().__call__(function)
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"<SampledResponseValidator(sample_rate={self.sample_rate})>"
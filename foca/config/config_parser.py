@@ -6,12 +6,17 @@ from logging.config import dictConfig
 from pathlib import Path
 from typing import (Dict, Optional)
 
-from addict import Dict as Addict
 from pydantic import BaseModel
 import yaml
 
 from foca.models.config import (Config, LogConfig)
 
+# Use libyaml-based loader if available
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -98,7 +103,7 @@ class ConfigParser():
         try:
             with open(conf) as config_file:
                 try:
-                    return yaml.safe_load(config_file)
+                    return yaml.load(config_file, Loader=SafeLoader)
                 except yaml.YAMLError as exc:
                     raise ValueError(
                         f"file '{conf}' is not valid YAML"
@@ -113,8 +118,9 @@ class ConfigParser():
         """Parse and merge a set of YAML files.
 
         Merging is done iteratively, from the first, second to the n-th
-        argument. Dictionary items are updated, not overwritten. For exact
-        behavior cf. https://github.com/mewwts/addict.
+        argument. Dictionary items are updated recursively, not overwritten;
+        all other values, including lists, are replaced. Cf.
+        :py:meth:`foca.config.config_parser.ConfigParser.deep_merge`.
 
         Args:
             *args: One or more paths to YAML files.
@@ -127,12 +133,39 @@ class ConfigParser():
         args_list = list(args)
         if not args_list:
             return {}
-        yaml_dict = Addict(ConfigParser.parse_yaml(args_list.pop(0)))
+        yaml_dict: Dict = ConfigParser.parse_yaml(args_list.pop(0)) or {}
 
         for arg in args_list:
-            yaml_dict.update(Addict(ConfigParser.parse_yaml(arg)))
+            ConfigParser.deep_merge(
+                yaml_dict,
+                ConfigParser.parse_yaml(arg) or {},
+            )
+
+        return yaml_dict
+
+    @staticmethod
+    def deep_merge(target: Dict, source: Dict) -> Dict:
+        """Recursively merge one dictionary into another, in place.
 
-        return yaml_dict.to_dict()
+        Keys present in both dictionaries are merged recursively if both
+        values are dictionaries; otherwise, the value from `source` replaces
+        the one in `target`.
+
+        Args:
+            target: Dictionary to merge into; modified in place.
+            source: Dictionary to merge from. Values are not copied, so
+                `source` should not be used after merging.
+
+        Returns:
+            The updated `target` dictionary.
+        """
+        for key, val in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(val, dict):
+                ConfigParser.deep_merge(current, val)
+            else:
+                target[key] = val
+        return target
 
     def parse_custom_config(self, model: str) -> BaseModel:
         """Parse custom configuration and validate against a model.
@@ -0,0 +1,251 @@
+"""Reload YAML-based app configuration at runtime."""
+
+import logging
+import os
+from pathlib import Path
+from threading import (Event, Lock, Thread)
+from typing import (Dict, List, Optional, Tuple)
+
+from flask import Flask
+
+from foca.config.config_parser import ConfigParser
+from foca.models.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Configuration sections that can be swapped while the app is running;
+# sections are given as sequences of keys, from outside to inside
+LIVE_SECTIONS: Tuple[Tuple[str, ...], ...] = (
+    ("log",),
+    ("exceptions",),
+    ("security", "auth"),
+)
+
+
+class ConfigReloader():
+    """Watch FOCA config file and apply changes to a running app.
+
+    The config file is polled for changes in a background thread. Upon
+    change, the new configuration is parsed and validated off the request
+    path. If valid, settings listed in
+    :py:const:`foca.config.config_reloader.LIVE_SECTIONS` are applied by
+    atomically replacing the app's ``config.foca`` object with an updated
+    copy. Changes to any other settings are logged, but not applied, as they
+    require a restart to take effect.
+
+    Args:
+        app: Flask application instance.
+        config_file: Path to config file in YAML format.
+        custom_config_model: Path to model to be used for custom config
+            parameter validation, supplied in "dot notation". Cf.
+            :py:class:`foca.config.config_parser.ConfigParser`.
+        interval: Interval, in seconds, at which the config file is checked
+            for changes.
+
+    Attributes:
+        app: Flask application instance.
+        config_file: Path to config file in YAML format.
+        custom_config_model: Path to model to be used for custom config
+            parameter validation, supplied in "dot notation". Cf.
+            :py:class:`foca.config.config_parser.ConfigParser`.
+        interval: Interval, in seconds, at which the config file is checked
+            for changes.
+    """
+
+    def __init__(
+        self,
+        app: Flask,
+        config_file: Path,
+        custom_config_model: Optional[str] = None,
+        interval: float = 2.0,
+    ) -> None:
+        """Constructor method."""
+        self.app: Flask = app
+        self.config_file: Path = Path(config_file)
+        self.custom_config_model: Optional[str] = custom_config_model
+        self.interval: float = interval
+        self._lock: Lock = Lock()
+        self._stop: Event = Event()
+        self._thread: Optional[Thread] = None
+        self._stat: Optional[Tuple[int, int]] = self._get_stat()
+        self._raw: Dict = ConfigParser.parse_yaml(self.config_file) or {}
+
+    def start(self) -> None:
+        """Start watching config file in a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = Thread(
+            target=self._watch,
+            name="foca-config-reloader",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(
+            f"Watching configuration file '{self.config_file}' for changes."
+        )
+
+    def stop(self) -> None:
+        """Stop watching config file."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def check(self) -> bool:
+        """Reload configuration if config file has changed.
+
+        Returns:
+            ``True`` if the config file has changed since the last check,
+            ``False`` otherwise.
+        """
+        with self._lock:
+            stat = self._get_stat()
+            if stat is None or stat == self._stat:
+                return False
+            self._stat = stat
+        self.reload()
+        return True
+
+    def reload(self) -> Dict[str, List[str]]:
+        """Parse and validate config file and apply live settings.
+
+        Returns:
+            Dictionary with keys ``applied`` and ``restart_required``, each
+            listing the changed configuration sections, in dot notation, that
+            were applied or that require a restart, respectively. Both lists
+            are empty if the new configuration is invalid.
+        """
+        report: Dict[str, List[str]] = {
+            "applied": [],
+            "restart_required": [],
+        }
+        with self._lock:
+            try:
+                raw = ConfigParser.parse_yaml(self.config_file) or {}
+                parser = ConfigParser(
+                    config_file=self.config_file,
+                    custom_config_model=self.custom_config_model,
+                    format_logs=False,
+                )
+            except Exception as exc:
+                logger.error(
+                    f"Configuration file '{self.config_file}' changed, but "
+                    "new configuration is invalid and was not applied. "
+                    f"Original error: {type(exc).__name__}: {exc}"
+                )
+                return report
+
+            for keys in self._get_changed_sections(self._raw, raw):
+                if keys in LIVE_SECTIONS:
+                    report["applied"].append(".".join(keys))
+                else:
+                    report["restart_required"].append(".".join(keys))
+
+            if report["applied"]:
+                current: Config = self.app.config.foca  # type: ignore
+                setattr(
+                    self.app.config,
+                    "foca",
+                    self._merge_live_sections(current, parser.config),
+                )
+                if "log" in report["applied"]:
+                    parser._configure_logging()
+                logger.info(
+                    "Configuration reloaded; applied changes to: "
+                    f"{report['applied']}"
+                )
+            if report["restart_required"]:
+                logger.warning(
+                    "Configuration changed, but restart required for changes "
+                    f"to take effect: {report['restart_required']}"
+                )
+            self._raw = raw
+
+        return report
+
+    def _watch(self) -> None:
+        """Poll config file for changes until stopped."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as exc:  # pragma: no cover
+                logger.error(
+                    "Failed to reload configuration. Original error: "
+                    f"{type(exc).__name__}: {exc}"
+                )
+
+    def _get_stat(self) -> Optional[Tuple[int, int]]:
+        """Get modification time and size of config file.
+
+        Returns:
+            Tuple of modification time, in nanoseconds, and size, in bytes,
+            of the config file, or ``None`` if the file cannot be accessed.
+        """
+        try:
+            stat = os.stat(self.config_file)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _get_changed_sections(
+        old: Dict,
+        new: Dict,
+    ) -> List[Tuple[str, ...]]:
+        """Compare configurations and list changed sections.
+
+        Sections that contain live sections (e.g., ``security``) are compared
+        member by member.
+
+        Args:
+            old: Previous configuration, as parsed from the config file.
+            new: New configuration, as parsed from the config file.
+
+        Returns:
+            List of changed sections, each given as a sequence of keys.
+        """
+        parents = {keys[0] for keys in LIVE_SECTIONS if len(keys) > 1}
+        changed: List[Tuple[str, ...]] = []
+        for key in sorted(set(old) | set(new)):
+            old_val = old.get(key)
+            new_val = new.get(key)
+            if old_val == new_val:
+                continue
+            if key in parents and (
+                isinstance(old_val, dict) or old_val is None
+            ) and (
+                isinstance(new_val, dict) or new_val is None
+            ):
+                old_val = old_val or {}
+                new_val = new_val or {}
+                for sub_key in sorted(set(old_val) | set(new_val)):
+                    if old_val.get(sub_key) != new_val.get(sub_key):
+                        changed.append((key, sub_key))
+            else:
+                changed.append((key,))
+        return changed
+
+    @staticmethod
+    def _merge_live_sections(current: Config, new: Config) -> Config:
+        """Create copy of configuration with live sections replaced.
+
+        Args:
+            current: Configuration currently used by the app.
+            new: Newly parsed configuration.
+
+        Returns:
+            Shallow copy of `current`, with all live sections taken from
+            `new`.
+        """
+        merged = current.model_copy()
+        for keys in LIVE_SECTIONS:
+            parent = merged
+            new_parent = new
+            for key in keys[:-1]:
+                child = getattr(parent, key).model_copy()
+                setattr(parent, key, child)
+                parent = child
+                new_parent = getattr(new_parent, key)
+            setattr(parent, keys[-1], getattr(new_parent, keys[-1]))
+        return merged
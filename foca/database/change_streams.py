@@ -0,0 +1,226 @@
+"""Watch MongoDB collections for changes made by any process."""
+
+import logging
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from flask import Flask
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure, PyMongoError
+
+# Get logger instance
+logger = logging.getLogger(__name__)
+
+# Key of change stream watchers, by collection, in `flask.Flask.extensions`
+_EXTENSION_KEY = "foca_change_streams"
+
+# Error codes indicating that the server does not support change streams,
+# e.g., because it is a standalone server
+_UNSUPPORTED_CODES = frozenset({40573})
+
+# Error codes indicating that a change stream cannot be resumed, because
+# the resume token is no longer in the oplog
+_HISTORY_LOST_CODES = frozenset({136, 260, 280, 286})
+
+# Callback notified of changes; called with the change event, or with
+# `None` if changes may have been missed and all cached data is stale
+ChangeCallback = Callable[[Optional[Mapping[str, Any]]], None]
+
+
+class ChangeStreamWatcher():
+    """Watch a MongoDB collection for changes and notify subscribers.
+
+    Changes are read from a change stream in a background thread and
+    published to all subscribed callbacks, e.g., to invalidate in-process
+    caches of documents of the collection (cf.
+    :py:class:`foca.database.document_cache.CachedCollection`). The resume
+    token of the last change is kept, so that the stream is resumed without
+    missing changes after transient errors. Subscribers are notified with
+    ``None`` whenever changes may have been missed, i.e., when the stream is
+    opened without a resume token or cannot be resumed.
+
+    Change streams are only supported by replica sets and sharded clusters.
+    On standalone servers, the watcher falls back to polling: subscribers
+    are notified with ``None`` every `poll_interval` seconds.
+
+    Args:
+        collection: Collection to be watched.
+        poll_interval: Interval, in seconds, at which subscribers are
+            notified if change streams are not supported; also the time
+            waited before reopening a failed change stream.
+        max_await_time_ms: Time, in milliseconds, the server waits for
+            changes before an empty batch is returned; bounds how long
+            stopping the watcher takes.
+
+    Attributes:
+        collection: Collection to be watched.
+        poll_interval: Interval, in seconds, at which subscribers are
+            notified if change streams are not supported; also the time
+            waited before reopening a failed change stream.
+        max_await_time_ms: Time, in milliseconds, the server waits for
+            changes before an empty batch is returned.
+        resume_token: Resume token of the last change read, if any.
+        polling: Whether the watcher fell back to polling.
+
+    Example:
+
+        >>> watcher = ChangeStreamWatcher(collection)
+        >>> watcher.subscribe(lambda change: cache.clear())
+        >>> watcher.start()
+    """
+
+    def __init__(
+        self,
+        collection: Collection,
+        poll_interval: float = 10.0,
+        max_await_time_ms: int = 1000,
+    ) -> None:
+        """Constructor method."""
+        self.collection: Collection = collection
+        self.poll_interval: float = poll_interval
+        self.max_await_time_ms: int = max_await_time_ms
+        self.resume_token: Optional[Mapping[str, Any]] = None
+        self.polling: bool = False
+        self._callbacks: List[ChangeCallback] = []
+        self._lock: Lock = Lock()
+        self._stop: Event = Event()
+        self._thread: Optional[Thread] = None
+
+    def subscribe(self, callback: ChangeCallback) -> None:
+        """Subscribe callback to changes.
+
+        Args:
+            callback: Function called with each change event, or with
+                ``None`` if changes may have been missed.
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def start(self) -> None:
+        """Start watching in a background thread, unless already started."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = Thread(
+                target=self._run,
+                name=f"foca-watch-{self.collection.name}",
+                daemon=True,
+            )
+            self._thread.start()
+        logger.info(
+            f"Watching collection '{self.collection.name}' for changes."
+        )
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop watching.
+
+        Args:
+            timeout: Maximum time, in seconds, to wait for the background
+                thread to finish.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _publish(self, change: Optional[Mapping[str, Any]]) -> None:
+        """Notify subscribers of change.
+
+        Args:
+            change: Change event, or ``None`` if changes may have been
+                missed.
+        """
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback(change)
+            except Exception:
+                logger.exception("Change stream subscriber failed.")
+
+    def _run(self) -> None:
+        """Watch collection until stopped, falling back to polling if change
+        streams are not supported.
+        """
+        while not self._stop.is_set():
+            try:
+                self._watch()
+            except OperationFailure as exc:
+                if exc.code in _UNSUPPORTED_CODES:
+                    logger.info(
+                        "Change streams not supported; polling collection "
+                        f"'{self.collection.name}' every "
+                        f"{self.poll_interval} seconds instead."
+                    )
+                    self._poll()
+                    return
+                if exc.code in _HISTORY_LOST_CODES:
+                    self.resume_token = None
+                logger.warning(
+                    f"Change stream of collection '{self.collection.name}' "
+                    f"failed: {exc}"
+                )
+            except PyMongoError as exc:
+                logger.warning(
+                    f"Change stream of collection '{self.collection.name}' "
+                    f"failed: {exc}"
+                )
+            self._stop.wait(self.poll_interval)
+
+    def _watch(self) -> None:
+        """Publish changes from change stream until stopped."""
+        with self.collection.watch(
+            start_after=self.resume_token,
+            max_await_time_ms=self.max_await_time_ms,
+        ) as stream:
+            if self.resume_token is None:
+                self._publish(None)
+            while not self._stop.is_set() and stream.alive:
+                change = stream.try_next()
+                if change is not None:
+                    self._publish(change)
+                if stream.resume_token is not None:
+                    self.resume_token = stream.resume_token
+
+    def _poll(self) -> None:
+        """Notify subscribers periodically until stopped."""
+        self.polling = True
+        while not self._stop.wait(self.poll_interval):
+            self._publish(None)
+
+
+def get_change_stream_watcher(
+    app: Flask,
+    collection: Collection,
+    poll_interval: float = 10.0,
+) -> ChangeStreamWatcher:
+    """Get change stream watcher of collection, creating it if necessary.
+
+    One watcher, and thus one change stream, is shared by all subscribers
+    to changes of a collection. Watchers are not started, so that callbacks
+    can be subscribed first (cf. :py:meth:`ChangeStreamWatcher.start`).
+
+    Args:
+        app: Flask application instance.
+        collection: Collection to be watched.
+        poll_interval: Interval, in seconds, at which subscribers are
+            notified if change streams are not supported; only used if the
+            watcher is created.
+
+    Returns:
+        Change stream watcher.
+
+    Example:
+
+        >>> watcher = get_change_stream_watcher(app, collection)
+        >>> watcher.subscribe(lambda change: cache.clear())
+        >>> watcher.start()
+    """
+    watchers: Dict[str, ChangeStreamWatcher] = app.extensions.setdefault(
+        _EXTENSION_KEY, {}
+    )
+    if collection.full_name not in watchers:
+        watchers[collection.full_name] = ChangeStreamWatcher(
+            collection=collection,
+            poll_interval=poll_interval,
+        )
+    return watchers[collection.full_name]
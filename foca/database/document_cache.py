@@ -0,0 +1,200 @@
+"""Read-through caching of MongoDB documents."""
+
+from copy import deepcopy
+from functools import wraps
+import logging
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional
+
+from pymongo.collection import Collection
+
+from foca.models.config import DocumentCacheConfig
+from foca.utils.cache import LRUCache
+from foca.utils.metrics import metrics
+
+# Get logger instance
+logger = logging.getLogger(__name__)
+
+# Name of counter of cache hits and misses
+METRIC_DB_CACHE = "foca_db_cache_total"
+
+# Sentinel for cache misses
+_MISSING = object()
+
+
+def _invalidating(name: str) -> Callable:
+    """Wrap write method so that the cache is cleared after each write.
+
+    Args:
+        name: Name of write method of
+            :py:class:`pymongo.collection.Collection`.
+
+    Returns:
+        Wrapped method.
+    """
+    @wraps(getattr(Collection, name))
+    def wrapper(self: "CachedCollection", *args, **kwargs) -> Any:
+        try:
+            return getattr(super(CachedCollection, self), name)(
+                *args,
+                **kwargs,
+            )
+        finally:
+            self.invalidate()
+
+    return wrapper
+
+
+class CachedCollection(Collection):
+    """MongoDB collection with a read-through cache for
+    :py:meth:`find_one`.
+
+    Lookups via :py:meth:`find_one` with a filter and, optionally, a
+    projection are served from an in-memory LRU cache with per-entry expiry;
+    lookups with any other arguments (e.g., sessions or sort orders) bypass
+    the cache. Cached documents are copied on every read, so that callers
+    may modify them. The cache is cleared whenever documents are written via
+    this handle, including writes that fail. Writes by other processes, or
+    via other handles of the same collection, are only noticed once the
+    cached lookups expire, unless the collection is watched for changes
+    (cf. :py:class:`foca.database.change_streams.ChangeStreamWatcher`).
+    Hits and misses are counted in the :py:const:`METRIC_DB_CACHE` counter
+    of the shared :py:data:`foca.utils.metrics.metrics` registry, labelled
+    by ``database``, ``collection`` and ``result``.
+
+    Args:
+        collection: Collection to be cached; its options (e.g., read
+            preference and write concern) are kept.
+        conf: Cache configuration.
+
+    Attributes:
+        cache: Cache of lookups.
+
+    Example:
+
+        >>> pets = CachedCollection(collection, DocumentCacheConfig(ttl=10))
+        >>> pets.find_one({"id": 1}, {"_id": False})
+        {'id': 1, 'name': 'Rex'}
+    """
+
+    def __init__(
+        self,
+        collection: Collection,
+        conf: DocumentCacheConfig,
+    ) -> None:
+        """Constructor method."""
+        super().__init__(
+            collection.database,
+            collection.name,
+            codec_options=collection.codec_options,
+            read_preference=collection.read_preference,
+            write_concern=collection.write_concern,
+            read_concern=collection.read_concern,
+        )
+        self.cache: LRUCache = LRUCache(
+            max_entries=conf.max_entries,
+            ttl=conf.ttl,
+        )
+        self._generation: int = 0
+        self._generation_lock: Lock = Lock()
+
+    def find_one(self, filter: Optional[Any] = None, *args, **kwargs) -> Any:
+        """Get a single document, from the cache if possible.
+
+        Args:
+            filter: Filter or value of ``_id`` of the document.
+            *args: Positional arguments passed to
+                :py:meth:`pymongo.collection.Collection.find_one`.
+            **kwargs: Keyword arguments passed to
+                :py:meth:`pymongo.collection.Collection.find_one`.
+
+        Returns:
+            Matching document, or ``None`` if no document matches.
+        """
+        key = self._get_key(filter, *args, **kwargs)
+        if key is None:
+            return super().find_one(filter, *args, **kwargs)
+        labels: Dict[str, Any] = {
+            "database": self.database.name,
+            "collection": self.name,
+        }
+        document = self.cache.get(key, _MISSING)
+        if document is not _MISSING:
+            metrics.increment(METRIC_DB_CACHE, result="hit", **labels)
+            return deepcopy(document)
+        metrics.increment(METRIC_DB_CACHE, result="miss", **labels)
+        generation = self._generation
+        document = super().find_one(filter, *args, **kwargs)
+        with self._generation_lock:
+            # Do not cache documents read before a concurrent write finished
+            if generation == self._generation:
+                self.cache.set(key, deepcopy(document))
+        return document
+
+    def invalidate(self) -> None:
+        """Remove all cached lookups."""
+        with self._generation_lock:
+            self._generation += 1
+            self.cache.clear()
+        logger.debug(f"Cleared document cache of collection '{self.name}'")
+
+    insert_one = _invalidating("insert_one")
+    insert_many = _invalidating("insert_many")
+    replace_one = _invalidating("replace_one")
+    update_one = _invalidating("update_one")
+    update_many = _invalidating("update_many")
+    delete_one = _invalidating("delete_one")
+    delete_many = _invalidating("delete_many")
+    find_one_and_delete = _invalidating("find_one_and_delete")
+    find_one_and_replace = _invalidating("find_one_and_replace")
+    find_one_and_update = _invalidating("find_one_and_update")
+    bulk_write = _invalidating("bulk_write")
+    drop = _invalidating("drop")
+    rename = _invalidating("rename")
+
+    @staticmethod
+    def _get_key(
+        filter: Optional[Any] = None,
+        *args,
+        **kwargs,
+    ) -> Optional[Hashable]:
+        """Build cache key for lookup.
+
+        Args:
+            filter: Filter or value of ``_id`` of the document.
+            *args: Positional arguments of the lookup.
+            **kwargs: Keyword arguments of the lookup.
+
+        Returns:
+            Cache key, or ``None`` if the lookup cannot be cached.
+        """
+        if len(args) > 1 or set(kwargs) - {"projection"}:
+            return None
+        projection = args[0] if args else kwargs.get("projection")
+        try:
+            key = (_freeze(filter), _freeze(projection))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert document to hashable value.
+
+    Args:
+        value: Document, list or value.
+
+    Returns:
+        Nested tuples of field names and values, preserving the order of
+        fields; values are paired with their types, so that equal values of
+        different types, e.g., ``1`` and ``True``, which match different
+        documents, are distinguished.
+    """
+    if isinstance(value, Mapping):
+        return (Mapping, tuple(
+            (key, _freeze(item)) for key, item in value.items()
+        ))
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(_freeze(item) for item in value))
+    return (type(value), value)
@@ -0,0 +1,174 @@
+"""Monitoring of MongoDB commands."""
+
+import logging
+from typing import Any, Dict, Hashable, Mapping, Tuple
+
+from flask import has_request_context, request
+from pymongo.monitoring import (
+    CommandFailedEvent,
+    CommandListener,
+    CommandStartedEvent,
+    CommandSucceededEvent,
+)
+
+from foca.models.config import MongoMonitoringConfig
+from foca.utils.metrics import metrics
+
+# Get logger instance
+logger = logging.getLogger(__name__)
+
+# Name of histogram of command durations, in seconds
+METRIC_DB_COMMAND_DURATION = "foca_db_command_duration_seconds"
+
+# Name of counter of failed commands
+METRIC_DB_COMMAND_FAILURES = "foca_db_command_failures_total"
+
+# Placeholder for redacted values
+REDACTED = "?"
+
+# Command fields describing the documents a command operates on; only these
+# fields, with their values redacted, are logged for slow commands
+_FILTER_FIELDS = ("filter", "query", "q", "pipeline", "updates", "deletes")
+
+
+class CommandMonitor(CommandListener):
+    """Record durations of MongoDB commands and log slow commands.
+
+    Durations are recorded in the :py:const:`METRIC_DB_COMMAND_DURATION`
+    histogram of the shared :py:data:`foca.utils.metrics.metrics` registry,
+    labelled by ``database``, ``collection`` and ``command``; failed commands
+    are additionally counted in :py:const:`METRIC_DB_COMMAND_FAILURES`.
+    Commands taking at least ``slow_query_ms`` milliseconds are logged with
+    a warning, including their filters with all values redacted (cf.
+    :py:func:`redact`) and the identifier of the request that issued them,
+    as given in the configured request header.
+
+    Args:
+        conf: Monitoring configuration.
+
+    Attributes:
+        conf: Monitoring configuration.
+    """
+
+    def __init__(self, conf: MongoMonitoringConfig) -> None:
+        """Constructor method."""
+        self.conf: MongoMonitoringConfig = conf
+        self._pending: Dict[Hashable, Tuple[str, str, Mapping, Any]] = {}
+
+    def started(self, event: CommandStartedEvent) -> None:
+        """Remember command until it completes.
+
+        Args:
+            event: Event published when a command is started.
+        """
+        collection = event.command.get(event.command_name)
+        if event.command_name == "getMore":
+            collection = event.command.get("collection")
+        self._pending[self._get_key(event)] = (
+            event.database_name,
+            collection if isinstance(collection, str) else "",
+            event.command,
+            _get_request_id(self.conf.request_id_header),
+        )
+
+    def succeeded(self, event: CommandSucceededEvent) -> None:
+        """Record duration of succeeded command.
+
+        Args:
+            event: Event published when a command succeeds.
+        """
+        self._record(event)
+
+    def failed(self, event: CommandFailedEvent) -> None:
+        """Record duration of failed command.
+
+        Args:
+            event: Event published when a command fails.
+        """
+        self._record(event, failed=True)
+
+    def _record(self, event: Any, failed: bool = False) -> None:
+        """Record metrics of completed command and log it if slow.
+
+        Args:
+            event: Event published when a command succeeds or fails.
+            failed: Whether the command failed.
+        """
+        pending = self._pending.pop(self._get_key(event), None)
+        if pending is None:
+            return
+        database, collection, command, request_id = pending
+        labels = {
+            "database": database,
+            "collection": collection,
+            "command": event.command_name,
+        }
+        duration = event.duration_micros / 1e6
+        metrics.observe(METRIC_DB_COMMAND_DURATION, duration, **labels)
+        if failed:
+            metrics.increment(METRIC_DB_COMMAND_FAILURES, **labels)
+        if (
+            self.conf.slow_query_ms is not None and
+            duration * 1000 >= self.conf.slow_query_ms
+        ):
+            filters = {
+                field: redact(command[field])
+                for field in _FILTER_FIELDS
+                if field in command
+            }
+            logger.warning(
+                f"Slow MongoDB command '{event.command_name}' on "
+                f"'{database}.{collection}' took {duration * 1000:.1f} ms "
+                f"(request: {request_id}; failed: {failed}): {filters}"
+            )
+
+    @staticmethod
+    def _get_key(event: Any) -> Hashable:
+        """Get key identifying a command across its events.
+
+        Args:
+            event: Command event.
+
+        Returns:
+            Connection and request identifier of the command.
+        """
+        return (event.connection_id, event.request_id)
+
+
+def redact(value: Any) -> Any:
+    """Replace all values of a MongoDB document with a placeholder.
+
+    Field names and operators are kept, so that the shape of filters and
+    pipelines remains recognizable without disclosing the queried values.
+
+    Args:
+        value: Document, list or value to be redacted.
+
+    Returns:
+        Redacted copy of `value`.
+
+    Example:
+
+        >>> redact({"name": {"$in": ["Rex", "Fido"]}, "age": 3})
+        {'name': {'$in': ['?', '?']}, 'age': '?'}
+    """
+    if isinstance(value, Mapping):
+        return {key: redact(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [redact(item) for item in value]
+    return REDACTED
+
+
+def _get_request_id(header: str) -> Any:
+    """Get identifier of current request, if any.
+
+    Args:
+        header: Name of request header holding the request identifier.
+
+    Returns:
+        Value of `header` in the current request, or ``None`` outside of
+        requests or if the header is not set.
+    """
+    if not has_request_context():
+        return None
+    return request.headers.get(header)
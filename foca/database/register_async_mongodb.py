@@ -0,0 +1,385 @@
+"""Register asynchronous MongoDB database and collection handles."""
+
+import asyncio
+import atexit
+from concurrent.futures import Future
+import inspect
+import logging
+import os
+from threading import Lock, Thread
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Optional
+
+from flask import Flask
+
+from foca.database.register_mongodb import (
+    _get_client_options,
+    _get_concern_options,
+    _get_event_listeners,
+    _get_mongo_uri,
+)
+from foca.models.config import MongoConfig
+
+# Use asynchronous PyMongo API if available (PyMongo 4.9+)
+try:
+    from pymongo import AsyncMongoClient
+except ImportError:  # pragma: no cover
+    AsyncMongoClient = None  # type: ignore[assignment,misc]
+
+# Get logger instance
+logger = logging.getLogger(__name__)
+
+# Key of asynchronous MongoDB clients, by URI, in `flask.Flask.extensions`
+_EXTENSION_KEY = "foca_async_mongo_clients"
+
+# Maximum time, in seconds, to wait for clients to close at exit
+_CLOSE_TIMEOUT = 5.0
+
+
+class _AsyncClient():
+    """Asynchronous MongoDB client of a cluster, shared by all event loops.
+
+    Asynchronous clients can only be used in the event loop in which they
+    were created, while Flask runs each ``async`` view in its own,
+    short-lived event loop. So that a single client, and thus a single
+    connection pool, serves all requests, the client is created in, and all
+    of its operations are run by, a long-lived event loop in a background
+    thread; coroutines are submitted to that loop and awaited in the event
+    loop of the caller (cf. :py:class:`AsyncHandle`). The client is closed at
+    exit or via :py:meth:`close`.
+
+    Args:
+        uri: MongoDB URI.
+        options: Options passed to :py:class:`pymongo.AsyncMongoClient`.
+
+    Attributes:
+        uri: MongoDB URI.
+        options: Options passed to :py:class:`pymongo.AsyncMongoClient`.
+    """
+
+    def __init__(self, uri: str, options: Dict[str, Any]) -> None:
+        """Constructor method."""
+        self.uri: str = uri
+        self.options: Dict[str, Any] = options
+        self._client: Any = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[Thread] = None
+        self._lock = Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Background event loop, started if necessary."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = Thread(
+                    target=loop.run_forever,
+                    name="foca-async-mongo",
+                    daemon=True,
+                )
+                self._thread.start()
+                self._loop = loop
+                atexit.register(self.close, _CLOSE_TIMEOUT)
+            return self._loop
+
+    def get(self) -> Any:
+        """Get client, creating it if necessary.
+
+        Returns:
+            Instance of :py:class:`pymongo.AsyncMongoClient`, to be used in
+            the background event loop only.
+        """
+        loop = self.loop
+        with self._lock:
+            if self._client is None:
+                self._client = asyncio.run_coroutine_threadsafe(
+                    self._create(),
+                    loop,
+                ).result()
+            return self._client
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Run coroutine in background event loop.
+
+        Args:
+            coro: Coroutine.
+
+        Returns:
+            Future of the result of `coro`.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Close client and stop background event loop.
+
+        Args:
+            timeout: Maximum time, in seconds, to wait for the client to
+                close and the background thread to finish.
+        """
+        with self._lock:
+            client, loop, thread = self._client, self._loop, self._thread
+            self._client = self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        atexit.unregister(self.close)
+        if client is not None:
+            asyncio.run_coroutine_threadsafe(
+                client.close(),
+                loop,
+            ).result(timeout)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+    async def _create(self) -> Any:
+        """Create client in background event loop.
+
+        Returns:
+            Instance of :py:class:`pymongo.AsyncMongoClient`.
+        """
+        return AsyncMongoClient(self.uri, **self.options)
+
+
+class _LoopProxy():
+    """Proxy running the coroutines of an asynchronous PyMongo object in the
+    background event loop of its client.
+
+    Attribute and item access, calls and asynchronous iteration and context
+    management are delegated to the wrapped object. Coroutines are submitted
+    to the background event loop and returned as awaitables of the event
+    loop of the caller; asynchronous PyMongo objects, such as cursors, are
+    wrapped in turn.
+
+    Args:
+        obj: Asynchronous PyMongo object.
+        client: Client owning the background event loop.
+    """
+
+    def __init__(self, obj: Any, client: _AsyncClient) -> None:
+        """Constructor method."""
+        self.__wrapped__: Any = obj
+        self._client = client
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate attribute access to wrapped object."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self._wrap(getattr(self.__wrapped__, name))
+
+    def __getitem__(self, name: str) -> Any:
+        """Delegate item access to wrapped object."""
+        return self._wrap(self.__wrapped__[name])
+
+    def __aiter__(self) -> Any:
+        """Delegate asynchronous iteration to wrapped object."""
+        return self._wrap(self.__wrapped__.__aiter__())
+
+    async def __anext__(self) -> Any:
+        """Get next item of wrapped asynchronous iterator."""
+        return await self._run(self.__wrapped__.__anext__())
+
+    async def __aenter__(self) -> Any:
+        """Enter wrapped asynchronous context manager."""
+        return self._wrap(await self._run(self.__wrapped__.__aenter__()))
+
+    async def __aexit__(self, *args) -> Any:
+        """Exit wrapped asynchronous context manager."""
+        return await self._run(self.__wrapped__.__aexit__(*args))
+
+    def __repr__(self) -> str:
+        """Representation of proxy."""
+        return f"{type(self).__name__}({self.__wrapped__!r})"
+
+    def _run(self, coro: Coroutine) -> Awaitable:
+        """Run coroutine in background event loop.
+
+        Args:
+            coro: Coroutine.
+
+        Returns:
+            Awaitable of the result of `coro` in the running event loop.
+
+        Raises:
+            RuntimeError: No event loop is running.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            coro.close()
+            raise
+        return asyncio.wrap_future(self._client.submit(coro), loop=loop)
+
+    def _wrap(self, value: Any) -> Any:
+        """Wrap value returned by wrapped object.
+
+        Args:
+            value: Attribute, item or return value.
+
+        Returns:
+            Awaitable for coroutines, proxy for asynchronous PyMongo objects
+            and for their methods, `value` otherwise.
+        """
+        if inspect.iscoroutine(value):
+            return self._run(value)
+        if type(value).__module__.startswith("pymongo.asynchronous"):
+            return type(self)(value, self._client)
+        if inspect.ismethod(value):
+            return self._wrap_method(value)
+        return value
+
+    def _wrap_method(self, method: Callable) -> Callable:
+        """Wrap method of wrapped object, so that its return values are
+        wrapped.
+
+        Args:
+            method: Bound method.
+
+        Returns:
+            Wrapped method.
+        """
+        def wrapper(*args, **kwargs) -> Any:
+            return self._wrap(method(*args, **kwargs))
+
+        return wrapper
+
+
+class AsyncHandle():
+    """Asynchronous MongoDB client, database or collection handle.
+
+    The handle resolves to the
+    :py:class:`pymongo.asynchronous.collection.AsyncCollection` (or database
+    or client) of the client shared by all handles of a cluster; attribute
+    and item access are delegated to it, so that the handle can be used like
+    the resolved object from within coroutines running in any event loop.
+    Operations are run in the background event loop of the client, so that
+    all requests share one connection pool (cf. :py:class:`_AsyncClient`).
+
+    Args:
+        client: Client of the cluster.
+        database: Name of database; if ``None``, the handle resolves to the
+            client.
+        collection: Name of collection; if ``None``, the handle resolves to
+            the database.
+        db_options: Options passed to
+            :py:meth:`pymongo.AsyncMongoClient.get_database`.
+        coll_options: Options passed to
+            :py:meth:`pymongo.asynchronous.database.AsyncDatabase.get_collection`.
+
+    Example:
+
+        >>> async def findPets():
+        ...     pets = current_app.config.foca.db.dbs["petstore"] \\
+        ...         .collections["pets"].async_client
+        ...     cursor = pets.find({}, {"_id": False})
+        ...     return await cursor.to_list()
+    """
+
+    def __init__(
+        self,
+        client: _AsyncClient,
+        database: Optional[str] = None,
+        collection: Optional[str] = None,
+        db_options: Optional[Dict[str, Any]] = None,
+        coll_options: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Constructor method."""
+        self._client = client
+        self._database = database
+        self._collection = collection
+        self._db_options = db_options or {}
+        self._coll_options = coll_options or {}
+
+    def get(self) -> Any:
+        """Resolve handle.
+
+        Returns:
+            Asynchronous client, database or collection, wrapped so that its
+            operations are run in the background event loop of the client.
+        """
+        client = self._client.get()
+        obj = client
+        if self._database is not None:
+            obj = client.get_database(self._database, **self._db_options)
+            if self._collection is not None:
+                obj = obj.get_collection(
+                    self._collection,
+                    **self._coll_options,
+                )
+        return _LoopProxy(obj, self._client)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate attribute access to resolved handle."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.get(), name)
+
+    def __getitem__(self, name: str) -> Any:
+        """Delegate item access to resolved handle."""
+        return self.get()[name]
+
+    def __repr__(self) -> str:
+        """Representation of handle."""
+        return (
+            f"{type(self).__name__}(database={self._database!r}, "
+            f"collection={self._collection!r})"
+        )
+
+
+def register_async_mongodb(
+    app: Flask,
+    conf: MongoConfig,
+) -> MongoConfig:
+    """Register asynchronous MongoDB database and collection handles.
+
+    Handles are added as ``async_client`` to the database and collection
+    configurations, next to the synchronous ``client``, and are configured
+    with the same client options, read preferences, read concerns and write
+    concerns. Requires PyMongo 4.9 or later.
+
+    Args:
+        app: Flask application instance.
+        conf: :py:class:`foca.models.config.MongoConfig` instance describing
+            databases and collections to be registered with `app`.
+
+    Returns:
+        MongoDB configuration with asynchronous handles.
+
+    Raises:
+        ImportError: The installed version of PyMongo does not support
+            asynchronous clients.
+    """
+    if AsyncMongoClient is None:
+        raise ImportError(
+            "Asynchronous MongoDB clients require PyMongo 4.9 or later."
+        )
+    uri = _get_mongo_uri(host=conf.host, port=conf.port, hosts=conf.hosts)
+    clients: Dict[str, _AsyncClient] = app.extensions.setdefault(
+        _EXTENSION_KEY, {}
+    )
+    if uri not in clients:
+        clients[uri] = _AsyncClient(
+            uri=uri,
+            options={
+                **_get_client_options(conf),
+                "event_listeners": _get_event_listeners(conf),
+            },
+        )
+
+    for db_name, db_conf in (conf.dbs or {}).items():
+        name = os.environ.get('MONGO_DBNAME', db_name)
+        db_options = _get_concern_options(db_conf)
+        db_conf.async_client = AsyncHandle(
+            client=clients[uri],
+            database=name,
+            db_options=db_options,
+        )
+        for coll_name, coll_conf in (db_conf.collections or {}).items():
+            coll_conf.async_client = AsyncHandle(
+                client=clients[uri],
+                database=name,
+                collection=coll_name,
+                db_options=db_options,
+                coll_options=_get_concern_options(coll_conf),
+            )
+        logger.info(f"Added asynchronous handles for database '{db_name}'.")
+    return conf
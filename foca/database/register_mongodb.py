@@ -1,15 +1,82 @@
 """Register MongoDB database and collections."""
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
+from threading import Event, Thread
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from flask import Flask
 from flask_pymongo import PyMongo
-from foca.models.config import MongoConfig, DBConfig
+from pymongo import IndexModel, MongoClient, ReadPreference
+from pymongo.collection import Collection
+from pymongo.database import Database
+from pymongo.monitoring import CommandListener
+from pymongo.read_concern import ReadConcern
+from pymongo.write_concern import WriteConcern
+from werkzeug.exceptions import ServiceUnavailable
+
+from foca.database.change_streams import get_change_stream_watcher
+from foca.database.document_cache import CachedCollection
+from foca.database.monitoring import CommandMonitor
+from foca.models.config import (
+    CollectionConfig,
+    DBConfig,
+    IndexConfig,
+    IndexModeEnum,
+    MongoConfig,
+    ReadPreferenceEnum,
+)
 
 # Get logger instance
 logger = logging.getLogger(__name__)
 
+# Key of MongoDB clients, by URI, in `flask.Flask.extensions`
+_CLIENTS_EXTENSION_KEY = "foca_mongo_clients"
+
+# Names of MongoDB client options, by connection configuration field
+_CLIENT_OPTIONS = {
+    "max_pool_size": "maxPoolSize",
+    "min_pool_size": "minPoolSize",
+    "max_idle_time_ms": "maxIdleTimeMS",
+    "connect_timeout_ms": "connectTimeoutMS",
+    "socket_timeout_ms": "socketTimeoutMS",
+    "server_selection_timeout_ms": "serverSelectionTimeoutMS",
+    "wait_queue_timeout_ms": "waitQueueTimeoutMS",
+    "compressors": "compressors",
+    "auth_source": "authSource",
+}
+
+# Names of read preferences, by read preference mode
+_READ_PREFERENCES = {
+    ReadPreferenceEnum.nearest: "NEAREST",
+    ReadPreferenceEnum.primary: "PRIMARY",
+    ReadPreferenceEnum.primaryPreferred: "PRIMARY_PREFERRED",
+    ReadPreferenceEnum.secondary: "SECONDARY",
+    ReadPreferenceEnum.secondaryPreferred: "SECONDARY_PREFERRED",
+}
+
+# Key of readiness event in `flask.Flask.extensions`
+_EXTENSION_KEY = "foca_indexes_ready"
+
+# Fields of index descriptions that do not affect the index
+_IGNORED_INDEX_FIELDS = frozenset({"background", "key", "name", "ns", "v"})
+
+# Fields of text index descriptions that are set by MongoDB
+_TEXT_INDEX_FIELDS = frozenset({
+    "default_language", "language_override", "weights",
+})
+
 
 def register_mongodb(
     app: Flask,
@@ -18,6 +85,16 @@ def register_mongodb(
     """Register MongoDB databases and collections with Flask application
     instance.
 
+    Indexes of different collections are built concurrently. If
+    ``index_background`` is set, indexes are built in a background thread,
+    and requests are answered with ``503 Service Unavailable`` until all
+    indexes are built (cf. :py:func:`indexes_ready`). Unless disabled, the
+    durations of all commands are recorded in the shared metrics registry
+    and slow commands are logged (cf.
+    :py:class:`foca.database.monitoring.CommandMonitor`). Document caches
+    of collections with ``watch`` set are cleared whenever the collection
+    changes (cf. :py:class:`foca.database.change_streams.ChangeStreamWatcher`).
+
     Args:
         app: Flask application instance.
         conf: :py:class:`foca.models.config.MongoConfig` instance describing
@@ -27,48 +104,352 @@ def register_mongodb(
         Flask application instance with registered MongoDB databases and
         collections.
     """
+    jobs: List[Tuple[Collection, List[IndexConfig]]] = []
+
     # Iterate over databases
     if conf.dbs is not None:
         for db_name, db_conf in conf.dbs.items():
 
-            # Instantiate PyMongo client
-            mongo = _create_mongo_client(
+            # Add database
+            db_conf.client = _get_database(
                 app=app,
-                host=conf.host,
-                port=conf.port,
+                conf=conf,
                 db=db_name,
+                db_conf=db_conf,
             )
 
-            # Add database
-            db_conf.client = mongo.db
-
             # Add collections
             if db_conf.collections is not None and db_conf.client is not None:
                 for coll_name, coll_conf in db_conf.collections.items():
 
-                    coll_conf.client = db_conf.client[coll_name]
+                    coll_conf.client = _get_collection(
+                        db=db_conf.client,
+                        name=coll_name,
+                        coll_conf=coll_conf,
+                    )
                     logger.info(
                         f"Added database collection '{coll_name}'."
                     )
 
-                    # Add indexes
+                    # Watch changes of cached collections
+                    if (
+                        isinstance(coll_conf.client, CachedCollection)
+                        and coll_conf.cache is not None
+                        and coll_conf.cache.watch
+                    ):
+                        _watch_collection(
+                            app=app,
+                            collection=coll_conf.client,
+                            poll_interval=coll_conf.cache.poll_interval,
+                        )
+
+                    # Collect indexes
                     if (
                         coll_conf.indexes is not None
                         and coll_conf.client is not None
                     ):
-                        # Remove already created indexes if any
-                        coll_conf.client.drop_indexes()
-                        for index in coll_conf.indexes:
-                            if index.keys is not None:
-                                coll_conf.client.create_index(
-                                    index.keys, **index.options)
-                        logger.info(
-                            f"Indexes created for collection '{coll_name}'."
-                        )
+                        jobs.append((coll_conf.client, coll_conf.indexes))
+
+    # Add indexes
+    if jobs:
+        if conf.index_background:
+            _build_indexes_in_background(app=app, conf=conf, jobs=jobs)
+        else:
+            build_indexes(
+                jobs=jobs,
+                mode=conf.index_mode,
+                workers=conf.index_workers,
+            )
 
     return conf
 
 
+def build_indexes(
+    jobs: Sequence[Tuple[Collection, List[IndexConfig]]],
+    mode: IndexModeEnum = IndexModeEnum.reconcile,
+    workers: int = 4,
+) -> None:
+    """Build indexes of collections concurrently.
+
+    Args:
+        jobs: Tuples of collection and its configured indexes.
+        mode: How configured indexes are synchronized with existing ones.
+        workers: Maximum number of collections whose indexes are built
+            concurrently.
+
+    Raises:
+        pymongo.errors.PyMongoError: Indexes of a collection could not be
+            built; indexes of all other collections are built regardless.
+    """
+    if not jobs:
+        return
+    with ThreadPoolExecutor(
+        max_workers=min(workers, len(jobs)),
+        thread_name_prefix="foca-indexes",
+    ) as executor:
+        futures = [
+            executor.submit(
+                _build_collection_indexes,
+                collection,
+                indexes,
+                mode,
+            ) for collection, indexes in jobs
+        ]
+    for future in futures:
+        exc = future.exception()
+        if exc is not None:
+            raise exc
+
+
+def indexes_ready(app: Flask) -> bool:
+    """Check whether indexes built in the background are ready.
+
+    Can be used, e.g., in readiness probes of services with
+    ``index_background`` set (cf.
+    :py:class:`foca.models.config.MongoConfig`).
+
+    Args:
+        app: Flask application instance.
+
+    Returns:
+        ``False`` while indexes are being built in the background, ``True``
+        otherwise.
+    """
+    ready = app.extensions.get(_EXTENSION_KEY)
+    return ready is None or ready.is_set()
+
+
+def _build_indexes_in_background(
+    app: Flask,
+    conf: MongoConfig,
+    jobs: Sequence[Tuple[Collection, List[IndexConfig]]],
+) -> None:
+    """Build indexes in a background thread and reject requests until done.
+
+    Args:
+        app: Flask application instance.
+        conf: MongoDB configuration.
+        jobs: Tuples of collection and its configured indexes.
+    """
+    ready = Event()
+    app.extensions[_EXTENSION_KEY] = ready
+
+    def _build() -> None:
+        try:
+            build_indexes(
+                jobs=jobs,
+                mode=conf.index_mode,
+                workers=conf.index_workers,
+            )
+            logger.info("Indexes built in background.")
+        except Exception:
+            logger.exception("Building indexes in background failed.")
+        finally:
+            ready.set()
+
+    @app.before_request
+    def _check_indexes_ready() -> None:
+        if not ready.is_set():
+            raise ServiceUnavailable("Database indexes are being built.")
+
+    Thread(target=_build, name="foca-indexes", daemon=True).start()
+    logger.info("Building indexes in background.")
+
+
+def _build_collection_indexes(
+    collection: Collection,
+    indexes: List[IndexConfig],
+    mode: IndexModeEnum,
+) -> None:
+    """Build indexes of a single collection.
+
+    Args:
+        collection: MongoDB collection.
+        indexes: Configured indexes of `collection`.
+        mode: How configured indexes are synchronized with existing ones.
+    """
+    if mode is not IndexModeEnum.recreate:
+        reconcile_indexes(
+            collection=collection,
+            indexes=indexes,
+            dry_run=mode is IndexModeEnum.dry_run,
+        )
+        return
+    # Remove already created indexes if any
+    collection.drop_indexes()
+    models = [
+        IndexModel(index.keys, **index.options)
+        for index in indexes if index.keys is not None
+    ]
+    if models:
+        collection.create_indexes(models)
+    logger.info(f"Indexes created for collection '{collection.name}'.")
+
+
+class IndexReport(NamedTuple):
+    """Changes to the indexes of a collection, cf.
+    :py:func:`reconcile_indexes`.
+
+    Attributes:
+        created: Names of indexes that were (or, in a dry run, would be)
+            created, including changed indexes.
+        dropped: Names of indexes that were (or, in a dry run, would be)
+            dropped, including changed indexes.
+        unchanged: Names of indexes that were kept.
+    """
+    created: List[str]
+    dropped: List[str]
+    unchanged: List[str]
+
+
+def reconcile_indexes(
+    collection: Collection,
+    indexes: List[IndexConfig],
+    dry_run: bool = False,
+) -> IndexReport:
+    """Synchronize indexes of collection with configured indexes.
+
+    Existing indexes are compared with the configured ones by name (as
+    passed via the ``name`` option or as derived from the index keys by
+    MongoDB), keys and options. Only configured indexes that are missing are
+    created; existing indexes that differ from their configuration or that
+    are not configured are dropped (changed indexes are recreated). The
+    default index on ``_id`` is always kept. Thus, unlike dropping and
+    recreating all indexes, restarting an app does not trigger index builds
+    unless the configuration changed.
+
+    Args:
+        collection: MongoDB collection whose indexes are to be synchronized.
+        indexes: Configured indexes; indexes without keys are ignored.
+        dry_run: Only determine and log changes, without applying them.
+
+    Returns:
+        Changes that were (or, in a dry run, would be) applied.
+    """
+    configured: Dict[str, Tuple[Any, Dict]] = {}
+    for index in indexes:
+        if index.keys is None:
+            continue
+        keys = _normalize_keys(index.keys)
+        name = index.options.get("name") or "_".join(
+            f"{field}_{direction}" for field, direction in keys
+        )
+        configured[name] = (keys, index.options)
+
+    dropped: List[str] = []
+    unchanged: List[str] = []
+    for existing in collection.list_indexes():
+        name = existing["name"]
+        if name == "_id_":
+            continue
+        if name in configured and _is_index_unchanged(
+            existing,
+            *configured[name],
+        ):
+            unchanged.append(name)
+        else:
+            dropped.append(name)
+    created = [name for name in configured if name not in unchanged]
+
+    report = IndexReport(created=created, dropped=dropped, unchanged=unchanged)
+    prefix = "Dry run: " if dry_run else ""
+    logger.info(
+        f"{prefix}Indexes of collection '{collection.name}': "
+        f"created {created}, dropped {dropped}, unchanged {unchanged}."
+    )
+    if dry_run:
+        return report
+    # Drop first, so that recreated indexes do not conflict with old ones
+    for name in dropped:
+        collection.drop_index(name)
+    if created:
+        collection.create_indexes([
+            IndexModel(configured[name][0], **configured[name][1])
+            for name in created
+        ])
+    return report
+
+
+def _normalize_keys(keys: Any) -> List[Tuple[str, Any]]:
+    """Normalize index keys.
+
+    Args:
+        keys: Index keys, as list of field-direction tuples or mapping.
+
+    Returns:
+        List of field-direction tuples, with integral directions as integers.
+    """
+    items = keys.items() if isinstance(keys, dict) else keys
+    return [
+        (
+            field,
+            int(direction) if isinstance(direction, float) else direction,
+        ) for field, direction in items
+    ]
+
+
+def _is_index_unchanged(
+    existing: Mapping[str, Any],
+    keys: List[Tuple[str, Any]],
+    options: Dict,
+) -> bool:
+    """Compare existing index with its configuration.
+
+    Options with value ``False`` are not stored by MongoDB and are thus
+    ignored, as are options that do not affect the index (e.g.,
+    ``background``). For options whose values are documents (e.g.,
+    ``collation``), values added by MongoDB are ignored. The keys of text
+    indexes are not compared, as MongoDB stores them in a different form,
+    and neither are their language and weight settings, unless configured.
+
+    Args:
+        existing: Index description returned by MongoDB.
+        keys: Configured index keys.
+        options: Configured index options.
+
+    Returns:
+        Whether the existing index matches its configuration.
+    """
+    text = any(direction == "text" for _, direction in keys)
+    if not text and _normalize_keys(existing["key"].items()) != keys:
+        return False
+    ignored = _IGNORED_INDEX_FIELDS
+    if text:
+        ignored = ignored | (_TEXT_INDEX_FIELDS - set(options))
+    actual = {
+        field: value for field, value in existing.items()
+        if field not in ignored and not field.endswith("IndexVersion")
+    }
+    wanted = {
+        field: value for field, value in options.items()
+        if field not in _IGNORED_INDEX_FIELDS and value is not False
+    }
+    if set(actual) != set(wanted):
+        return False
+    return all(
+        _is_subset(wanted[field], actual[field]) for field in wanted
+    )
+
+
+def _is_subset(wanted: Any, actual: Any) -> bool:
+    """Check whether configured option value matches stored value.
+
+    Args:
+        wanted: Configured value.
+        actual: Value stored by MongoDB.
+
+    Returns:
+        Whether values are equal or, for documents, whether all configured
+        fields are equal.
+    """
+    if isinstance(wanted, dict) and isinstance(actual, dict):
+        return all(
+            field in actual and _is_subset(value, actual[field])
+            for field, value in wanted.items()
+        )
+    return wanted == actual
+
+
 def add_new_database(
     app: Flask,
     conf: MongoConfig,
@@ -85,43 +466,260 @@ def add_new_database(
             new databases configuration to be registered with `app`.
         db_name: Name of the database being added.
     """
-    # Instantiate PyMongo client
-    mongo = _create_mongo_client(
+    # Add database
+    db_conf.client = _get_database(
         app=app,
-        host=conf.host,
-        port=conf.port,
+        conf=conf,
         db=db_name,
+        db_conf=db_conf,
     )
 
-    # Add database
-    db_conf.client = mongo.db
-
     # Add collections
     if db_conf.collections is not None and db_conf.client is not None:
         for coll_name, coll_conf in db_conf.collections.items():
 
-            coll_conf.client = db_conf.client[coll_name]
+            coll_conf.client = _get_collection(
+                db=db_conf.client,
+                name=coll_name,
+                coll_conf=coll_conf,
+            )
             logger.info(
                 f"Added database collection '{coll_name}'."
             )
 
 
-def _create_mongo_client(
-        app: Flask,
-        host: str = 'mongodb',
-        port: int = 27017,
-        db: str = 'database',
-) -> PyMongo:
-    """Create MongoDB client for Flask application instance.
+def get_mongo_client(app: Flask, conf: MongoConfig) -> MongoClient:
+    """Get MongoDB client shared by all databases of a cluster, creating it
+    if necessary.
 
     Args:
         app: Flask application instance.
+        conf: :py:class:`foca.models.config.MongoConfig` instance describing
+            the cluster and the options of the client.
+
+    Returns:
+        MongoDB client; one client, with a single connection pool, is
+        created per app and cluster URI.
+    """
+    uri = _get_mongo_uri(host=conf.host, port=conf.port, hosts=conf.hosts)
+    clients: Dict[str, MongoClient] = app.extensions.setdefault(
+        _CLIENTS_EXTENSION_KEY, {}
+    )
+    if uri not in clients:
+        clients[uri] = _create_mongo_client(
+            app=app,
+            host=conf.host,
+            port=conf.port,
+            hosts=conf.hosts,
+            **_get_client_options(conf),
+            event_listeners=_get_event_listeners(conf),
+        ).cx
+    return clients[uri]
+
+
+def _get_database(
+    app: Flask,
+    conf: MongoConfig,
+    db: str,
+    db_conf: DBConfig,
+) -> Database:
+    """Get database from shared MongoDB client.
+
+    Args:
+        app: Flask application instance.
+        conf: :py:class:`foca.models.config.MongoConfig` instance describing
+            the cluster and the options of the client.
+        db: Name of database to be accessed/created; overridden by the
+            ``MONGO_DBNAME`` environment variable, if set.
+        db_conf: :py:class:`foca.models.config.DBConfig` instance describing
+            the database.
+
+    Returns:
+        MongoDB database, with the configured read preference, read concern
+        and write concern.
+    """
+    client = get_mongo_client(app=app, conf=conf)
+    return client.get_database(
+        os.environ.get('MONGO_DBNAME', db),
+        **_get_concern_options(db_conf),
+    )
+
+
+def _get_collection(
+    db: Database,
+    name: str,
+    coll_conf: CollectionConfig,
+) -> Collection:
+    """Get collection of database.
+
+    Args:
+        db: MongoDB database.
+        name: Name of collection to be accessed/created.
+        coll_conf: :py:class:`foca.models.config.CollectionConfig` instance
+            describing the collection.
+
+    Returns:
+        MongoDB collection, with the configured read preference, read
+        concern and write concern; settings that are not configured are
+        inherited from the database. If a document cache is configured, the
+        collection is wrapped in a
+        :py:class:`foca.database.document_cache.CachedCollection`.
+    """
+    collection = db.get_collection(name, **_get_concern_options(coll_conf))
+    if coll_conf.cache is not None:
+        collection = CachedCollection(collection, coll_conf.cache)
+    return collection
+
+
+def _watch_collection(
+    app: Flask,
+    collection: CachedCollection,
+    poll_interval: float,
+) -> None:
+    """Clear document cache of collection whenever it is changed.
+
+    Args:
+        app: Flask application instance.
+        collection: Collection with document cache.
+        poll_interval: Interval, in seconds, at which the cache is cleared
+            if the server does not support change streams.
+    """
+    watcher = get_change_stream_watcher(
+        app=app,
+        collection=collection,
+        poll_interval=poll_interval,
+    )
+    watcher.subscribe(lambda change: collection.invalidate())
+    watcher.start()
+
+
+def _get_client_options(conf: MongoConfig) -> Dict[str, Any]:
+    """Map connection configuration to MongoDB client options.
+
+    Args:
+        conf: :py:class:`foca.models.config.MongoConfig` instance describing
+            the cluster and the options of the client.
+
+    Returns:
+        Keyword arguments for :py:class:`pymongo.mongo_client.MongoClient`;
+        options that are not set are omitted.
+    """
+    options = {
+        _CLIENT_OPTIONS[field]: value
+        for field, value in conf.connection.model_dump().items()
+        if value is not None
+    }
+    if "compressors" in options:
+        options["compressors"] = ",".join(options["compressors"])
+    if conf.replica_set is not None:
+        options["replicaSet"] = conf.replica_set
+    if "authSource" not in options:
+        auth_source = _get_auth_source(conf)
+        if auth_source is not None:
+            options["authSource"] = auth_source
+    return options
+
+
+def _get_auth_source(conf: MongoConfig) -> Optional[str]:
+    """Get database against which credentials are authenticated, if not
+    configured explicitly.
+
+    The URI of the shared client does not name a database, so that MongoDB
+    would authenticate against ``admin``. To keep authenticating against the
+    database that credentials were created for, the database given via the
+    ``MONGO_DBNAME`` environment variable or, otherwise, the only configured
+    database is used.
+
+    Args:
+        conf: :py:class:`foca.models.config.MongoConfig` instance describing
+            the cluster and its databases.
+
+    Returns:
+        Name of database, or ``None`` if no credentials are given or if the
+        database is ambiguous.
+    """
+    if not os.environ.get('MONGO_USERNAME'):
+        return None
+    if os.environ.get('MONGO_DBNAME'):
+        return os.environ['MONGO_DBNAME']
+    dbs = list(conf.dbs or {})
+    if len(dbs) == 1:
+        return dbs[0]
+    if len(dbs) > 1:
+        logger.warning(
+            "Multiple databases configured; authenticating against 'admin'. "
+            "Set 'db.connection.auth_source' to authenticate against another "
+            "database."
+        )
+    return None
+
+
+def _get_event_listeners(conf: MongoConfig) -> List[CommandListener]:
+    """Create listeners for MongoDB client events.
+
+    Args:
+        conf: :py:class:`foca.models.config.MongoConfig` instance describing
+            the cluster and the options of the client.
+
+    Returns:
+        Command listener recording command metrics and logging slow
+        commands, if monitoring is enabled; cf.
+        :py:class:`foca.database.monitoring.CommandMonitor`.
+    """
+    if not conf.monitoring.enabled:
+        return []
+    return [CommandMonitor(conf.monitoring)]
+
+
+def _get_concern_options(
+    conf: Union[CollectionConfig, DBConfig],
+) -> Dict[str, Any]:
+    """Map read preference, read concern and write concern configuration to
+    options of MongoDB databases or collections.
+
+    Args:
+        conf: Database or collection configuration.
+
+    Returns:
+        Keyword arguments for
+        :py:meth:`pymongo.mongo_client.MongoClient.get_database` or
+        :py:meth:`pymongo.database.Database.get_collection`; options that
+        are not set are omitted.
+    """
+    options: Dict[str, Any] = {}
+    if conf.read_preference is not None:
+        options["read_preference"] = getattr(
+            ReadPreference,
+            _READ_PREFERENCES[conf.read_preference],
+        )
+    if conf.read_concern is not None:
+        options["read_concern"] = ReadConcern(conf.read_concern.value)
+    if conf.write_concern is not None:
+        options["write_concern"] = WriteConcern(
+            **conf.write_concern.model_dump(exclude_none=True)
+        )
+    return options
+
+
+def _get_mongo_uri(
+    host: str = 'mongodb',
+    port: int = 27017,
+    db: Optional[str] = None,
+    hosts: Optional[List[str]] = None,
+) -> str:
+    """Build MongoDB URI, including credentials from environment variables.
+
+    Args:
         host: Host at which MongoDB database is exposed.
         port: Port at which MongoDB database is exposed.
-        db: Name of database to be accessed/created.
+        db: Name of database to be accessed/created; if ``None``, the URI
+            does not specify a database.
+        hosts: Seed list of cluster members, as ``host`` or ``host:port``;
+            if set, `host` and `port` are ignored, unless the ``MONGO_HOST``
+            environment variable is set.
 
     Returns:
-        MongoDB client for Flask application instance.
+        MongoDB URI.
     """
     auth = ''
     user = os.environ.get('MONGO_USERNAME')
@@ -130,23 +728,73 @@ def _create_mongo_client(
             username=os.environ.get('MONGO_USERNAME'),
             password=os.environ.get('MONGO_PASSWORD'),
         )
+    return 'mongodb://{auth}{seeds}/{db}'.format(
+        seeds=_get_seeds(host=host, port=port, hosts=hosts),
+        db=os.environ.get('MONGO_DBNAME', db) if db is not None else '',
+        auth=auth
+    )
+
+
+def _get_seeds(
+    host: str = 'mongodb',
+    port: int = 27017,
+    hosts: Optional[List[str]] = None,
+) -> str:
+    """Get seed list of MongoDB URI.
+
+    Args:
+        host: Host at which MongoDB database is exposed.
+        port: Port at which MongoDB database is exposed.
+        hosts: Seed list of cluster members, as ``host`` or ``host:port``;
+            if set, `host` and `port` are ignored, unless the ``MONGO_HOST``
+            environment variable is set.
 
-    app.config['MONGO_URI'] = 'mongodb://{auth}{host}:{port}/{db}'.format(
+    Returns:
+        Comma-separated seed list.
+    """
+    if hosts and 'MONGO_HOST' not in os.environ:
+        return ','.join(hosts)
+    return '{host}:{port}'.format(
         host=os.environ.get('MONGO_HOST', host),
         port=os.environ.get('MONGO_PORT', port),
-        db=os.environ.get('MONGO_DBNAME', db),
-        auth=auth
     )
 
-    mongo = PyMongo(app)
+
+def _create_mongo_client(
+        app: Flask,
+        host: str = 'mongodb',
+        port: int = 27017,
+        db: Optional[str] = None,
+        hosts: Optional[List[str]] = None,
+        **options,
+) -> PyMongo:
+    """Create MongoDB client for Flask application instance.
+
+    Args:
+        app: Flask application instance.
+        host: Host at which MongoDB database is exposed.
+        port: Port at which MongoDB database is exposed.
+        db: Name of database to be accessed/created; if ``None``, no default
+            database is set.
+        hosts: Seed list of cluster members, as ``host`` or ``host:port``;
+            if set, `host` and `port` are ignored, unless the ``MONGO_HOST``
+            environment variable is set.
+        **options: Options passed to
+            :py:class:`pymongo.mongo_client.MongoClient`.
+
+    Returns:
+        MongoDB client for Flask application instance.
+    """
+    app.config['MONGO_URI'] = _get_mongo_uri(
+        host=host,
+        port=port,
+        db=db,
+        hosts=hosts,
+    )
+
+    mongo = PyMongo(app, **options)
+    seeds = _get_seeds(host=host, port=port, hosts=hosts)
     logger.info(
-        (
-            "Registered database '{db}' at URI '{host}':'{port}' with Flask "
-            'application.'
-        ).format(
-            db=os.environ.get('MONGO_DBNAME', db),
-            host=os.environ.get('MONGO_HOST', host),
-            port=os.environ.get('MONGO_PORT', port)
-        )
+        f"Registered MongoDB client at '{seeds}' with Flask application."
     )
     return mongo
@@ -20,6 +20,7 @@ from werkzeug.exceptions import (
     GatewayTimeout,
     InternalServerError,
     NotFound,
+    PreconditionFailed,
     ServiceUnavailable,
 )
 
@@ -58,6 +59,10 @@ exceptions = {
         "title": "Not Found",
         "status": 404,
     },
+    PreconditionFailed: {
+        "title": "Precondition Failed",
+        "status": 412,
+    },
     InternalServerError: {
         "title": "Internal Server Error",
         "status": 500,
@@ -1,11 +1,12 @@
 """Factory for creating and configuring Celery application instances."""
 
-from inspect import stack
 import logging
 
 from flask import Flask
 from celery import Celery
 
+from foca.utils.misc import get_caller
+
 # Get logger instance
 logger = logging.getLogger(__name__)
 
@@ -28,8 +29,8 @@ def create_celery_app(app: Flask) -> Celery:
         backend=conf.backend,
         include=conf.include,
     )
-    calling_module = ':'.join([stack()[1].filename, stack()[1].function])
-    logger.debug(f"Celery app created from '{calling_module}'.")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Celery app created from '{get_caller()}'.")
 
     # Update Celery app configuration with Flask app configuration
     setattr(celery.conf, 'foca', app.config.foca)  # type: ignore[attr-defined]
@@ -1,12 +1,12 @@
 """Factory for creating and configuring Connexion application instances."""
 
-from inspect import stack
 import logging
 from typing import Optional
 
 from connexion import App
 
 from foca.models.config import Config
+from foca.utils.misc import get_caller
 
 # Get logger instance
 logger = logging.getLogger(__name__)
@@ -27,8 +27,8 @@ def create_connexion_app(config: Optional[Config] = None) -> App:
         skip_error_handlers=True,
     )
 
-    calling_module = ':'.join([stack()[1].filename, stack()[1].function])
-    logger.debug(f"Connexion app created from '{calling_module}'.")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Connexion app created from '{get_caller()}'.")
 
     # Configure Connexion app
     if config is not None:
@@ -66,9 +66,15 @@ def __add_config_to_connexion_app(
     app.app.config['ENV'] = conf.environment
     app.app.config['TESTING'] = conf.testing
 
-    logger.debug('Flask app settings:')
-    for (key, value) in app.app.config.items():
-        logger.debug('* {}: {}'.format(key, value))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Flask app settings:')
+        for (key, value) in app.app.config.items():
+            logger.debug('* {}: {}'.format(key, value))
+
+    # Compress responses
+    if conf.compression.enabled:
+        from foca.api.compression import register_compression
+        register_compression(app=app.app, conf=conf.compression)
 
     # Add user configuration to Flask app config
     setattr(app.app.config, 'foca', config)
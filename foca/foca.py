@@ -1,15 +1,13 @@
 """Class for setting up and initializing a FOCA-based microservice."""
 
 import logging
+import os
 from pathlib import Path
-from typing import Optional
+from time import perf_counter
+from typing import (Optional, TYPE_CHECKING)
 
-from celery import Celery
 from connexion import App
 
-from foca.security.access_control.register_access_control import (
-    register_access_control,
-)
 from foca.security.access_control.constants import (
     DEFAULT_SPEC_CONTROLLER,
     DEFAULT_ACCESS_CONTROL_DB_NAME,
@@ -17,11 +15,16 @@ from foca.security.access_control.constants import (
 )
 from foca.api.register_openapi import register_openapi
 from foca.config.config_parser import ConfigParser
-from foca.database.register_mongodb import register_mongodb
+from foca.config.config_reloader import ConfigReloader
 from foca.errors.exceptions import register_exception_handler
 from foca.factories.connexion_app import create_connexion_app
-from foca.factories.celery_app import create_celery_app
-from foca.security.cors import enable_cors
+from foca.utils.profiling import StartupProfiler
+
+# Optional subsystems (CORS, database, access control, background tasks) are
+# imported only when configured, to keep the import time of FOCA-based
+# services and tools low
+if TYPE_CHECKING:
+    from celery import Celery
 
 # Get logger instance
 logger = logging.getLogger(__name__)
@@ -68,16 +71,29 @@ class Foca:
                 write/modify their app configuration.
             conf: App configuration. Instance of
                 :py:class:`foca.models.config.Config`.
+            config_reloader: Watcher applying changes to the configuration
+                file at runtime; set by :py:meth:`create_app` if enabled in
+                the configuration. Instance of
+                :py:class:`foca.config.config_reloader.ConfigReloader`.
+            profiler: Profiler for the app startup phases. Instance of
+                :py:class:`foca.utils.profiling.StartupProfiler`; enabled via
+                the ``profiling`` section of the configuration or the
+                environment variables ``FOCA_PROFILE_STARTUP`` and
+                ``FOCA_PROFILE_STARTUP_OUTPUT``.
         """
         self.config_file: Optional[Path] = (
             Path(config_file) if config_file is not None else None
         )
         self.custom_config_model: Optional[str] = custom_config_model
+        start = perf_counter()
         self.conf = ConfigParser(
             config_file=self.config_file,
             custom_config_model=self.custom_config_model,
             format_logs=True,
         ).config
+        self.config_reloader: Optional[ConfigReloader] = None
+        self.profiler: StartupProfiler = self._create_profiler()
+        self.profiler.record("parse_config", perf_counter() - start)
         logger.info("Log formatting configured.")
         if self.config_file is not None:
             logger.info(f"Configuration file '{self.config_file}' parsed.")
@@ -91,36 +107,54 @@ class Foca:
             Connexion application instance.
         """
         # Create Connexion app
-        cnx_app = create_connexion_app(self.conf)
+        with self.profiler.phase("create_connexion_app"):
+            cnx_app = create_connexion_app(self.conf)
         logger.info("Connexion app created.")
 
         # Register error handlers
-        cnx_app = register_exception_handler(cnx_app)
+        with self.profiler.phase("register_exception_handler"):
+            cnx_app = register_exception_handler(cnx_app)
         logger.info("Error handler registered.")
 
         # Enable cross-origin resource sharing
         if self.conf.security.cors.enabled is True:
-            enable_cors(cnx_app.app)
+            with self.profiler.phase("enable_cors"):
+                from foca.security.cors import enable_cors
+                enable_cors(cnx_app.app)
             logger.info("CORS enabled.")
         else:
             logger.info("CORS not enabled.")
 
         # Register OpenAPI specs
         if self.conf.api.specs:
-            cnx_app = register_openapi(
-                app=cnx_app,
-                specs=self.conf.api.specs,
-            )
+            with self.profiler.phase("register_openapi"):
+                cnx_app = register_openapi(
+                    app=cnx_app,
+                    specs=self.conf.api.specs,
+                    workers=self.conf.api.workers,
+                    response_cache=self.conf.api.response_cache,
+                )
         else:
             logger.info("No OpenAPI specifications provided.")
 
         # Register MongoDB
         if self.conf.db:
-            cnx_app.app.config.foca.db = register_mongodb(
-                app=cnx_app.app,
-                conf=self.conf.db,
-            )
+            with self.profiler.phase("register_mongodb"):
+                from foca.database.register_mongodb import register_mongodb
+                cnx_app.app.config.foca.db = register_mongodb(
+                    app=cnx_app.app,
+                    conf=self.conf.db,
+                )
             logger.info("Database registered.")
+            if self.conf.db.async_clients:
+                from foca.database.register_async_mongodb import (
+                    register_async_mongodb,
+                )
+                cnx_app.app.config.foca.db = register_async_mongodb(
+                    app=cnx_app.app,
+                    conf=self.conf.db,
+                )
+                logger.info("Asynchronous database handles registered.")
         else:
             logger.info("No database support configured.")
 
@@ -144,11 +178,14 @@ class Foca:
                     DEFAULT_ACESS_CONTROL_COLLECTION_NAME
                 )
 
-            cnx_app = register_access_control(
-                cnx_app=cnx_app,
-                mongo_config=self.conf.db,
-                access_control_config=self.conf.security.access_control,
-            )
+            with self.profiler.phase("register_access_control"):
+                from foca.security.access_control.register_access_control \
+                    import register_access_control
+                cnx_app = register_access_control(
+                    cnx_app=cnx_app,
+                    mongo_config=self.conf.db,
+                    access_control_config=self.conf.security.access_control,
+                )
         else:
             if (
                 self.conf.security.access_control.api_specs
@@ -158,9 +195,40 @@ class Foca:
                     "Please enable security config to register access control."
                 )
 
+        # Watch configuration file for changes
+        if self.conf.reload.enabled and self.config_file is not None:
+            self.config_reloader = ConfigReloader(
+                app=cnx_app.app,
+                config_file=self.config_file,
+                custom_config_model=self.custom_config_model,
+                interval=self.conf.reload.interval,
+            )
+            self.config_reloader.start()
+            logger.info("Configuration reload enabled.")
+
+        # Report startup profile
+        self.profiler.finish()
+
         return cnx_app
 
-    def create_celery_app(self) -> Celery:
+    def _create_profiler(self) -> StartupProfiler:
+        """Create startup profiler as per configuration and environment.
+
+        Returns:
+            Startup profiler.
+        """
+        conf = self.conf.profiling
+        enabled = conf.enabled
+        env_enabled = os.environ.get("FOCA_PROFILE_STARTUP")
+        if env_enabled is not None and env_enabled != "":
+            enabled = env_enabled.lower() in ("1", "true", "yes", "on")
+        output = conf.output
+        env_output = os.environ.get("FOCA_PROFILE_STARTUP_OUTPUT")
+        if env_output is not None and env_output != "":
+            output = Path(env_output)
+        return StartupProfiler(enabled=enabled, output=output)
+
+    def create_celery_app(self) -> "Celery":
         """Set up and initialize FOCA-based Celery app.
 
         Returns:
@@ -176,6 +244,7 @@ class Foca:
 
         # Register MongoDB
         if self.conf.db:
+            from foca.database.register_mongodb import register_mongodb
             cnx_app.app.config.foca.db = register_mongodb(
                 app=cnx_app.app,
                 conf=self.conf.db,
@@ -186,6 +255,7 @@ class Foca:
 
         # Create Celery app
         if self.conf.jobs:
+            from foca.factories.celery_app import create_celery_app
             celery_app = create_celery_app(cnx_app.app)
             logger.info("Support for background tasks set up.")
         else:
@@ -24,7 +24,6 @@ from pydantic import (
     field_validator,
     model_validator,
 )
-from pymongo import collection, database
 from typing_extensions import Self
 
 from foca.security.access_control.constants import (
@@ -52,6 +51,52 @@ def _validate_log_level_choices(cls, level: int) -> int:
     return level
 
 
+def _validate_collection_client(cls, client: Any) -> Any:
+    """Ensure that a collection client is a `pymongo` collection.
+
+    `pymongo` is only imported if a client is set, so that it need not be
+    imported for configurations without database support.
+
+    Args:
+        client: Collection client to be validated.
+
+    Returns:
+        Unmodified `client` value if validation succeeds.
+
+    Raises:
+        ValueError: Raised if validation fails.
+    """
+    if client is not None:
+        from pymongo.collection import Collection
+        if not isinstance(client, Collection):
+            raise ValueError(f"not a pymongo collection: {client}")
+
+    return client
+
+
+def _validate_database_client(cls, client: Any) -> Any:
+    """Ensure that a database client is a `pymongo` database.
+
+    `pymongo` is only imported if a client is set, so that it need not be
+    imported for configurations without database support.
+
+    Args:
+        client: Database client to be validated.
+
+    Returns:
+        Unmodified `client` value if validation succeeds.
+
+    Raises:
+        ValueError: Raised if validation fails.
+    """
+    if client is not None:
+        from pymongo.database import Database
+        if not isinstance(client, Database):
+            raise ValueError(f"not a pymongo database: {client}")
+
+    return client
+
+
 def _get_by_path(
     obj: Dict,
     key_sequence: List[str]
@@ -111,6 +156,73 @@ class ValidationChecksEnum(Enum):
     any = "any"
 
 
+class CompressionAlgorithmEnum(Enum):
+    """Enumerator for supported response compression algorithms.
+
+    Attributes:
+        br: Brotli; requires the optional dependency ``brotli``.
+        gzip: Gzip.
+        zstd: Zstandard; requires the optional dependency ``zstandard``.
+    """
+    br = "br"
+    gzip = "gzip"
+    zstd = "zstd"
+
+
+class IndexModeEnum(Enum):
+    """Enumerator for modes of synchronizing configured MongoDB indexes with
+    existing ones on startup.
+
+    Attributes:
+        dry_run: Changes required to reconcile indexes are logged, but not
+            applied.
+        reconcile: Missing indexes are created, and changed or unconfigured
+            indexes are dropped; unchanged indexes are kept.
+        recreate: All indexes are dropped and recreated.
+    """
+    dry_run = "dry_run"
+    reconcile = "reconcile"
+    recreate = "recreate"
+
+
+class ReadPreferenceEnum(Enum):
+    """Enumerator for MongoDB read preferences.
+
+    Attributes:
+        nearest: Read from the member with the lowest network latency.
+        primary: Read from the primary only.
+        primaryPreferred: Read from the primary, or from a secondary if the
+            primary is unavailable.
+        secondary: Read from secondaries only.
+        secondaryPreferred: Read from a secondary, or from the primary if no
+            secondary is available.
+    """
+    nearest = "nearest"
+    primary = "primary"
+    primaryPreferred = "primaryPreferred"
+    secondary = "secondary"
+    secondaryPreferred = "secondaryPreferred"
+
+
+class ReadConcernEnum(Enum):
+    """Enumerator for MongoDB read concern levels.
+
+    Attributes:
+        available: Return data from the queried member without guarantees;
+            for sharded clusters, may return orphaned documents.
+        linearizable: Return data acknowledged by a majority of members,
+            reflecting all writes acknowledged before the read started.
+        local: Return the most recent data of the queried member.
+        majority: Return data acknowledged by a majority of members.
+        snapshot: Return data from a snapshot of majority-committed data.
+    """
+    available = "available"
+    linearizable = "linearizable"
+    local = "local"
+    majority = "majority"
+    snapshot = "snapshot"
+
+
 class PymongoDirectionEnum(Enum):
     """Enumerator for supported Pymongo index directions.
 
@@ -140,6 +252,69 @@ class FOCABaseConfig(BaseModel):
     model_config = ConfigDict(extra='forbid', arbitrary_types_allowed=True)
 
 
+class CompressionConfig(FOCABaseConfig):
+    """Model for configuring the compression of responses.
+
+    Args:
+        enabled: Whether responses are compressed.
+        algorithms: Compression algorithms, in order of preference; the
+            algorithm is negotiated with each client via the
+            ``Accept-Encoding`` request header. Algorithms whose optional
+            dependencies are not installed are skipped.
+        min_size: Minimum size of response bodies to be compressed, in
+            bytes; does not apply to streamed responses.
+        mimetypes: MIME types of responses to be compressed.
+        level: Compression level; if ``None``, the default level of each
+            algorithm is used. Levels are capped at the maximum level of
+            each algorithm (9 for gzip, 11 for Brotli, 22 for Zstandard).
+
+    Attributes:
+        enabled: Whether responses are compressed.
+        algorithms: Compression algorithms, in order of preference; the
+            algorithm is negotiated with each client via the
+            ``Accept-Encoding`` request header. Algorithms whose optional
+            dependencies are not installed are skipped.
+        min_size: Minimum size of response bodies to be compressed, in
+            bytes; does not apply to streamed responses.
+        mimetypes: MIME types of responses to be compressed.
+        level: Compression level; if ``None``, the default level of each
+            algorithm is used. Levels are capped at the maximum level of
+            each algorithm (9 for gzip, 11 for Brotli, 22 for Zstandard).
+
+    Raises:
+        pydantic.ValidationError: The class was instantianted with an illegal
+            data type.
+
+    Example:
+        >>> CompressionConfig(
+        ...     enabled=True,
+        ...     algorithms=["gzip"],
+        ...     mimetypes=["application/json"],
+        ... )
+        CompressionConfig(enabled=True, algorithms=[<CompressionAlgorithmEnum.\
+gzip: 'gzip'>], min_size=500, mimetypes=['application/json'], level=None)
+    """
+    enabled: bool = False
+    algorithms: List[CompressionAlgorithmEnum] = [
+        CompressionAlgorithmEnum.br,
+        CompressionAlgorithmEnum.zstd,
+        CompressionAlgorithmEnum.gzip,
+    ]
+    min_size: int = Field(default=500, ge=0)
+    mimetypes: List[str] = [
+        "application/javascript",
+        "application/json",
+        "application/problem+json",
+        "application/xml",
+        "image/svg+xml",
+        "text/css",
+        "text/html",
+        "text/javascript",
+        "text/plain",
+    ]
+    level: Optional[int] = Field(default=None, ge=1)
+
+
 class ServerConfig(FOCABaseConfig):
     """Model for configuration parameters to set up a Flask or Connexion
     app instance.
@@ -159,6 +334,7 @@ class ServerConfig(FOCABaseConfig):
             ``debug=True``, enabling this will allow the server to reload
             automatically on code changes. See Flask documentation for more
             details.
+        compression: Configuration of the compression of responses.
 
     Attributes:
         host: Host at which the application is exposed.
@@ -175,6 +351,7 @@ class ServerConfig(FOCABaseConfig):
             ``debug=True``, enabling this will allow the server to reload
             automatically on code changes. See Flask documentation for more
             details.
+        compression: Configuration of the compression of responses.
 
     Raises:
         pydantic.ValidationError: The class was instantianted with an illegal
@@ -190,7 +367,12 @@ class ServerConfig(FOCABaseConfig):
         ...     use_reloader=True,
         ... )
         ServerConfig(host='0.0.0.0', port=8080, debug=True, environment='devel\
-opment', testing=False, use_reloader=True)
+opment', testing=False, use_reloader=True, compression=CompressionConfig(enabl\
+ed=False, algorithms=[<CompressionAlgorithmEnum.br: 'br'>, <CompressionAlgorit\
+hmEnum.zstd: 'zstd'>, <CompressionAlgorithmEnum.gzip: 'gzip'>], min_size=500, \
+mimetypes=['application/javascript', 'application/json', 'application/problem+\
+json', 'application/xml', 'image/svg+xml', 'text/css', 'text/html', 'text/java\
+script', 'text/plain'], level=None))
     """
     host: str = "0.0.0.0"
     port: int = 8080
@@ -198,6 +380,7 @@ opment', testing=False, use_reloader=True)
     environment: str = "development"
     testing: bool = False
     use_reloader: bool = True
+    compression: CompressionConfig = CompressionConfig()
 
 
 class ExceptionConfig(FOCABaseConfig):
@@ -303,11 +486,12 @@ Unauthorized'>: {'title': 'Unauthorized', 'status': 401}, <class 'connexion.ex\
 ceptions.OAuthProblem'>: {'title': 'Unauthorized', 'status': 401}, <class 'wer\
 kzeug.exceptions.Forbidden'>: {'title': 'Forbidden', 'status': 403}, <class 'w\
 erkzeug.exceptions.NotFound'>: {'title': 'Not Found', 'status': 404}, <class '\
-werkzeug.exceptions.InternalServerError'>: {'title': 'Internal Server Error', \
-'status': 500}, <class 'werkzeug.exceptions.BadGateway'>: {'title': 'Bad Gatew\
-ay', 'status': 502}, <class 'werkzeug.exceptions.ServiceUnavailable'>: {'title\
-': 'Service Unavailable', 'status': 502}, <class 'werkzeug.exceptions.GatewayT\
-imeout'>: {'title': 'Gateway Timeout', 'status': 504}})
+werkzeug.exceptions.PreconditionFailed'>: {'title': 'Precondition Failed', 'st\
+atus': 412}, <class 'werkzeug.exceptions.InternalServerError'>: {'title': 'Int\
+ernal Server Error', 'status': 500}, <class 'werkzeug.exceptions.BadGateway'>:\
+ {'title': 'Bad Gateway', 'status': 502}, <class 'werkzeug.exceptions.ServiceU\
+navailable'>: {'title': 'Service Unavailable', 'status': 502}, <class 'werkzeu\
+g.exceptions.GatewayTimeout'>: {'title': 'Gateway Timeout', 'status': 504}})
     """
     required_members: List[List[str]] = [["title"], ["status"]]
     extension_members: Union[bool, List[List[str]]] = False
@@ -460,6 +644,92 @@ imeout'>: {'title': 'Gateway Timeout', 'status': 504}})
         return self
 
 
+class ResponseValidationConfig(FOCABaseConfig):
+    """Model for sampled validation of responses against an OpenAPI 2.x or
+    3.x specification.
+
+    Args:
+        sample_rate: Fraction of responses of each operation to be validated.
+            Can be overridden for individual operations via the
+            ``x-foca-response-validation-sample-rate`` field of the Operation
+            Object.
+        fail: Whether responses that do not conform to the specification
+            are replaced by an error response. If ``False``, violations are
+            only logged and counted.
+
+    Attributes:
+        sample_rate: Fraction of responses of each operation to be validated.
+            Can be overridden for individual operations via the
+            ``x-foca-response-validation-sample-rate`` field of the Operation
+            Object.
+        fail: Whether responses that do not conform to the specification
+            are replaced by an error response. If ``False``, violations are
+            only logged and counted.
+
+    Raises:
+        pydantic.ValidationError: The class was instantianted with an illegal
+            data type.
+
+    Example:
+
+        >>> ResponseValidationConfig(sample_rate=0.01)
+        ResponseValidationConfig(sample_rate=0.01, fail=False)
+    """
+    sample_rate: float = Field(default=1.0, ge=0, le=1)
+    fail: bool = False
+
+
+class PaginationConfig(FOCABaseConfig):
+    """Model for injecting keyset pagination parameters and headers into
+    operations with an ``x-foca-paginate`` field, cf.
+    :py:func:`foca.utils.db.paginate`.
+
+    Args:
+        default_limit: Default number of items per page.
+        max_limit: Maximum number of items per page.
+        secret: Key for signing continuation tokens of the specification's
+            operations; defaults to the Flask app's ``SECRET_KEY``.
+        secret_env: Name of environment variable holding the key for signing
+            continuation tokens; takes precedence over `secret`.
+
+    Attributes:
+        default_limit: Default number of items per page.
+        max_limit: Maximum number of items per page.
+        secret: Key for signing continuation tokens of the specification's
+            operations; defaults to the Flask app's ``SECRET_KEY``.
+        secret_env: Name of environment variable holding the key for signing
+            continuation tokens; takes precedence over `secret`.
+
+    Raises:
+        pydantic.ValidationError: The class was instantianted with an illegal
+            data type.
+
+    Example:
+
+        >>> PaginationConfig(max_limit=500, secret_env="PAGE_TOKEN_SECRET")
+        PaginationConfig(default_limit=100, max_limit=500, secret=None, secret\
+_env='PAGE_TOKEN_SECRET')
+    """
+    default_limit: int = Field(default=100, ge=1)
+    max_limit: int = Field(default=1000, ge=1)
+    secret: Optional[str] = None
+    secret_env: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_default_limit(self) -> Self:
+        """Ensure that the default limit does not exceed the maximum limit.
+
+        Returns:
+            Model instance.
+
+        Raises:
+            ValueError: Default limit exceeds maximum limit.
+        """
+        if self.default_limit > self.max_limit:
+            raise ValueError("'default_limit' exceeds 'max_limit'")
+        return self
+
+
 class SpecConfig(FOCABaseConfig):
     """Model for configuration parameters for OpenAPI 2.x or 3.x specifications
     to be attached to a Connexion app.
@@ -467,10 +737,13 @@ class SpecConfig(FOCABaseConfig):
     Args:
         path: A single path or list of paths to OpenAPI 2.x or 3.x
             specification in YAML format.
-        path_out: Output path for modified specification file. Ignored if specs
-            are not modified. If not specified, the original file path is
-            stripped of the file extension and the suffix ``.modified.yaml`` is
-            appended.
+        path_out: Output path for processed specification file. If not
+            specified, the original file path is stripped of the file
+            extension and the suffix ``.modified.yaml`` is appended. The
+            processed specification is prefixed with a hash of the
+            specification files and of the settings modifying them; on
+            subsequent app starts, it is loaded directly, without parsing and
+            modifying the original files, if the hash matches.
         append: Fields to be added/modified in the root of the specification
             file. For OpenAPI 2.x, see https://swagger.io/specification/v2/.
             For OpenAPI 3.x, see https://swagger.io/specification/.
@@ -504,16 +777,50 @@ class SpecConfig(FOCABaseConfig):
             https://swagger.io/specification/v2/#securityDefinitionsObject. For
             OpenAPI 3.x, see
             https://swagger.io/docs/specification/authentication/.
+        dereference: Resolve all JSON references (``$ref``) to other parts of
+            the specification or to other local files once, when the
+            specification is processed, and pass a fully dereferenced
+            specification to Connexion. Circular references are left in
+            place and identical schemas are shared. The dereferenced
+            specification is written to `path_out`.
+        response_validation: Validate a sample of responses against the
+            specification and count violations, cf.
+            :py:class:`foca.models.config.ResponseValidationConfig`. If set,
+            response validation is enabled regardless of the
+            ``validate_responses`` setting in `connexion`.
+        compiled_validation: Compile the JSON schemas of request and response
+            bodies of each operation once into validation functions, rather
+            than interpreting them for each request and response. Requires
+            the optional dependency ``fastjsonschema``; schemas that cannot
+            be compiled, e.g., because they make use of OpenAPI-specific
+            keywords like ``nullable``, as well as all schemas if
+            ``fastjsonschema`` is not installed, are validated with cached
+            ``jsonschema`` validators.
+        etag: Add entity tags (``ETag`` header) to successful responses to
+            ``GET`` and ``HEAD`` requests and answer requests with a matching
+            ``If-None-Match`` header with ``304 Not Modified``. Can be
+            overridden for individual operations via the ``x-foca-etag``
+            field of the Operation Object, cf.
+            :py:class:`foca.api.etag.ETagResolver`.
+        pagination: Add query parameters for requesting pages (``limit``
+            and ``page_token``) and a response header announcing the next
+            page (``X-Next-Page-Token``) to operations with a truthy
+            ``x-foca-paginate`` field, unless already defined, cf.
+            :py:class:`foca.models.config.PaginationConfig` and
+            :py:func:`foca.utils.db.paginate`.
         connexion: Keyword arguments passed through to
             `connexion.apps.flask_app.add_api()`.
 
     Attributes:
         path: A single path or list of paths to OpenAPI 2.x or 3.x
             specification in YAML format.
-        path_out: Output path for modified specification file. Ignored if specs
-            are not modified. If not specified, the original file path is
-            stripped of the file extension and the suffix ``.modified.yaml`` is
-            appended.
+        path_out: Output path for processed specification file. If not
+            specified, the original file path is stripped of the file
+            extension and the suffix ``.modified.yaml`` is appended. The
+            processed specification is prefixed with a hash of the
+            specification files and of the settings modifying them; on
+            subsequent app starts, it is loaded directly, without parsing and
+            modifying the original files, if the hash matches.
         append: Fields to be added/modified in the root of the specification
             file. For OpenAPI 2.x, see https://swagger.io/specification/v2/.
             For OpenAPI 3.x, see https://swagger.io/specification/.
@@ -547,6 +854,37 @@ class SpecConfig(FOCABaseConfig):
             https://swagger.io/specification/v2/#securityDefinitionsObject. For
             OpenAPI 3.x, see
             https://swagger.io/docs/specification/authentication/.
+        dereference: Resolve all JSON references (``$ref``) to other parts of
+            the specification or to other local files once, when the
+            specification is processed, and pass a fully dereferenced
+            specification to Connexion. Circular references are left in
+            place and identical schemas are shared. The dereferenced
+            specification is written to `path_out`.
+        response_validation: Validate a sample of responses against the
+            specification and count violations, cf.
+            :py:class:`foca.models.config.ResponseValidationConfig`. If set,
+            response validation is enabled regardless of the
+            ``validate_responses`` setting in `connexion`.
+        compiled_validation: Compile the JSON schemas of request and response
+            bodies of each operation once into validation functions, rather
+            than interpreting them for each request and response. Requires
+            the optional dependency ``fastjsonschema``; schemas that cannot
+            be compiled, e.g., because they make use of OpenAPI-specific
+            keywords like ``nullable``, as well as all schemas if
+            ``fastjsonschema`` is not installed, are validated with cached
+            ``jsonschema`` validators.
+        etag: Add entity tags (``ETag`` header) to successful responses to
+            ``GET`` and ``HEAD`` requests and answer requests with a matching
+            ``If-None-Match`` header with ``304 Not Modified``. Can be
+            overridden for individual operations via the ``x-foca-etag``
+            field of the Operation Object, cf.
+            :py:class:`foca.api.etag.ETagResolver`.
+        pagination: Add query parameters for requesting pages (``limit``
+            and ``page_token``) and a response header announcing the next
+            page (``X-Next-Page-Token``) to operations with a truthy
+            ``x-foca-paginate`` field, unless already defined, cf.
+            :py:class:`foca.models.config.PaginationConfig` and
+            :py:func:`foca.utils.db.paginate`.
         connexion: Keyword arguments passed through to
             `connexion.apps.flask_app.add_api()`.
 
@@ -559,7 +897,8 @@ class SpecConfig(FOCABaseConfig):
         >>> SpecConfig(path="/my/path.yaml")
         SpecConfig(path=[PosixPath('/my/path.yaml')], path_out=PosixPath('/my/\
 path.modified.yaml'), append=None, add_operation_fields=None, add_security_fie\
-lds=None, disable_auth=False, connexion=None)
+lds=None, disable_auth=False, dereference=False, response_validation=None, com\
+piled_validation=False, etag=False, pagination=None, connexion=None)
 
         >>> SpecConfig(
         ...     path=["/path/to/specs.yaml", "/path/to/add_specs.yaml"],
@@ -594,8 +933,9 @@ lds=None, disable_auth=False, connexion=None)
 er'}}}, {'my_other_root_field': 'some_value'}], add_operation_fields={'x-swagg\
 er-router-controller': 'controllers.my_specs', 'x-some-other-custom-field': 's\
 ome_value'}, add_security_fields={'x-apikeyInfoFunc': 'security.auth.validate_\
-token', 'x-some-other-custom-field': 'some_value'}, disable_auth=False, connex\
-ion=None)
+token', 'x-some-other-custom-field': 'some_value'}, disable_auth=False, derefe\
+rence=False, response_validation=None, compiled_validation=False, etag=False, \
+pagination=None, connexion=None)
     """
     path: Union[Path, List[Path]]
     path_out: Optional[Path] = None
@@ -603,6 +943,11 @@ ion=None)
     add_operation_fields: Optional[Dict] = None
     add_security_fields: Optional[Dict] = None
     disable_auth: bool = False
+    dereference: bool = False
+    response_validation: Optional[ResponseValidationConfig] = None
+    compiled_validation: bool = False
+    etag: bool = False
+    pagination: Optional[PaginationConfig] = None
     connexion: Optional[Dict] = None
 
     @model_validator(mode="after")
@@ -629,6 +974,82 @@ ion=None)
         return self
 
 
+class OperationCacheConfig(FOCABaseConfig):
+    """Model for caching the responses of an operation, as configured via
+    the ``x-foca-cache`` field of its Operation Object.
+
+    Args:
+        ttl: Time to live of cached responses, in seconds. Defaults to the
+            time to live configured via :py:class:`ResponseCacheConfig`.
+        vary: Names of request headers whose values are part of the cache
+            key, in addition to path and query.
+        claims: Names of token claims whose values are part of the cache
+            key, so that responses are cached per user or group. Claims are
+            taken from the token info of the request, as validated by
+            Connexion (cf. :py:func:`foca.security.auth.validate_token`). If
+            empty, responses to authenticated requests are cached per token
+            subject.
+        tags: Tags of cached responses; responses are always tagged with
+            their operation identifier. Cf.
+            :py:func:`foca.api.response_cache.invalidate_response_cache`.
+
+    Attributes:
+        ttl: Time to live of cached responses, in seconds. Defaults to the
+            time to live configured via :py:class:`ResponseCacheConfig`.
+        vary: Names of request headers whose values are part of the cache
+            key, in addition to path and query.
+        claims: Names of token claims whose values are part of the cache
+            key, so that responses are cached per user or group. Claims are
+            taken from the token info of the request, as validated by
+            Connexion (cf. :py:func:`foca.security.auth.validate_token`). If
+            empty, responses to authenticated requests are cached per token
+            subject.
+        tags: Tags of cached responses; responses are always tagged with
+            their operation identifier. Cf.
+            :py:func:`foca.api.response_cache.invalidate_response_cache`.
+
+    Raises:
+        pydantic.ValidationError: The class was instantianted with an illegal
+            data type.
+
+    Example:
+
+        >>> OperationCacheConfig(ttl=30, claims=['sub'])
+        OperationCacheConfig(ttl=30.0, vary=[], claims=['sub'], tags=[])
+    """
+    ttl: Optional[float] = Field(default=None, gt=0)
+    vary: List[str] = []
+    claims: List[str] = []
+    tags: List[str] = []
+
+
+class ResponseCacheConfig(FOCABaseConfig):
+    """Model for configuring the in-memory cache of responses of operations
+    with an ``x-foca-cache`` field.
+
+    Args:
+        max_entries: Maximum number of cached responses, across all
+            operations; least recently used responses are evicted first.
+        ttl: Default time to live of cached responses, in seconds.
+
+    Attributes:
+        max_entries: Maximum number of cached responses, across all
+            operations; least recently used responses are evicted first.
+        ttl: Default time to live of cached responses, in seconds.
+
+    Raises:
+        pydantic.ValidationError: The class was instantianted with an illegal
+            data type.
+
+    Example:
+
+        >>> ResponseCacheConfig(max_entries=100)
+        ResponseCacheConfig(max_entries=100, ttl=60.0)
+    """
+    max_entries: int = Field(default=1024, ge=1)
+    ttl: float = Field(default=60.0, gt=0)
+
+
 class APIConfig(FOCABaseConfig):
     """Model for a list of configuration parameters for OpenAPI 2.x or 3.x
     specifications to be attached to a Connexion app.
@@ -636,10 +1057,22 @@ class APIConfig(FOCABaseConfig):
     Args:
         specs: List of configuration parameters for OpenAPI 2.x or 3.x
             specifications to be attached to a Connexion app.
+        workers: Maximum number of processes used to load and process
+            specifications concurrently. Specifications are always attached
+            to the app in the order in which they are listed. If ``1``,
+            specifications are loaded and processed one after another.
+        response_cache: Configuration of the in-memory cache of responses
+            of operations with an ``x-foca-cache`` field.
 
     Attributes:
         specs: List of configuration parameters for OpenAPI 2.x or 3.x
             specifications to be attached to a Connexion app.
+        workers: Maximum number of processes used to load and process
+            specifications concurrently. Specifications are always attached
+            to the app in the order in which they are listed. If ``1``,
+            specifications are loaded and processed one after another.
+        response_cache: Configuration of the in-memory cache of responses
+            of operations with an ``x-foca-cache`` field.
 
     Raises:
         pydantic.ValidationError: The class was instantianted with an illegal
@@ -651,9 +1084,14 @@ class APIConfig(FOCABaseConfig):
         ... )
         APIConfig(specs=[SpecConfig(path=[PosixPath('/path/to/specs.yaml')], p\
 ath_out=PosixPath('/path/to/specs.modified.yaml'), append=None, add_operation_\
-fields=None, add_security_fields=None, disable_auth=False, connexion=None)])
+fields=None, add_security_fields=None, disable_auth=False, dereference=False, \
+response_validation=None, compiled_validation=False, etag=False, pagination=No\
+ne, connexion=None)], workers=1, response_cache=ResponseCacheConfig(max_entrie\
+s=1024, ttl=60.0))
     """
     specs: List[SpecConfig] = []
+    workers: int = Field(default=1, ge=1)
+    response_cache: ResponseCacheConfig = ResponseCacheConfig()
 
 
 class AccessControlConfig(FOCABaseConfig):
@@ -916,18 +1354,129 @@ sparse': False})
         return v
 
 
+class WriteConcernConfig(FOCABaseConfig):
+    """Model for configuring a MongoDB write concern.
+
+    Args:
+        w: Number of members (or ``majority``, or the name of a custom write
+            concern) that need to acknowledge writes.
+        j: Whether writes need to be written to the on-disk journal before
+            they are acknowledged.
+        wtimeout: Time, in milliseconds, after which waiting for
+            acknowledgements fails.
+
+    Attributes:
+        w: Number of members (or ``majority``, or the name of a custom write
+            concern) that need to acknowledge writes.
+        j: Whether writes need to be written to the on-disk journal before
+            they are acknowledged.
+        wtimeout: Time, in milliseconds, after which waiting for
+            acknowledgements fails.
+
+    Raises:
+        pydantic.ValidationError: The class was instantianted with an illegal
+            data type.
+
+    Example:
+
+        >>> WriteConcernConfig(w="majority", wtimeout=5000)
+        WriteConcernConfig(w='majority', j=None, wtimeout=5000)
+    """
+    w: Optional[Union[int, str]] = None
+    j: Optional[bool] = None
+    wtimeout: Optional[int] = Field(default=None, ge=0)
+
+
+class DocumentCacheConfig(FOCABaseConfig):
+    """Model for configuring the in-memory cache of documents read from a
+    MongoDB collection.
+
+    Args:
+        max_entries: Maximum number of cached lookups; least recently used
+            lookups are evicted first.
+        ttl: Time to live of cached lookups, in seconds; bounds how long
+            changes made by other processes may go unnoticed.
+        watch: Clear the cache whenever the collection is changed by any
+            process, as reported by a change stream, so that long times to
+            live can be used, cf.
+            :py:class:`foca.database.change_streams.ChangeStreamWatcher`.
+        poll_interval: Interval, in seconds, at which the cache is cleared
+            if `watch` is set, but the server does not support change
+            streams, e.g., because it is a standalone server.
+
+    Attributes:
+        max_entries: Maximum number of cached lookups; least recently used
+            lookups are evicted first.
+        ttl: Time to live of cached lookups, in seconds; bounds how long
+            changes made by other processes may go unnoticed.
+        watch: Clear the cache whenever the collection is changed by any
+            process, as reported by a change stream, so that long times to
+            live can be used, cf.
+            :py:class:`foca.database.change_streams.ChangeStreamWatcher`.
+        poll_interval: Interval, in seconds, at which the cache is cleared
+            if `watch` is set, but the server does not support change
+            streams, e.g., because it is a standalone server.
+
+    Raises:
+        pydantic.ValidationError: The class was instantianted with an illegal
+            data type.
+
+    Example:
+
+        >>> DocumentCacheConfig(max_entries=100)
+        DocumentCacheConfig(max_entries=100, ttl=60.0, watch=False, poll_inter\
+val=10.0)
+    """
+    max_entries: int = Field(default=1024, ge=1)
+    ttl: float = Field(default=60.0, gt=0)
+    watch: bool = False
+    poll_interval: float = Field(default=10.0, gt=0)
+
+
 class CollectionConfig(FOCABaseConfig):
     """Model for configuring a MongoDB collection.
 
     Args:
         indexes: An index configuration object.
-        client: Client connected to collection. Most likely populated through
-            the code, not during setup.
+        read_preference: Read preference for the collection; if not set,
+            the read preference of the database applies.
+        read_concern: Read concern level for the collection; if not set,
+            the read concern of the database applies.
+        write_concern: Write concern for the collection; if not set, the
+            write concern of the database applies.
+        cache: Configuration of an in-memory cache of documents read via
+            :py:meth:`pymongo.collection.Collection.find_one`; if set,
+            `client` is an instance of
+            :py:class:`foca.database.document_cache.CachedCollection`.
+        client: Client connected to collection; instance of
+            :py:class:`pymongo.collection.Collection`. Most likely populated
+            through the code, not during setup.
+        async_client: Asynchronous handle of collection, for use in
+            coroutines; instance of
+            :py:class:`foca.database.register_async_mongodb.AsyncHandle`.
+            Only populated if asynchronous clients are enabled via
+            :py:attr:`foca.models.config.MongoConfig.async_clients`.
 
     Attributes:
         indexes: An index configuration object.
-        client: Client connected to collection. Most likely populated through
-            the code, not during setup.
+        read_preference: Read preference for the collection; if not set,
+            the read preference of the database applies.
+        read_concern: Read concern level for the collection; if not set,
+            the read concern of the database applies.
+        write_concern: Write concern for the collection; if not set, the
+            write concern of the database applies.
+        cache: Configuration of an in-memory cache of documents read via
+            :py:meth:`pymongo.collection.Collection.find_one`; if set,
+            `client` is an instance of
+            :py:class:`foca.database.document_cache.CachedCollection`.
+        client: Client connected to collection; instance of
+            :py:class:`pymongo.collection.Collection`. Most likely populated
+            through the code, not during setup.
+        async_client: Asynchronous handle of collection, for use in
+            coroutines; instance of
+            :py:class:`foca.database.register_async_mongodb.AsyncHandle`.
+            Only populated if asynchronous clients are enabled via
+            :py:attr:`foca.models.config.MongoConfig.async_clients`.
 
     Raises:
         pydantic.ValidationError: The class was instantianted with an illegal
@@ -938,10 +1487,19 @@ class CollectionConfig(FOCABaseConfig):
         ...     indexes=[IndexConfig(keys={'last_name': 1})],
         ... )
         CollectionConfig(indexes=[IndexConfig(keys=[('last_name', 1)], options\
-={})], client=None)}, client=None)
+={})], read_preference=None, read_concern=None, write_concern=None, cache=None\
+, client=None, async_client=None)}, read_preference=None, read_concern=None, w\
+rite_concern=None, client=None)
     """
     indexes: Optional[List[IndexConfig]] = None
-    client: Optional[collection.Collection] = None
+    read_preference: Optional[ReadPreferenceEnum] = None
+    read_concern: Optional[ReadConcernEnum] = None
+    write_concern: Optional[WriteConcernConfig] = None
+    cache: Optional[DocumentCacheConfig] = None
+    client: Optional[Any] = None
+    async_client: Optional[Any] = None
+
+    _validate_client = field_validator('client')(_validate_collection_client)
 
 
 class DBConfig(FOCABaseConfig):
@@ -950,14 +1508,38 @@ class DBConfig(FOCABaseConfig):
     Args:
         collections: Mapping of collection names (keys) and configuration
             objects (values).
-        client: Client connected to database. Most likely populated through the
-            code, not during setup.
+        read_preference: Read preference for the collections of the
+            database; if not set, reads are directed to the primary.
+        read_concern: Read concern level for the collections of the
+            database; if not set, the server default is used.
+        write_concern: Write concern for the collections of the database;
+            if not set, the server default is used.
+        client: Client connected to database; instance of
+            :py:class:`pymongo.database.Database`. Most likely populated
+            through the code, not during setup.
+        async_client: Asynchronous handle of database, for use in
+            coroutines; instance of
+            :py:class:`foca.database.register_async_mongodb.AsyncHandle`.
+            Only populated if asynchronous clients are enabled via
+            :py:attr:`foca.models.config.MongoConfig.async_clients`.
 
     Attributes:
         collections: Mapping of collection names (keys) and configuration
             objects (values).
-        client: Client connected to database. Most likely populated through the
-            code, not during setup.
+        read_preference: Read preference for the collections of the
+            database; if not set, reads are directed to the primary.
+        read_concern: Read concern level for the collections of the
+            database; if not set, the server default is used.
+        write_concern: Write concern for the collections of the database;
+            if not set, the server default is used.
+        client: Client connected to database; instance of
+            :py:class:`pymongo.database.Database`. Most likely populated
+            through the code, not during setup.
+        async_client: Asynchronous handle of database, for use in
+            coroutines; instance of
+            :py:class:`foca.database.register_async_mongodb.AsyncHandle`.
+            Only populated if asynchronous clients are enabled via
+            :py:attr:`foca.models.config.MongoConfig.async_clients`.
 
     Raises:
         pydantic.ValidationError: The class was instantianted with an illegal
@@ -972,10 +1554,134 @@ class DBConfig(FOCABaseConfig):
         ...     },
         ... )
         DBConfig(collections={'my_collection': CollectionConfig(indexes=[Index\
-Config(keys=[('last_name', 1)], options={})], client=None)}, client=None)
+Config(keys=[('last_name', 1)], options={})], read_preference=None, read_conce\
+rn=None, write_concern=None, cache=None, client=None, async_client=None)}, rea\
+d_preference=None, read_concern=None, write_concern=None, client=None, async_c\
+lient=None)
     """
     collections: Optional[Dict[str, CollectionConfig]] = None
-    client: Optional[database.Database] = None
+    read_preference: Optional[ReadPreferenceEnum] = None
+    read_concern: Optional[ReadConcernEnum] = None
+    write_concern: Optional[WriteConcernConfig] = None
+    client: Optional[Any] = None
+    async_client: Optional[Any] = None
+
+    _validate_client = field_validator('client')(_validate_database_client)
+
+
+class MongoConnectionConfig(FOCABaseConfig):
+    """Model for configuring the connection pool of the MongoDB client.
+
+    A single client, and thus a single connection pool, is shared by all
+    databases registered with an app. Options that are not set default to
+    the defaults of :py:class:`pymongo.mongo_client.MongoClient`.
+
+    Args:
+        max_pool_size: Maximum number of concurrent connections to each
+            server.
+        min_pool_size: Minimum number of connections to each server that
+            are kept open.
+        max_idle_time_ms: Time, in milliseconds, after which idle
+            connections are closed.
+        connect_timeout_ms: Time, in milliseconds, to wait for a connection
+            to be established.
+        socket_timeout_ms: Time, in milliseconds, to wait for a response to
+            a request.
+        server_selection_timeout_ms: Time, in milliseconds, to wait for a
+            suitable server to become available.
+        wait_queue_timeout_ms: Time, in milliseconds, to wait for a
+            connection to become available in a saturated pool.
+        compressors: Compression algorithms for network traffic, in order of
+            preference; any of ``snappy``, ``zlib`` and ``zstd``.
+        auth_source: Database against which credentials given via the
+            ``MONGO_USERNAME`` and ``MONGO_PASSWORD`` environment variables
+            are authenticated; defaults to the database given via the
+            ``MONGO_DBNAME`` environment variable or, otherwise, to the only
+            configured database, and to ``admin`` if several databases are
+            configured.
+
+    Attributes:
+        max_pool_size: Maximum number of concurrent connections to each
+            server.
+        min_pool_size: Minimum number of connections to each server that
+            are kept open.
+        max_idle_time_ms: Time, in milliseconds, after which idle
+            connections are closed.
+        connect_timeout_ms: Time, in milliseconds, to wait for a connection
+            to be established.
+        socket_timeout_ms: Time, in milliseconds, to wait for a response to
+            a request.
+        server_selection_timeout_ms: Time, in milliseconds, to wait for a
+            suitable server to become available.
+        wait_queue_timeout_ms: Time, in milliseconds, to wait for a
+            connection to become available in a saturated pool.
+        compressors: Compression algorithms for network traffic, in order of
+            preference; any of ``snappy``, ``zlib`` and ``zstd``.
+        auth_source: Database against which credentials given via the
+            ``MONGO_USERNAME`` and ``MONGO_PASSWORD`` environment variables
+            are authenticated; defaults to the database given via the
+            ``MONGO_DBNAME`` environment variable or, otherwise, to the only
+            configured database, and to ``admin`` if several databases are
+            configured.
+
+    Raises:
+        pydantic.ValidationError: The class was instantianted with an illegal
+            data type.
+
+    Example:
+
+        >>> MongoConnectionConfig(max_pool_size=20, compressors=["zstd"])
+        MongoConnectionConfig(max_pool_size=20, min_pool_size=None, max_idle_t\
+ime_ms=None, connect_timeout_ms=None, socket_timeout_ms=None, server_selection\
+_timeout_ms=None, wait_queue_timeout_ms=None, compressors=['zstd'], auth_sourc\
+e=None)
+    """
+    max_pool_size: Optional[int] = Field(default=None, ge=0)
+    min_pool_size: Optional[int] = Field(default=None, ge=0)
+    max_idle_time_ms: Optional[int] = Field(default=None, gt=0)
+    connect_timeout_ms: Optional[int] = Field(default=None, gt=0)
+    socket_timeout_ms: Optional[int] = Field(default=None, gt=0)
+    server_selection_timeout_ms: Optional[int] = Field(default=None, gt=0)
+    wait_queue_timeout_ms: Optional[int] = Field(default=None, gt=0)
+    compressors: Optional[List[str]] = None
+    auth_source: Optional[str] = None
+
+
+class MongoMonitoringConfig(FOCABaseConfig):
+    """Model for configuring the monitoring of MongoDB commands.
+
+    If enabled, the durations of all commands are recorded, per database,
+    collection and command, in the shared metrics registry, and slow
+    commands are logged, cf.
+    :py:class:`foca.database.monitoring.CommandMonitor`.
+
+    Args:
+        enabled: Whether commands are monitored.
+        slow_query_ms: Duration, in milliseconds, from which commands are
+            logged as slow; if ``None``, no commands are logged.
+        request_id_header: Request header identifying the request that
+            issued a command; included in log messages.
+
+    Attributes:
+        enabled: Whether commands are monitored.
+        slow_query_ms: Duration, in milliseconds, from which commands are
+            logged as slow; if ``None``, no commands are logged.
+        request_id_header: Request header identifying the request that
+            issued a command; included in log messages.
+
+    Raises:
+        pydantic.ValidationError: The class was instantianted with an illegal
+            data type.
+
+    Example:
+
+        >>> MongoMonitoringConfig(slow_query_ms=500)
+        MongoMonitoringConfig(enabled=True, slow_query_ms=500, request_id_head\
+er='X-Request-ID')
+    """
+    enabled: bool = True
+    slow_query_ms: Optional[int] = Field(default=100, ge=0)
+    request_id_header: str = "X-Request-ID"
 
 
 class MongoConfig(FOCABaseConfig):
@@ -985,14 +1691,58 @@ class MongoConfig(FOCABaseConfig):
     Args:
         host: Host at which the database is exposed.
         port: Port at which the database is exposed.
+        hosts: Seed list of replica set members or sharded cluster routers,
+            as ``host`` or ``host:port``; if set, `host` and `port` are
+            ignored.
+        replica_set: Name of the replica set to connect to.
         dbs: Mapping of database names (keys) and configuration objects
             (values).
+        index_mode: How configured indexes are synchronized with existing
+            ones on startup, cf.
+            :py:func:`foca.database.register_mongodb.reconcile_indexes`.
+        index_workers: Maximum number of collections whose indexes are
+            built concurrently.
+        index_background: Build indexes in a background thread, so that the
+            app starts without waiting for index builds; requests are
+            answered with ``503 Service Unavailable`` until all indexes are
+            built, cf.
+            :py:func:`foca.database.register_mongodb.indexes_ready`.
+        connection: Options of the client, and its connection pool, shared
+            by all databases, cf.
+            :py:class:`foca.models.config.MongoConnectionConfig`.
+        async_clients: Additionally register asynchronous database and
+            collection handles, for use in ``async`` controllers, cf.
+            :py:func:`foca.database.register_async_mongodb.register_async_mongodb`.
+        monitoring: Monitoring of commands, cf.
+            :py:class:`foca.models.config.MongoMonitoringConfig`.
 
     Attributes:
         host: Host at which the database is exposed.
         port: Port at which the database is exposed.
+        hosts: Seed list of replica set members or sharded cluster routers,
+            as ``host`` or ``host:port``; if set, `host` and `port` are
+            ignored.
+        replica_set: Name of the replica set to connect to.
         dbs: Mapping of database names (keys) and configuration objects
             (values).
+        index_mode: How configured indexes are synchronized with existing
+            ones on startup, cf.
+            :py:func:`foca.database.register_mongodb.reconcile_indexes`.
+        index_workers: Maximum number of collections whose indexes are
+            built concurrently.
+        index_background: Build indexes in a background thread, so that the
+            app starts without waiting for index builds; requests are
+            answered with ``503 Service Unavailable`` until all indexes are
+            built, cf.
+            :py:func:`foca.database.register_mongodb.indexes_ready`.
+        connection: Options of the client, and its connection pool, shared
+            by all databases, cf.
+            :py:class:`foca.models.config.MongoConnectionConfig`.
+        async_clients: Additionally register asynchronous database and
+            collection handles, for use in ``async`` controllers, cf.
+            :py:func:`foca.database.register_async_mongodb.register_async_mongodb`.
+        monitoring: Monitoring of commands, cf.
+            :py:class:`foca.models.config.MongoMonitoringConfig`.
 
     Raises:
         pydantic.ValidationError: The class was instantianted with an illegal
@@ -1003,11 +1753,25 @@ class MongoConfig(FOCABaseConfig):
         ...     host="mongodb",
         ...     port=27017,
         ... )
-        MongoConfig(host='mongodb', port=27017, dbs=None)
+        MongoConfig(host='mongodb', port=27017, hosts=None, replica_set=None, \
+dbs=None, index_mode=<IndexModeEnum.reconcile: 'reconcile'>, index_workers=4, \
+index_background=False, connection=MongoConnectionConfig(max_pool_size=None, m\
+in_pool_size=None, max_idle_time_ms=None, connect_timeout_ms=None, socket_time\
+out_ms=None, server_selection_timeout_ms=None, wait_queue_timeout_ms=None, com\
+pressors=None, auth_source=None), async_clients=False, monitoring=MongoMonitor\
+ingConfig(enabled=True, slow_query_ms=100, request_id_header='X-Request-ID'))
     """
     host: str = "mongodb"
     port: int = 27017
+    hosts: Optional[List[str]] = None
+    replica_set: Optional[str] = None
     dbs: Optional[Dict[str, DBConfig]] = None
+    index_mode: IndexModeEnum = IndexModeEnum.reconcile
+    index_workers: int = Field(default=4, ge=1)
+    index_background: bool = False
+    connection: MongoConnectionConfig = MongoConnectionConfig()
+    async_clients: bool = False
+    monitoring: MongoMonitoringConfig = MongoMonitoringConfig()
 
 
 class JobsConfig(FOCABaseConfig):
@@ -1206,6 +1970,80 @@ onsole']))
     root: Optional[LogRootConfig] = LogRootConfig()
 
 
+class ProfilingConfig(FOCABaseConfig):
+    """Model for configuring the profiling of the app startup.
+
+    Args:
+        enabled: Profile wall time, import time and memory usage of each
+            startup phase of :py:meth:`foca.foca.Foca.create_app` and log the
+            profile. Can be overridden with the environment variable
+            ``FOCA_PROFILE_STARTUP``.
+        output: Path to file to which the profile is additionally written in
+            JSON format. Can be overridden with the environment variable
+            ``FOCA_PROFILE_STARTUP_OUTPUT``.
+
+    Attributes:
+        enabled: Profile wall time, import time and memory usage of each
+            startup phase of :py:meth:`foca.foca.Foca.create_app` and log the
+            profile. Can be overridden with the environment variable
+            ``FOCA_PROFILE_STARTUP``.
+        output: Path to file to which the profile is additionally written in
+            JSON format. Can be overridden with the environment variable
+            ``FOCA_PROFILE_STARTUP_OUTPUT``.
+
+    Raises:
+        pydantic.ValidationError: The class was instantianted with an illegal
+            data type.
+
+    Example:
+        >>> ProfilingConfig(
+        ...     enabled=True,
+        ...     output="/path/to/profile.json",
+        ... )
+        ProfilingConfig(enabled=True, output=PosixPath('/path/to/profile.json'\
+))
+    """
+    enabled: bool = False
+    output: Optional[Path] = None
+
+
+class ReloadConfig(FOCABaseConfig):
+    """Model for configuring the reloading of the app configuration at
+    runtime.
+
+    Args:
+        enabled: Watch the configuration file for changes and apply those
+            settings that are safe to change while the app is running, i.e.,
+            logging, exception handling and JSON Web Token (JWT) validation
+            settings. Changes to any other settings are reported, but only
+            take effect after a restart.
+        interval: Interval, in seconds, at which the configuration file is
+            checked for changes.
+
+    Attributes:
+        enabled: Watch the configuration file for changes and apply those
+            settings that are safe to change while the app is running, i.e.,
+            logging, exception handling and JSON Web Token (JWT) validation
+            settings. Changes to any other settings are reported, but only
+            take effect after a restart.
+        interval: Interval, in seconds, at which the configuration file is
+            checked for changes.
+
+    Raises:
+        pydantic.ValidationError: The class was instantianted with an illegal
+            data type.
+
+    Example:
+        >>> ReloadConfig(
+        ...     enabled=True,
+        ...     interval=5,
+        ... )
+        ReloadConfig(enabled=True, interval=5.0)
+    """
+    enabled: bool = False
+    interval: float = Field(default=2.0, gt=0)
+
+
 class Config(FOCABaseConfig):
     """Model for all app configuration parameters.
 
@@ -1217,6 +2055,8 @@ class Config(FOCABaseConfig):
         db: Database config parameters.
         jobs: Background job config parameters.
         log: Logger config parameters.
+        reload: Runtime configuration reload parameters.
+        profiling: Startup profiling parameters.
 
     Attributes:
         server: Server config parameters.
@@ -1226,6 +2066,8 @@ class Config(FOCABaseConfig):
         db: Database config parameters.
         jobs: Background job config parameters.
         log: Logger config parameters.
+        reload: Runtime configuration reload parameters.
+        profiling: Startup profiling parameters.
 
     Raises:
         pydantic.ValidationError: The class was instantianted with an illegal
@@ -1234,44 +2076,55 @@ class Config(FOCABaseConfig):
     Example:
         >>> Config()
         Config(server=ServerConfig(host='0.0.0.0', port=8080, debug=True, envi\
-ronment='development', testing=False, use_reloader=True), exceptions=Exception\
-Config(required_members=[['title'], ['status']], extension_members=False, stat\
-us_member=['status'], public_members=None, private_members=None, exceptions='f\
-oca.errors.exceptions.exceptions', logging=<ExceptionLoggingEnum.oneline: 'one\
-line'>, mapping={<class 'Exception'>: {'title': 'Internal Server Error', 'stat\
-us': 500}, <class 'werkzeug.exceptions.BadRequest'>: {'title': 'Bad Request', \
-'status': 400}, <class 'connexion.exceptions.ExtraParameterProblem'>: {'title'\
-: 'Bad Request', 'status': 400}, <class 'werkzeug.exceptions.Unauthorized'>: {\
-'title': 'Unauthorized', 'status': 401}, <class 'connexion.exceptions.OAuthPro\
-blem'>: {'title': 'Unauthorized', 'status': 401}, <class 'werkzeug.exceptions.\
-Forbidden'>: {'title': 'Forbidden', 'status': 403}, <class 'werkzeug.exception\
-s.NotFound'>: {'title': 'Not Found', 'status': 404}, <class 'werkzeug.exceptio\
-ns.InternalServerError'>: {'title': 'Internal Server Error', 'status': 500}, <\
-class 'werkzeug.exceptions.BadGateway'>: {'title': 'Bad Gateway', 'status': 50\
-2}, <class 'werkzeug.exceptions.ServiceUnavailable'>: {'title': 'Service Unava\
-ilable', 'status': 502}, <class 'werkzeug.exceptions.GatewayTimeout'>: {'title\
-': 'Gateway Timeout', 'status': 504}}), api=APIConfig(specs=[]), security=Secu\
-rityConfig(auth=AuthConfig(required=False, add_key_to_claims=True, allow_expir\
-ed=False, audience=None, claim_identity='sub', claim_issuer='iss', algorithms=\
-['RS256'], validation_methods=[<ValidationMethodsEnum.userinfo: 'userinfo'>, <\
-ValidationMethodsEnum.public_key: 'public_key'>], validation_checks=<Validatio\
-nChecksEnum.all: 'all'>), cors=CORSConfig(enabled=True), access_control=Access\
-ControlConfig(api_specs='/path/to/access_control_spec.yaml', api_controllers='\
-/path/to/access_control_spec_server.py', db_name='access_control_db', collecti\
-on_name='access_control_collection', model='/path/to/policy.conf', owner_heade\
-rs={'X-User', 'X-Group'}, user_headers={'X-User'})), db=None, jobs=None, log=L\
-ogConfig(version=1, disable_existing_loggers=False, formatters={'standard': Lo\
-gFormatterConfig(class_formatter='logging.Formatter', style='{', format='[{asc\
-time}: {levelname:<8}] {message} [{name}]')}, handlers={'console': LogHandlerC\
-onfig(class_handler='logging.StreamHandler', level=20, formatter='standard', s\
-tream='ext://sys.stderr')}, root=LogRootConfig(level=10, handlers=['console'])\
-))
+ronment='development', testing=False, use_reloader=True, compression=Compressi\
+onConfig(enabled=False, algorithms=[<CompressionAlgorithmEnum.br: 'br'>, <Comp\
+ressionAlgorithmEnum.zstd: 'zstd'>, <CompressionAlgorithmEnum.gzip: 'gzip'>], \
+min_size=500, mimetypes=['application/javascript', 'application/json', 'applic\
+ation/problem+json', 'application/xml', 'image/svg+xml', 'text/css', 'text/htm\
+l', 'text/javascript', 'text/plain'], level=None)), exceptions=ExceptionConfig\
+(required_members=[['title'], ['status']], extension_members=False, status_mem\
+ber=['status'], public_members=None, private_members=None, exceptions='foca.er\
+rors.exceptions.exceptions', logging=<ExceptionLoggingEnum.oneline: 'oneline'>\
+, mapping={<class 'Exception'>: {'title': 'Internal Server Error', 'status': 5\
+00}, <class 'werkzeug.exceptions.BadRequest'>: {'title': 'Bad Request', 'statu\
+s': 400}, <class 'connexion.exceptions.ExtraParameterProblem'>: {'title': 'Bad\
+ Request', 'status': 400}, <class 'werkzeug.exceptions.Unauthorized'>: {'title\
+': 'Unauthorized', 'status': 401}, <class 'connexion.exceptions.OAuthProblem'>\
+: {'title': 'Unauthorized', 'status': 401}, <class 'werkzeug.exceptions.Forbid\
+den'>: {'title': 'Forbidden', 'status': 403}, <class 'werkzeug.exceptions.NotF\
+ound'>: {'title': 'Not Found', 'status': 404}, <class 'werkzeug.exceptions.Pre\
+conditionFailed'>: {'title': 'Precondition Failed', 'status': 412}, <class 'we\
+rkzeug.exceptions.InternalServerError'>: {'title': 'Internal Server Error', 's\
+tatus': 500}, <class 'werkzeug.exceptions.BadGateway'>: {'title': 'Bad Gateway\
+', 'status': 502}, <class 'werkzeug.exceptions.ServiceUnavailable'>: {'title':\
+ 'Service Unavailable', 'status': 502}, <class 'werkzeug.exceptions.GatewayTim\
+eout'>: {'title': 'Gateway Timeout', 'status': 504}}), api=APIConfig(specs=[],\
+ workers=1, response_cache=ResponseCacheConfig(max_entries=1024, ttl=60.0)), s\
+ecurity=SecurityConfig(auth=AuthConfig(required=False, add_key_to_claims=True,\
+ allow_expired=False, audience=None, claim_identity='sub', claim_issuer='iss',\
+ algorithms=['RS256'], validation_methods=[<ValidationMethodsEnum.userinfo: 'u\
+serinfo'>, <ValidationMethodsEnum.public_key: 'public_key'>], validation_check\
+s=<ValidationChecksEnum.all: 'all'>), cors=CORSConfig(enabled=True), access_co\
+ntrol=AccessControlConfig(api_specs='/path/to/access_control_spec.yaml', api_c\
+ontrollers='/path/to/access_control_spec_server.py', db_name='access_control_d\
+b', collection_name='access_control_collection', model='/path/to/policy.conf',\
+ owner_headers={'X-User', 'X-Group'}, user_headers={'X-User'})), db=None, jobs\
+=None, log=LogConfig(version=1, disable_existing_loggers=False, formatters={'s\
+tandard': LogFormatterConfig(class_formatter='logging.Formatter', style='{', f\
+ormat='[{asctime}: {levelname:<8}] {message} [{name}]')}, handlers={'console':\
+ LogHandlerConfig(class_handler='logging.StreamHandler', level=20, formatter='\
+standard', stream='ext://sys.stderr')}, root=LogRootConfig(level=10, handlers=\
+['console'])), reload=ReloadConfig(enabled=False, interval=2.0), profiling=Pro\
+filingConfig(enabled=False, output=None))
     """
     server: ServerConfig = ServerConfig()
-    exceptions: ExceptionConfig = ExceptionConfig()
+    # instantiated on demand, as validation imports the exceptions module
+    exceptions: ExceptionConfig = Field(default_factory=ExceptionConfig)
     api: APIConfig = APIConfig()
     security: SecurityConfig = SecurityConfig()
     db: Optional[MongoConfig] = None
     jobs: Optional[JobsConfig] = None
     log: LogConfig = LogConfig()
+    reload: ReloadConfig = ReloadConfig()
+    profiling: ProfilingConfig = ProfilingConfig()
     model_config = ConfigDict(extra='allow')
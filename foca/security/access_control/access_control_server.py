@@ -2,12 +2,13 @@
 
 import logging
 
-from typing import (Dict, List)
+from typing import Dict
 
-from flask import (request, current_app)
+from flask import (request, current_app, Response)
 from pymongo.collection import Collection
 from werkzeug.exceptions import (InternalServerError, NotFound)
 
+from foca.utils.db import stream_json_array
 from foca.utils.logging import log_traffic
 from foca.errors.exceptions import BadRequest
 
@@ -93,14 +94,17 @@ def putPermission(
 
 
 @log_traffic
-def getAllPermissions(limit=None) -> List[Dict]:
+def getAllPermissions(limit=None) -> Response:
     """Method to fetch all permissions.
 
+    Permissions are streamed as they are fetched from the database, cf.
+    :py:func:`foca.utils.db.stream_json_array`.
+
     Args:
         limit: Number of objects requested.
 
     Returns:
-        List of permission dicts.
+        Streamed response with list of permission dicts.
     """
     app_config = current_app.config
     access_control_config = \
@@ -113,25 +117,29 @@ def getAllPermissions(limit=None) -> List[Dict]:
 
     if not limit:
         limit = 0
-    permissions = list(
-        db_coll_permission.find(
-            filter={},
-            projection={'_id': False}
-        ).sort([('$natural', -1)]).limit(limit)
-    )
-    user_permission_list = []
-    for _permission in permissions:
-        policy_type = _permission.get("ptype", None)
-        id = _permission.get("id", None)
-        del _permission["ptype"]
-        del _permission["id"]
-        rule = _permission
-        user_permission_list.append({
-            "policy_type": policy_type,
-            "rule": rule,
-            "id": id
-        })
-    return user_permission_list
+    permissions = db_coll_permission.find(
+        filter={},
+        projection={'_id': False}
+    ).sort([('$natural', -1)]).limit(limit)
+    return stream_json_array(permissions, transform=_to_user_permission)
+
+
+def _to_user_permission(permission: Dict) -> Dict:
+    """Convert permission document to user-facing representation.
+
+    Args:
+        permission: Permission document.
+
+    Returns:
+        Permission dict with policy type, rule and identifier.
+    """
+    policy_type = permission.pop("ptype", None)
+    id = permission.pop("id", None)
+    return {
+        "policy_type": policy_type,
+        "rule": permission,
+        "id": id
+    }
 
 
 @log_traffic
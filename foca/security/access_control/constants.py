@@ -8,3 +8,7 @@ DEFAULT_MODEL_FILE = "default_model.conf"
 DEFAULT_SPEC_CONTROLLER = "foca.security.access_control.access_control_server"
 
 ACCESS_CONTROL_BASE_PATH = "foca.security.access_control.api"
+
+# Attribute marking view functions whose access is checked by
+# `check_permissions()`
+ACCESS_CONTROL_ATTRIBUTE = "_foca_check_permissions"
@@ -22,6 +22,9 @@ class Adapter(persist.Adapter):
         dbname: Database to store policy.
         collection: Collection of the choosen database. Defaults to
             "casbin_rule".
+        client: Existing MongoDB client to be used, e.g., to share its
+            connection pool with other parts of the app; if given, `uri` is
+            ignored.
 
     Attributes:
         uri: This should be the same requiement as pymongo Client's 'uri'
@@ -30,13 +33,21 @@ class Adapter(persist.Adapter):
         dbname: Database to store policy.
         collection: Collection of the choosen database. Defaults to
             "casbin_rule".
+        client: Existing MongoDB client to be used, e.g., to share its
+            connection pool with other parts of the app; if given, `uri` is
+            ignored.
     """
 
     def __init__(
-        self, uri: str, dbname: str, collection: Optional[str] = "casbin_rule"
+        self,
+        uri: Optional[str],
+        dbname: str,
+        collection: Optional[str] = "casbin_rule",
+        client: Optional[MongoClient] = None,
     ):
         """Create an adapter for Mongodb."""
-        client: MongoClient = MongoClient(uri)
+        if client is None:
+            client = MongoClient(uri)
         db = client[dbname]
         assert collection is not None
         self._collection = db[collection]
@@ -1,7 +1,7 @@
 """Methods to manage permission management configuration"""
 
 import logging
-from functools import wraps
+from functools import partial, wraps
 from importlib.resources import path as resource_path
 from pathlib import Path
 from typing import (Callable, Optional, Tuple)
@@ -12,6 +12,7 @@ from flask import current_app
 from flask.wrappers import Response
 from flask_authz import CasbinEnforcer
 
+from foca.api.validation import SampledResponseValidator
 from foca.models.config import (
     DBConfig,
     MongoConfig,
@@ -19,9 +20,13 @@ from foca.models.config import (
     CollectionConfig,
     AccessControlConfig
 )
-from foca.database.register_mongodb import add_new_database
+from foca.database.register_mongodb import (
+    add_new_database,
+    get_mongo_client,
+)
 from foca.security.access_control.foca_casbin_adapter.adapter import Adapter
 from foca.security.access_control.constants import (
+    ACCESS_CONTROL_ATTRIBUTE,
     ACCESS_CONTROL_BASE_PATH,
     DEFAULT_API_SPEC_PATH
 )
@@ -132,8 +137,13 @@ def register_permission_specs(
         }
     )
 
+    # Validate responses, except those of operations opting out via the
+    # `x-foca-response-validation-sample-rate` field, e.g., streamed ones
     app.add_api(
         specification=spec.path[0],  # type: ignore[index]
+        validator_map={
+            "response": partial(SampledResponseValidator, fail=True),
+        },
         **spec.model_dump().get("connexion", {}),
     )
     return app
@@ -175,9 +185,10 @@ def register_casbin_enforcer(
 
     logger.info("Setting up casbin enforcer.")
     adapter = Adapter(
-        uri=f"mongodb://{mongo_config.host}:{mongo_config.port}/",
+        uri=None,
         dbname=str(access_control_config.db_name),
-        collection=access_control_config.collection_name
+        collection=access_control_config.collection_name,
+        client=get_mongo_client(app=app.app, conf=mongo_config),
     )
     app.app.config["casbin_adapter"] = adapter
 
@@ -229,6 +240,7 @@ def check_permissions(
                 raise Forbidden
             return response
 
+        setattr(_wrapper, ACCESS_CONTROL_ATTRIBUTE, True)
         return _wrapper
 
     if _fn is None:
@@ -0,0 +1,140 @@
+"""Utility classes for caching values in memory."""
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Hashable, Iterable, Optional, Tuple
+
+# Entry of cache: time of expiry (or `None`), value and tags
+_Entry = Tuple[Optional[float], Any, frozenset]
+
+
+class LRUCache():
+    """Thread-safe, size-bounded in-memory cache with per-entry expiry.
+
+    When the cache is full, the least recently used entry is evicted.
+    Entries may be tagged, so that related entries can be invalidated
+    together.
+
+    Args:
+        max_entries: Maximum number of entries.
+        ttl: Default time to live of entries, in seconds; if ``None``,
+            entries do not expire.
+        timer: Function returning the current time, in seconds.
+
+    Attributes:
+        max_entries: Maximum number of entries.
+        ttl: Default time to live of entries, in seconds; if ``None``,
+            entries do not expire.
+        timer: Function returning the current time, in seconds.
+
+    Example:
+
+        >>> cache = LRUCache(max_entries=2)
+        >>> cache.set("a", 1, tags=["letters"])
+        >>> cache.get("a")
+        1
+        >>> cache.invalidate(tags=["letters"])
+        1
+        >>> cache.get("a") is None
+        True
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None,
+        timer: Callable[[], float] = monotonic,
+    ) -> None:
+        """Constructor method."""
+        if max_entries < 1:
+            raise ValueError("Maximum number of entries must be positive.")
+        self.max_entries: int = max_entries
+        self.ttl: Optional[float] = ttl
+        self.timer: Callable[[], float] = timer
+        self._lock: Lock = Lock()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get value of entry and mark it as recently used.
+
+        Args:
+            key: Key of the entry.
+            default: Value returned if there is no unexpired entry for `key`.
+
+        Returns:
+            Value of the entry or `default`.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires, value, _ = entry
+            if expires is not None and expires <= self.timer():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[Hashable] = (),
+    ) -> None:
+        """Add or replace entry, evicting the least recently used entry if
+        the cache is full.
+
+        Args:
+            key: Key of the entry.
+            value: Value of the entry.
+            ttl: Time to live of the entry, in seconds; defaults to
+                :py:attr:`ttl`.
+            tags: Tags of the entry, cf. :py:meth:`invalidate`.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires = None if ttl is None else self.timer() + ttl
+        with self._lock:
+            self._entries[key] = (expires, value, frozenset(tags))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self,
+        keys: Iterable[Hashable] = (),
+        tags: Iterable[Hashable] = (),
+    ) -> int:
+        """Remove entries by key or tag.
+
+        Args:
+            keys: Keys of entries to be removed.
+            tags: Entries with any of these tags are removed.
+
+        Returns:
+            Number of removed entries.
+        """
+        tags = frozenset(tags)
+        with self._lock:
+            remove = {key for key in keys if key in self._entries}
+            if tags:
+                remove.update(
+                    key for key, (_, _, entry_tags) in self._entries.items()
+                    if not tags.isdisjoint(entry_tags)
+                )
+            for key in remove:
+                del self._entries[key]
+        return len(remove)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return number of entries, including expired ones that were not
+        yet removed.
+        """
+        with self._lock:
+            return len(self._entries)
@@ -1,12 +1,60 @@
 """Utility functions for interacting with a MongoDB database collection."""
 
-from typing import (Any, Mapping, Optional)
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+import hashlib
+import hmac
+import os
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
+from bson import json_util
 from bson.objectid import ObjectId
-from pymongo.collection import Collection
+from flask import (
+    current_app,
+    Flask,
+    has_app_context,
+    has_request_context,
+    json,
+    request,
+    Response,
+    stream_with_context,
+)
+from werkzeug.exceptions import BadRequest
 
+# PyMongo is imported for type checking only, so that the pagination
+# constants can be imported when processing specifications without loading
+# the database subsystem
+if TYPE_CHECKING:
+    from pymongo.collection import Collection
 
-def find_one_latest(collection: Collection) -> Optional[Mapping[Any, Any]]:
+# Default minimum size of chunks of streamed responses, in bytes
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Names of query parameters and response header for keyset pagination
+PAGE_TOKEN_PARAMETER = "page_token"
+PAGE_LIMIT_PARAMETER = "limit"
+NEXT_PAGE_TOKEN_HEADER = "X-Next-Page-Token"
+
+# Key of keys for signing continuation tokens, by blueprint, in
+# `flask.Flask.extensions`
+_PAGE_TOKEN_SECRETS_KEY = "foca_page_token_secrets"
+
+
+def find_one_latest(collection: "Collection") -> Optional[Mapping[Any, Any]]:
     """Return newest document, stripped of `ObjectId`.
 
     Args:
@@ -25,7 +73,7 @@ def find_one_latest(collection: Collection) -> Optional[Mapping[Any, Any]]:
         return None
 
 
-def find_id_latest(collection: Collection) -> Optional[ObjectId]:
+def find_id_latest(collection: "Collection") -> Optional[ObjectId]:
     """Return `ObjectId` of newest document.
 
     Args:
@@ -39,3 +87,507 @@ def find_id_latest(collection: Collection) -> Optional[ObjectId]:
         return collection.find().sort([('_id', -1)]).limit(1).next()['_id']
     except StopIteration:
         return None
+
+
+class SequenceAllocator():
+    """Allocate consecutive integer identifiers from a counter document.
+
+    Identifiers are reserved atomically, via ``$inc`` on a counter document
+    in a dedicated collection, so that they are unique across threads,
+    processes and hosts. To reduce the number of round trips, blocks of
+    identifiers can be reserved at once and handed out from memory; in
+    that case, identifiers are unique, but not necessarily assigned in
+    order across processes, and identifiers left over in a block when the
+    process exits are skipped.
+
+    Args:
+        collection: MongoDB collection holding counter documents, one per
+            sequence.
+        name: Name of the sequence, used as ``_id`` of its counter document.
+        block_size: Number of identifiers reserved per database request.
+        start: First identifier of the sequence.
+
+    Attributes:
+        collection: MongoDB collection holding counter documents, one per
+            sequence.
+        name: Name of the sequence, used as ``_id`` of its counter document.
+        block_size: Number of identifiers reserved per database request.
+        start: First identifier of the sequence.
+
+    Raises:
+        ValueError: Block size is not positive.
+
+    Example:
+
+        >>> ids = SequenceAllocator(db["counters"], "pets", block_size=100)
+        >>> pet["id"] = ids.next()
+    """
+
+    def __init__(
+        self,
+        collection: "Collection",
+        name: str,
+        block_size: int = 1,
+        start: int = 0,
+    ) -> None:
+        """Constructor method."""
+        if block_size < 1:
+            raise ValueError("Block size must be positive.")
+        self.collection: "Collection" = collection
+        self.name: str = name
+        self.block_size: int = block_size
+        self.start: int = start
+        self._block: Iterator[int] = iter(())
+        self._lock = Lock()
+
+    def next(self) -> int:
+        """Get next identifier.
+
+        Returns:
+            Identifier; a new block is reserved if the current one is
+            exhausted.
+        """
+        with self._lock:
+            identifier = next(self._block, None)
+            if identifier is None:
+                self._block = iter(self.reserve(self.block_size))
+                identifier = next(self._block)
+            return identifier
+
+    def reserve(self, count: int) -> range:
+        """Reserve block of identifiers, bypassing the block held in memory.
+
+        Args:
+            count: Number of identifiers to reserve.
+
+        Returns:
+            Reserved identifiers.
+
+        Raises:
+            ValueError: Count is not positive.
+        """
+        if count < 1:
+            raise ValueError("Count must be positive.")
+        counter = self.collection.find_one_and_update(
+            {"_id": self.name},
+            {"$inc": {"value": count}},
+            upsert=True,
+            return_document=True,
+        )
+        # Counter document is created if missing, hence never `None`
+        end = self.start + counter["value"]  # type: ignore[index]
+        return range(end - count, end)
+
+
+def stream_json_array(
+    documents: Iterable[Any],
+    transform: Optional[Callable[[Any], Any]] = None,
+    status: int = 200,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Response:
+    """Create streamed response with JSON array of documents.
+
+    Documents are serialized one at a time, as they are fetched from the
+    database, and sent in chunks of at least `chunk_size` bytes, so that
+    memory use does not depend on the number of documents and the first
+    bytes are sent before the last document is fetched. To be returned by
+    controllers.
+
+    Note that response validation (cf. the ``validate_responses`` option in
+    :py:attr:`foca.models.config.SpecConfig.connexion`) reads the entire
+    response into memory; consider disabling it for operations returning
+    large streamed responses.
+
+    Args:
+        documents: Documents to be returned, e.g., a `pymongo` cursor;
+            consumed and, if possible, closed while the response is sent.
+        transform: Function applied to each document before serialization.
+        status: Status code of the response.
+        chunk_size: Minimum size of chunks of the response body, in bytes;
+            the last chunk may be smaller.
+
+    Returns:
+        Streamed response with MIME type ``application/json``.
+
+    Example:
+
+        >>> def findPets():
+        ...     cursor = collection.find({}, {'_id': False})
+        ...     return stream_json_array(cursor)
+    """
+    chunks = _iter_json_array(documents, transform, chunk_size)
+    if has_request_context():
+        chunks = stream_with_context(chunks)
+    return Response(chunks, status=status, mimetype="application/json")
+
+
+def _iter_json_array(
+    documents: Iterable[Any],
+    transform: Optional[Callable[[Any], Any]],
+    chunk_size: int,
+) -> Iterator[str]:
+    """Serialize documents as JSON array, in chunks.
+
+    Args:
+        documents: Documents to be serialized.
+        transform: Function applied to each document before serialization.
+        chunk_size: Minimum size of chunks, in characters.
+
+    Yields:
+        Chunks of JSON array.
+    """
+    try:
+        parts = ["["]
+        size = 1
+        for index, document in enumerate(documents):
+            if transform is not None:
+                document = transform(document)
+            part = json.dumps(document)
+            if index:
+                part = "," + part
+            parts.append(part)
+            size += len(part)
+            if size >= chunk_size:
+                yield "".join(parts)
+                parts = []
+                size = 0
+        parts.append("]\n")
+        yield "".join(parts)
+    finally:
+        close = getattr(documents, "close", None)
+        if close is not None:
+            close()
+
+
+class Page(NamedTuple):
+    """Page of documents, cf. :py:func:`paginate`.
+
+    Attributes:
+        items: Documents of the page.
+        next_page_token: Continuation token for requesting the next page, or
+            ``None`` if this is the last page.
+    """
+    items: List[Any]
+    next_page_token: Optional[str]
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Response headers announcing the next page, if any."""
+        if self.next_page_token is None:
+            return {}
+        return {NEXT_PAGE_TOKEN_HEADER: self.next_page_token}
+
+
+def paginate(
+    collection: "Collection",
+    filter: Optional[Mapping[str, Any]] = None,
+    sort: Sequence[Tuple[str, int]] = (("_id", 1),),
+    limit: int = 100,
+    page_token: Optional[str] = None,
+    projection: Optional[Union[Mapping[str, Any], Sequence[str]]] = None,
+    secret: Optional[Union[str, bytes]] = None,
+) -> Page:
+    """Fetch page of documents using keyset pagination.
+
+    Rather than skipping the documents of previous pages, the query is
+    restricted to documents sorting after the last document of the previous
+    page, whose sort key values are carried in a signed, opaque continuation
+    token. With an index on the sort keys, fetching any page thus costs the
+    same as fetching the first page. ``_id`` is appended to the sort keys,
+    if not included, so that the sort order is unambiguous. Documents with
+    null or missing sort keys are returned where MongoDB sorts them, i.e.,
+    first in ascending and last in descending order.
+
+    Args:
+        collection: MongoDB collection from which documents are to be
+            retrieved.
+        filter: Query filter.
+        sort: Sort keys and directions (``1`` or ``-1``), e.g.,
+            ``[("id", -1)]``; should be covered by an index.
+        limit: Maximum number of documents per page.
+        page_token: Continuation token returned with the previous page;
+            ``None`` for the first page.
+        projection: Fields to return, as for
+            :py:meth:`pymongo.collection.Collection.find`. Sort keys are
+            fetched regardless, but only returned if requested.
+        secret: Key for signing continuation tokens; defaults to the key
+            configured for the specification of the current request (cf.
+            :py:func:`register_page_token_secret`) or, otherwise, to the
+            Flask app's ``SECRET_KEY``.
+
+    Returns:
+        Page of documents and continuation token for the next page.
+
+    Raises:
+        ValueError: No secret is available or arguments are invalid.
+        werkzeug.exceptions.BadRequest: The continuation token is invalid,
+            was tampered with or was issued for a different query.
+
+    Example:
+
+        >>> def findPets(limit=100, page_token=None):
+        ...     page = paginate(
+        ...         collection,
+        ...         sort=[("id", 1)],
+        ...         limit=limit,
+        ...         page_token=page_token,
+        ...         projection={"_id": False},
+        ...     )
+        ...     return page.items, 200, page.headers
+    """
+    if limit < 1:
+        raise ValueError("Page limit must be positive.")
+    key = _get_secret(secret)
+    filter = dict(filter or {})
+    sort = [(field, int(direction)) for field, direction in sort]
+    if "_id" not in (field for field, _ in sort):
+        sort.append(("_id", sort[-1][1] if sort else 1))
+    fields = [field for field, _ in sort]
+    fingerprint = hashlib.sha256(
+        json_util.dumps([filter, sort], sort_keys=True).encode()
+    ).hexdigest()[:16]
+
+    query = filter
+    if page_token is not None:
+        values = _decode_page_token(page_token, key, fingerprint)
+        if len(values) != len(sort):
+            raise BadRequest("Invalid page token.")
+        query = {"$and": [filter, _get_keyset_filter(sort, values)]}
+
+    find_projection, strip = _extend_projection(projection, fields)
+    documents = list(
+        collection.find(query, find_projection).sort(sort).limit(limit + 1)
+    )
+    next_page_token = None
+    if len(documents) > limit:
+        documents = documents[:limit]
+        next_page_token = _encode_page_token(
+            [_get_field(documents[-1], field) for field in fields],
+            key,
+            fingerprint,
+        )
+    for document in documents:
+        for field in strip:
+            _pop_field(document, field)
+    return Page(items=documents, next_page_token=next_page_token)
+
+
+def register_page_token_secret(
+    app: Flask,
+    blueprint: str,
+    secret: Optional[str] = None,
+    secret_env: Optional[str] = None,
+) -> None:
+    """Register key for signing continuation tokens of a blueprint's
+    operations, cf. :py:func:`paginate`.
+
+    Args:
+        app: Flask application instance.
+        blueprint: Name of blueprint.
+        secret: Key.
+        secret_env: Name of environment variable holding the key; takes
+            precedence over `secret`.
+
+    Raises:
+        ValueError: The environment variable is not set.
+    """
+    if secret_env is not None:
+        secret = os.environ.get(secret_env)
+        if not secret:
+            raise ValueError(
+                f"Environment variable '{secret_env}' holding the secret for "
+                "signing page tokens is not set."
+            )
+    if secret:
+        app.extensions.setdefault(
+            _PAGE_TOKEN_SECRETS_KEY, {}
+        )[blueprint] = secret
+
+
+def _get_secret(secret: Optional[Union[str, bytes]]) -> bytes:
+    """Get key for signing continuation tokens.
+
+    Args:
+        secret: Key passed by caller.
+
+    Returns:
+        Key, as bytes.
+
+    Raises:
+        ValueError: No key is available.
+    """
+    if secret is None and has_request_context():
+        secret = current_app.extensions.get(
+            _PAGE_TOKEN_SECRETS_KEY, {}
+        ).get(request.blueprint)
+    if secret is None and has_app_context():
+        secret = current_app.secret_key
+    if not secret:
+        raise ValueError(
+            "No secret for signing page tokens: pass a secret, configure "
+            "one for the specification or set the Flask app's SECRET_KEY."
+        )
+    return secret.encode() if isinstance(secret, str) else secret
+
+
+def _get_keyset_filter(
+    sort: Sequence[Tuple[str, int]],
+    values: Sequence[Any],
+) -> Dict[str, Any]:
+    """Build filter for documents sorting after given sort key values.
+
+    MongoDB sorts null and missing values before all other values, but
+    excludes them from range queries; they are therefore matched
+    explicitly.
+
+    Args:
+        sort: Sort keys and directions.
+        values: Sort key values of last document of previous page.
+
+    Returns:
+        Query filter.
+    """
+    clauses = []
+    for index, (field, direction) in enumerate(sort):
+        clause: Dict[str, Any] = {
+            prev_field: values[prev_index]
+            for prev_index, (prev_field, _) in enumerate(sort[:index])
+        }
+        value = values[index]
+        if direction > 0:
+            clause[field] = (
+                {"$ne": None} if value is None else {"$gt": value}
+            )
+        elif value is None:
+            # Nothing sorts before null values
+            continue
+        else:
+            clause["$or"] = [{field: {"$lt": value}}, {field: None}]
+        clauses.append(clause)
+    return {"$or": clauses}
+
+
+def _encode_page_token(
+    values: Sequence[Any],
+    key: bytes,
+    fingerprint: str,
+) -> str:
+    """Create signed continuation token.
+
+    Args:
+        values: Sort key values of last document of page.
+        key: Signing key.
+        fingerprint: Fingerprint of query filter and sort order.
+
+    Returns:
+        Continuation token.
+    """
+    payload = json_util.dumps({"q": fingerprint, "v": list(values)}).encode()
+    signature = hmac.new(key, payload, hashlib.sha256).digest()
+    return ".".join(
+        urlsafe_b64encode(part).decode().rstrip("=")
+        for part in (payload, signature)
+    )
+
+
+def _decode_page_token(
+    token: str,
+    key: bytes,
+    fingerprint: str,
+) -> List[Any]:
+    """Verify continuation token and extract sort key values.
+
+    Args:
+        token: Continuation token.
+        key: Signing key.
+        fingerprint: Fingerprint of query filter and sort order.
+
+    Returns:
+        Sort key values of last document of previous page.
+
+    Raises:
+        werkzeug.exceptions.BadRequest: The token is invalid.
+    """
+    try:
+        payload, signature = (
+            urlsafe_b64decode(part + "=" * (-len(part) % 4))
+            for part in token.split(".")
+        )
+        if not hmac.compare_digest(
+            signature,
+            hmac.new(key, payload, hashlib.sha256).digest(),
+        ):
+            raise ValueError("signature mismatch")
+        data = json_util.loads(payload)
+        if data["q"] != fingerprint:
+            raise ValueError("query mismatch")
+        return list(data["v"])
+    except (ValueError, TypeError, KeyError) as exc:
+        raise BadRequest("Invalid page token.") from exc
+
+
+def _extend_projection(
+    projection: Optional[Union[Mapping[str, Any], Sequence[str]]],
+    fields: Sequence[str],
+) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+    """Extend projection to include sort keys.
+
+    Args:
+        projection: Requested projection.
+        fields: Sort keys.
+
+    Returns:
+        Tuple of extended projection and sort keys that are to be removed
+        from fetched documents.
+    """
+    if projection is None:
+        return None, []
+    if not isinstance(projection, Mapping):
+        projection = {field: True for field in projection}
+    inclusion = any(
+        value for field, value in projection.items() if field != "_id"
+    )
+    extended = dict(projection)
+    strip = []
+    for field in fields:
+        if field in extended:
+            if not extended[field]:
+                del extended[field]
+                strip.append(field)
+        elif inclusion and field != "_id":
+            extended[field] = True
+            strip.append(field)
+    return extended or None, strip
+
+
+def _get_field(document: Mapping[str, Any], field: str) -> Any:
+    """Get value of (possibly nested) field.
+
+    Args:
+        document: Document.
+        field: Field name, with nested fields separated by dots.
+
+    Returns:
+        Value of field or ``None`` if it does not exist.
+    """
+    value: Any = document
+    for name in field.split("."):
+        if not isinstance(value, Mapping):
+            return None
+        value = value.get(name)
+    return value
+
+
+def _pop_field(document: Dict[str, Any], field: str) -> None:
+    """Remove (possibly nested) field.
+
+    Args:
+        document: Document.
+        field: Field name, with nested fields separated by dots.
+    """
+    *parents, name = field.split(".")
+    for parent in parents:
+        document = document.get(parent)  # type: ignore[assignment]
+        if not isinstance(document, dict):
+            return
+    document.pop(name, None)
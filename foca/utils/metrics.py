@@ -0,0 +1,188 @@
+"""Utility functions for collecting app metrics."""
+
+from bisect import bisect_left
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Default upper bounds of histogram buckets; suitable for latencies in
+# seconds
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+    10.0,
+)
+
+_LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class MetricsRegistry():
+    """Thread-safe registry of counters and histograms.
+
+    Metrics are identified by a name and an optional set of labels. They are
+    created when first recorded.
+
+    Args:
+        buckets: Upper bounds of histogram buckets, in ascending order.
+
+    Attributes:
+        buckets: Upper bounds of histogram buckets, in ascending order.
+
+    Example:
+
+        >>> registry = MetricsRegistry()
+        >>> registry.increment("requests", method="GET")
+        >>> registry.get_counter("requests", method="GET")
+        1.0
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Constructor method."""
+        self.buckets: Tuple[float, ...] = tuple(buckets)
+        self._lock: Lock = Lock()
+        self._counters: Dict[str, Dict[_LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[_LabelKey, Dict[str, Any]]] = {}
+
+    def increment(self, name: str, value: float = 1, **labels: Any) -> None:
+        """Increment counter.
+
+        Args:
+            name: Name of the counter.
+            value: Value by which the counter is incremented.
+            **labels: Labels of the counter.
+        """
+        key = self._get_key(labels)
+        with self._lock:
+            counter = self._counters.setdefault(name, {})
+            counter[key] = counter.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record observation in histogram.
+
+        Args:
+            name: Name of the histogram.
+            value: Observed value.
+            **labels: Labels of the histogram.
+        """
+        key = self._get_key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            histograms = self._histograms.setdefault(name, {})
+            histogram = histograms.get(key)
+            if histogram is None:
+                histogram = histograms[key] = {
+                    "count": 0,
+                    "sum": 0.0,
+                    "min": value,
+                    "max": value,
+                    "buckets": [0] * (len(self.buckets) + 1),
+                }
+            histogram["count"] += 1
+            histogram["sum"] += value
+            histogram["min"] = min(histogram["min"], value)
+            histogram["max"] = max(histogram["max"], value)
+            histogram["buckets"][index] += 1
+
+    def get_counter(self, name: str, **labels: Any) -> float:
+        """Get value of counter.
+
+        Args:
+            name: Name of the counter.
+            **labels: Labels of the counter.
+
+        Returns:
+            Value of the counter; ``0.0`` if it was never incremented.
+        """
+        with self._lock:
+            return self._counters.get(name, {}).get(
+                self._get_key(labels), 0.0
+            )
+
+    def get_histogram(
+        self,
+        name: str,
+        **labels: Any,
+    ) -> Optional[Dict[str, Any]]:
+        """Get summary of histogram.
+
+        Args:
+            name: Name of the histogram.
+            **labels: Labels of the histogram.
+
+        Returns:
+            Dictionary with the ``count``, ``sum``, ``min`` and ``max`` of
+            observed values, as well as the number of observations per
+            bucket (``buckets``), keyed by the upper bound of each bucket
+            (including ``inf``), or ``None`` if no values were observed.
+        """
+        with self._lock:
+            histogram = self._histograms.get(name, {}).get(
+                self._get_key(labels)
+            )
+            if histogram is None:
+                return None
+            return self._summarize(histogram)
+
+    def snapshot(self) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """Get values of all metrics.
+
+        Returns:
+            Dictionary with keys ``counters`` and ``histograms``, each
+            mapping metric names to lists of dictionaries with the
+            ``labels`` and ``value`` of each labelled metric.
+        """
+        with self._lock:
+            return {
+                "counters": {
+                    name: [
+                        {"labels": dict(key), "value": value}
+                        for key, value in counter.items()
+                    ]
+                    for name, counter in self._counters.items()
+                },
+                "histograms": {
+                    name: [
+                        {"labels": dict(key), "value": self._summarize(hist)}
+                        for key, hist in histograms.items()
+                    ]
+                    for name, histograms in self._histograms.items()
+                },
+            }
+
+    def reset(self) -> None:
+        """Remove all metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def _summarize(self, histogram: Dict[str, Any]) -> Dict[str, Any]:
+        """Create summary of histogram.
+
+        Args:
+            histogram: Internal representation of histogram.
+
+        Returns:
+            Summary of histogram, cf. :py:meth:`get_histogram`.
+        """
+        bounds = [*self.buckets, float("inf")]
+        return {
+            "count": histogram["count"],
+            "sum": histogram["sum"],
+            "min": histogram["min"],
+            "max": histogram["max"],
+            "buckets": dict(zip(bounds, histogram["buckets"])),
+        }
+
+    @staticmethod
+    def _get_key(labels: Dict[str, Any]) -> _LabelKey:
+        """Create hashable key from labels.
+
+        Args:
+            labels: Labels of a metric.
+
+        Returns:
+            Sorted tuple of label names and values.
+        """
+        return tuple(sorted((key, str(val)) for key, val in labels.items()))
+
+
+# Registry shared by all FOCA components
+metrics = MetricsRegistry()
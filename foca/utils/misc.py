@@ -2,6 +2,7 @@
 
 from random import choice
 import string
+import sys
 
 
 def generate_id(
@@ -39,3 +40,26 @@ def generate_id(
         )
     charset = ''.join(sorted(set(charset)))
     return ''.join(choice(charset) for __ in range(length))
+
+
+def get_caller(depth: int = 1) -> str:
+    """Get file and function name of a caller.
+
+    Unlike :py:func:`inspect.stack`, only the requested frame is accessed and
+    no source code context is read from disk, so the lookup is cheap even in
+    deep call stacks.
+
+    Args:
+        depth: Number of frames to go up the call stack, relative to the
+            function calling `get_caller()`; ``1`` refers to that function's
+            caller.
+
+    Returns:
+        File and function name of the caller, separated by a colon, or
+        ``'<unknown>'`` if the call stack is not deep enough.
+    """
+    try:
+        frame = sys._getframe(depth + 1)
+    except ValueError:
+        return "<unknown>"
+    return f"{frame.f_code.co_filename}:{frame.f_code.co_name}"
@@ -0,0 +1,183 @@
+"""Utility functions for profiling app startup."""
+
+import builtins
+from contextlib import contextmanager
+import importlib
+import json
+import logging
+from pathlib import Path
+import sys
+from time import perf_counter
+import tracemalloc
+from typing import (Any, Callable, Dict, Iterator, List, Optional)
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfiler():
+    """Collect wall time, import time and memory usage of startup phases.
+
+    While a phase is profiled, calls to :py:func:`builtins.__import__` and
+    :py:func:`importlib.import_module` are timed and memory allocations are
+    traced with :py:mod:`tracemalloc`. If the profiler is disabled, phases
+    are executed without any instrumentation.
+
+    Args:
+        enabled: Whether phases are to be profiled.
+        output: Path to file to which the profile is written in JSON format.
+            If ``None``, the profile is only logged.
+
+    Attributes:
+        enabled: Whether phases are to be profiled.
+        output: Path to file to which the profile is written in JSON format.
+            If ``None``, the profile is only logged.
+        phases: List of profiled phases, in the order of execution.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        output: Optional[Path] = None,
+    ) -> None:
+        """Constructor method."""
+        self.enabled: bool = enabled
+        self.output: Optional[Path] = output
+        self.phases: List[Dict[str, Any]] = []
+        self._import_time: float = 0.0
+        self._import_depth: int = 0
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Profile a startup phase.
+
+        Args:
+            name: Name of the phase.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        original_import = builtins.__import__
+        original_import_module = importlib.import_module
+        builtins.__import__ = self._timed(original_import)
+        importlib.import_module = self._timed(  # type: ignore[assignment]
+            original_import_module
+        )
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        memory_start = tracemalloc.get_traced_memory()[0]
+        modules_start = len(sys.modules)
+        self._import_time = 0.0
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            wall_time = perf_counter() - start
+            memory_end, memory_peak = tracemalloc.get_traced_memory()
+            if not tracing:
+                tracemalloc.stop()
+            builtins.__import__ = original_import
+            importlib.import_module = original_import_module
+            self.phases.append({
+                "name": name,
+                "wall_time": wall_time,
+                "import_time": self._import_time,
+                "imported_modules": len(sys.modules) - modules_start,
+                "memory_allocated": memory_end - memory_start,
+                "memory_peak": memory_peak - memory_start,
+            })
+
+    def record(self, name: str, wall_time: float) -> None:
+        """Record wall time of a phase that was timed externally.
+
+        Args:
+            name: Name of the phase.
+            wall_time: Wall time of the phase, in seconds.
+        """
+        if not self.enabled:
+            return
+        self.phases.append({
+            "name": name,
+            "wall_time": wall_time,
+            "import_time": None,
+            "imported_modules": None,
+            "memory_allocated": None,
+            "memory_peak": None,
+        })
+
+    def report(self) -> Dict[str, Any]:
+        """Summarize profiled phases.
+
+        Returns:
+            Dictionary with the list of profiled ``phases`` and the
+            ``total`` wall time and import time across all phases, in
+            seconds.
+        """
+        return {
+            "phases": self.phases,
+            "total": {
+                "wall_time": sum(p["wall_time"] for p in self.phases),
+                "import_time": sum(
+                    p["import_time"] or 0.0 for p in self.phases
+                ),
+            },
+        }
+
+    def finish(self) -> Optional[Dict[str, Any]]:
+        """Log profile and, if configured, write it to file.
+
+        Returns:
+            Profile as returned by :py:meth:`report` or ``None`` if the
+            profiler is disabled.
+        """
+        if not self.enabled:
+            return None
+        report = self.report()
+        logger.info("Startup profile:")
+        for phase in report["phases"]:
+            if phase["import_time"] is None:
+                logger.info(
+                    f"* {phase['name']}: {phase['wall_time']:.3f}s"
+                )
+                continue
+            logger.info(
+                f"* {phase['name']}: {phase['wall_time']:.3f}s "
+                f"(imports: {phase['import_time']:.3f}s, "
+                f"{phase['imported_modules']} modules; memory: "
+                f"{phase['memory_allocated'] / 2**20:+.1f} MiB, peak "
+                f"{phase['memory_peak'] / 2**20:.1f} MiB)"
+            )
+        logger.info(
+            f"* total: {report['total']['wall_time']:.3f}s "
+            f"(imports: {report['total']['import_time']:.3f}s)"
+        )
+        if self.output is not None:
+            with open(self.output, "w") as _file:
+                json.dump(report, _file, indent=2)
+            logger.info(f"Startup profile written to '{self.output}'.")
+        return report
+
+    def _timed(self, func: Callable) -> Callable:
+        """Wrap import function to accumulate time spent in outermost calls.
+
+        Args:
+            func: Import function to be wrapped.
+
+        Returns:
+            Wrapped import function.
+        """
+        def _wrapper(*args, **kwargs):
+            """Time import function call."""
+            if self._import_depth:
+                return func(*args, **kwargs)
+            self._import_depth += 1
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._import_time += perf_counter() - start
+                self._import_depth -= 1
+
+        return _wrapper
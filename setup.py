@@ -80,7 +80,10 @@ setup(
     install_requires=install_requires,
     extras_require={
         "dev": dev_requires,
+        "async": ["asgiref>=3.2", "pymongo>=4.9"],
+        "compression": ["brotli>=1.0", "zstandard>=0.19"],
         "docs": docs_require,
+        "validation": ["fastjsonschema>=2.16"],
     },
     include_package_data=True,
     package_data={
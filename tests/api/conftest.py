@@ -0,0 +1,62 @@
+"""Shared fixtures for API tests."""
+
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from connexion import App
+from flask.testing import FlaskClient
+import pytest
+import yaml
+
+from foca.api.register_openapi import register_openapi
+from foca.models.config import ResponseCacheConfig, SpecConfig
+
+# Define mock data
+DIR = Path(__file__).parents[1].resolve() / "test_files"
+PATH_SPECS_3_YAML_ORIGINAL = DIR / "openapi_3_petstore.original.yaml"
+SPEC_CONFIG = {
+    "add_operation_fields": {"x-openapi-router-controller": "controllers"},
+    "disable_auth": True,
+}
+
+
+@pytest.fixture
+def create_client(tmp_path):
+    """Factory of test clients for apps with the petstore specs.
+
+    The factory accepts the following keyword arguments:
+
+    * `modify_spec`: Function modifying the parsed specification in place
+      before it is registered, e.g., to add extension fields to operations.
+    * `modify_app`: Function called with the Connexion application instance
+      before the specification is registered, e.g., to add further routes or
+      configuration.
+    * `response_cache`: Configuration of the response cache.
+    * Any other argument overrides the corresponding field of the
+      :py:class:`foca.models.config.SpecConfig` instance, which by default
+      routes operations to the ``controllers`` module and disables
+      authentication.
+    """
+    def _create_client(
+        modify_spec: Optional[Callable[[Dict], None]] = None,
+        modify_app: Optional[Callable[[App], None]] = None,
+        response_cache: Optional[ResponseCacheConfig] = None,
+        **spec_config,
+    ) -> FlaskClient:
+        spec = yaml.safe_load(PATH_SPECS_3_YAML_ORIGINAL.read_text())
+        if modify_spec is not None:
+            modify_spec(spec)
+        path = tmp_path / "specs.yaml"
+        with open(path, "w") as spec_file:
+            yaml.safe_dump(spec, spec_file)
+        app = App(__name__)
+        if modify_app is not None:
+            modify_app(app)
+        register_openapi(
+            app=app,
+            specs=[SpecConfig(**{**SPEC_CONFIG, **spec_config, "path": path})],
+            response_cache=response_cache,
+        )
+        return app.app.test_client()
+
+    return _create_client
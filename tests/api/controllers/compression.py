@@ -0,0 +1,17 @@
+PETS = {"pets": [{"id": i, "name": f"pet_{i}"} for i in range(100)]}
+
+
+def listPets(limit=None):
+    return PETS
+
+
+def createPets():
+    return {}
+
+
+def showPetById(petId):
+    return PETS["pets"][0]
+
+
+def putPetsById():
+    return {}
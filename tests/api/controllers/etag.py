@@ -0,0 +1,17 @@
+from foca.api.etag import check_etag
+
+# Version of pets resource; entity tags are hashes of response bodies if
+# `None`
+state = {"version": None, "calls": 0}
+
+
+def listPets(limit=None):
+    if state["version"] is not None:
+        check_etag(state["version"])
+    state["calls"] += 1
+    return {"pets": ["Rex"]}
+
+
+def createPets():
+    check_etag(state["version"])
+    return {}, 201
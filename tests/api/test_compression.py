@@ -0,0 +1,169 @@
+"""Tests for the compression of responses."""
+
+import gzip
+import json
+
+import brotli
+from flask import Response, send_file
+import pytest
+import zstandard
+
+from controllers.compression import PETS
+from foca.api import compression
+from foca.api.compression import compress, register_compression
+from foca.models.config import CompressionAlgorithmEnum, CompressionConfig
+
+# Define mock data
+DECOMPRESS = {
+    "br": brotli.decompress,
+    "gzip": gzip.decompress,
+    "zstd": lambda data: zstandard.ZstdDecompressor().decompressobj(
+    ).decompress(data),
+}
+
+
+@pytest.fixture
+def create_client(create_client, tmp_path):
+    """Factory of test clients for apps with the petstore specs, further
+    routes and compression.
+    """
+    static_file = tmp_path / "swagger-ui.js"
+    static_file.write_text("var ui = 1;\n" * 100)
+
+    def _create_client(**kwargs):
+
+        def _modify_app(app):
+
+            @app.app.route("/stream")
+            def stream():
+                return Response(
+                    (json.dumps(pet) + "\n" for pet in PETS["pets"]),
+                    mimetype="text/plain",
+                )
+
+            @app.app.route("/ui/swagger-ui.js")
+            def swagger_ui():
+                return send_file(static_file)
+
+            @app.app.route("/image")
+            def image():
+                return Response(b"0" * 1000, mimetype="image/png")
+
+            register_compression(
+                app.app,
+                CompressionConfig(enabled=True, **kwargs),
+            )
+
+        return create_client(
+            modify_app=_modify_app,
+            add_operation_fields={
+                "x-openapi-router-controller": "controllers.compression",
+            },
+        )
+
+    return _create_client
+
+
+class TestCompress:
+
+    @pytest.mark.parametrize("algorithm", list(CompressionAlgorithmEnum))
+    def test_round_trip(self, algorithm):
+        """Data is compressed with each algorithm."""
+        data = json.dumps(PETS).encode()
+        res = compress(data, algorithm, level=100)
+        assert len(res) < len(data)
+        assert DECOMPRESS[algorithm.value](res) == data
+
+
+class TestRegisterCompression:
+
+    @pytest.mark.parametrize("encoding", ["br", "gzip", "zstd"])
+    def test_compressed(self, create_client, encoding):
+        """Responses are compressed with accepted algorithm."""
+        client = create_client()
+        res = client.get("/v2/pets", headers={"Accept-Encoding": encoding})
+        assert res.headers["Content-Encoding"] == encoding
+        assert "Accept-Encoding" in res.headers["Vary"]
+        assert json.loads(DECOMPRESS[encoding](res.data)) == PETS
+
+    def test_preference(self, create_client):
+        """Algorithms are negotiated by quality and configured order."""
+        client = create_client()
+        res = client.get("/v2/pets", headers={"Accept-Encoding": "gzip, br"})
+        assert res.headers["Content-Encoding"] == "br"
+        res = client.get(
+            "/v2/pets",
+            headers={"Accept-Encoding": "gzip, br;q=0.5"},
+        )
+        assert res.headers["Content-Encoding"] == "gzip"
+
+    def test_not_accepted(self, create_client):
+        """Responses are not compressed if client accepts no algorithm."""
+        client = create_client(algorithms=["gzip"])
+        res = client.get("/v2/pets", headers={"Accept-Encoding": "br"})
+        assert "Content-Encoding" not in res.headers
+        assert res.json == PETS
+
+    def test_min_size(self, create_client):
+        """Small responses are not compressed."""
+        client = create_client()
+        res = client.get("/v2/pets/0", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in res.headers
+
+    def test_mimetype(self, create_client):
+        """Responses of other MIME types are not compressed."""
+        client = create_client()
+        res = client.get("/image", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in res.headers
+
+    def test_stream(self, create_client):
+        """Streamed responses are compressed incrementally."""
+        client = create_client()
+        res = client.get(
+            "/stream",
+            headers={"Accept-Encoding": "gzip"},
+            buffered=False,
+        )
+        assert res.headers["Content-Encoding"] == "gzip"
+        assert "Content-Length" not in res.headers
+        decompressor = compression.zlib.decompressobj(
+            16 + compression.zlib.MAX_WBITS,
+        )
+        chunks = [decompressor.decompress(chunk) for chunk in res.response]
+        assert chunks[0] == (json.dumps(PETS["pets"][0]) + "\n").encode()
+        assert b"".join(chunks).count(b"\n") == len(PETS["pets"])
+
+    def test_static(self, create_client, monkeypatch):
+        """Static files are compressed once."""
+        client = create_client()
+        calls = []
+        _compress = compression.compress
+
+        def _count(*args, **kwargs):
+            calls.append(args)
+            return _compress(*args, **kwargs)
+
+        monkeypatch.setattr(compression, "compress", _count)
+        for _ in range(2):
+            res = client.get(
+                "/ui/swagger-ui.js",
+                headers={"Accept-Encoding": "gzip"},
+            )
+            assert res.headers["Content-Encoding"] == "gzip"
+            assert gzip.decompress(res.data) == b"var ui = 1;\n" * 100
+            assert res.headers["ETag"].startswith("W/")
+        assert len(calls) == 1
+
+    def test_algorithm_unavailable(self, create_client, monkeypatch):
+        """Algorithms are skipped if dependencies are not installed."""
+        monkeypatch.setattr(compression, "brotli", None)
+        client = create_client()
+        res = client.get("/v2/pets", headers={"Accept-Encoding": "br, gzip"})
+        assert res.headers["Content-Encoding"] == "gzip"
+
+    def test_no_algorithm_available(self, create_client, monkeypatch):
+        """Responses are not compressed if no algorithm is available."""
+        monkeypatch.setattr(compression, "brotli", None)
+        client = create_client(algorithms=["br"])
+        res = client.get("/v2/pets", headers={"Accept-Encoding": "br"})
+        assert "Content-Encoding" not in res.headers
@@ -0,0 +1,152 @@
+"""Tests for the dereferencing of OpenAPI specifications."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from foca.api.dereference_openapi import SpecDereferencer
+
+# Define mock data
+ERROR = {
+    "type": "object",
+    "properties": {
+        "code": {"type": "integer"},
+        "message": {"type": "string"},
+    },
+}
+SCHEMAS = {
+    "Error": ERROR,
+    "Pet": {
+        "type": "object",
+        "properties": {
+            "id": {"$ref": "#/Id"},
+            "children": {
+                "type": "array",
+                "items": {"$ref": "#/Pet"},
+            },
+        },
+    },
+    "Id": {"type": "integer"},
+}
+SPEC = {
+    "openapi": "3.0.0",
+    "paths": {
+        "/pets/{petId}": {
+            "get": {
+                "responses": {
+                    "200": {
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "schemas.yaml#/Pet"},
+                            },
+                        },
+                    },
+                    "default": {
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "$ref": "#/components/schemas/Error",
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    "components": {
+        "schemas": {
+            "Error": ERROR,
+            "OtherError": {"$ref": "schemas.yaml#/Error"},
+            "Node": {
+                "type": "object",
+                "properties": {
+                    "next": {"$ref": "#/components/schemas/Node"},
+                },
+            },
+        },
+    },
+}
+
+
+@pytest.fixture
+def spec_path(tmp_path):
+    """Specification file referencing another file."""
+    with open(tmp_path / "schemas.yaml", "w") as schemas_file:
+        yaml.safe_dump(SCHEMAS, schemas_file)
+    path = tmp_path / "specs.yaml"
+    with open(path, "w") as spec_file:
+        yaml.safe_dump(SPEC, spec_file)
+    return path
+
+
+class TestSpecDereferencer:
+
+    def test_dereference(self, spec_path):
+        """Local and relative file references are resolved."""
+        dereferencer = SpecDereferencer(path=spec_path)
+        res = dereferencer.dereference(SPEC)
+        responses = res["paths"]["/pets/{petId}"]["get"]["responses"]
+        pet = responses["200"]["content"]["application/json"]["schema"]
+        assert pet["properties"]["id"] == {"type": "integer"}
+        error = responses["default"]["content"]["application/json"]["schema"]
+        assert error == ERROR
+        assert list(dereferencer.files) == [
+            str(spec_path.parent / "schemas.yaml")
+        ]
+
+    def test_dereference_input_unchanged(self, spec_path):
+        """Specification passed for dereferencing is not modified."""
+        spec = yaml.safe_load(spec_path.read_text())
+        SpecDereferencer(path=spec_path).dereference(spec)
+        assert spec == SPEC
+
+    def test_dereference_circular(self, spec_path):
+        """Circular references are kept."""
+        dereferencer = SpecDereferencer(path=spec_path)
+        res = dereferencer.dereference(SPEC)
+        node = res["components"]["schemas"]["Node"]
+        assert node["properties"]["next"] == {
+            "$ref": "#/components/schemas/Node",
+        }
+        responses = res["paths"]["/pets/{petId}"]["get"]["responses"]
+        pet = responses["200"]["content"]["application/json"]["schema"]
+        assert pet["properties"]["children"]["items"] == {
+            "$ref": f"{(spec_path.parent / 'schemas.yaml').as_uri()}#/Pet",
+        }
+        assert len(dereferencer.circular) == 2
+
+    def test_dereference_deduplicated(self, spec_path):
+        """Identical referenced schemas are shared."""
+        res = SpecDereferencer(path=spec_path).dereference(SPEC)
+        responses = res["paths"]["/pets/{petId}"]["get"]["responses"]
+        error = responses["default"]["content"]["application/json"]["schema"]
+        assert res["components"]["schemas"]["OtherError"] is error
+        assert res["components"]["schemas"]["Error"] is error
+
+    def test_dereference_remote(self, spec_path):
+        """Remote references are kept."""
+        spec = {"schema": {"$ref": "https://example.org/schemas.yaml#/Pet"}}
+        res = SpecDereferencer(path=spec_path).dereference(spec)
+        assert res == spec
+
+    def test_dereference_unresolvable(self, spec_path):
+        """Dereferencing failing because reference cannot be resolved."""
+        spec = {"schema": {"$ref": "schemas.yaml#/DoesNotExist"}}
+        with pytest.raises(ValueError):
+            SpecDereferencer(path=spec_path).dereference(spec)
+
+    def test_dereference_file_not_found(self, spec_path):
+        """Dereferencing failing because referenced file is unavailable."""
+        spec = {"schema": {"$ref": "does/not/exist.yaml#/Pet"}}
+        with pytest.raises(OSError):
+            SpecDereferencer(path=spec_path).dereference(spec)
+
+    def test_dereference_invalid_file(self, spec_path):
+        """Dereferencing failing because referenced file is invalid."""
+        path = Path(spec_path.parent / "invalid.yaml")
+        path.write_text("{invalid")
+        spec = {"schema": {"$ref": "invalid.yaml#/Pet"}}
+        with pytest.raises(ValueError):
+            SpecDereferencer(path=spec_path).dereference(spec)
@@ -0,0 +1,144 @@
+"""Tests for entity tags and conditional requests."""
+
+import pytest
+
+from controllers.etag import state
+from foca.api.etag import ETAG_EXTENSION
+from foca.api.response_cache import CACHE_EXTENSION
+from foca.errors.exceptions import register_exception_handler
+from foca.models.config import Config
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    """Reset state of controllers."""
+    state.update(version=None, calls=0)
+
+
+@pytest.fixture
+def create_client(create_client):
+    """Factory of test clients for apps with the pets endpoint of the
+    petstore specs, with entity tags enabled by default.
+    """
+    def _create_client(etag=True, extension=None, cache=None):
+
+        def _modify_spec(spec):
+            spec['paths'] = {'/pets': spec['paths']['/pets']}
+            spec['paths']['/pets']['get']['responses']['200']['content'][
+                'application/json'
+            ]['schema'] = {"type": "object"}
+            if extension is not None:
+                spec['paths']['/pets']['get'][ETAG_EXTENSION] = extension
+            if cache is not None:
+                spec['paths']['/pets']['get'][CACHE_EXTENSION] = cache
+
+        def _modify_app(app):
+            app.app.config.foca = Config()
+            register_exception_handler(app)
+
+        return create_client(
+            modify_spec=_modify_spec,
+            modify_app=_modify_app,
+            add_operation_fields={
+                "x-openapi-router-controller": "controllers.etag",
+            },
+            etag=etag,
+        )
+
+    return _create_client
+
+
+class TestETag:
+
+    def test_body_hash(self, create_client):
+        """Entity tag is hash of response body."""
+        client = create_client()
+        res = client.get("/v2/pets")
+        assert res.status_code == 200
+        etag = res.headers["ETag"]
+        assert client.get("/v2/pets").headers["ETag"] == etag
+        res = client.get("/v2/pets", headers={"If-None-Match": etag})
+        assert res.status_code == 304
+        assert res.data == b""
+        assert res.headers["ETag"] == etag
+
+    def test_body_hash_no_match(self, create_client):
+        """Full response is returned if entity tag does not match."""
+        client = create_client()
+        res = client.get("/v2/pets", headers={"If-None-Match": '"other"'})
+        assert res.status_code == 200
+        assert res.json == {"pets": ["Rex"]}
+
+    def test_version(self, create_client):
+        """Entity tag is version set by controller, which is not run to
+        completion for matching requests.
+        """
+        state["version"] = 3
+        client = create_client()
+        res = client.get("/v2/pets")
+        assert res.headers["ETag"] == '"3"'
+        res = client.get("/v2/pets", headers={"If-None-Match": '"3"'})
+        assert res.status_code == 304
+        assert res.headers["ETag"] == '"3"'
+        assert state["calls"] == 1
+
+    def test_disabled(self, create_client):
+        """Entity tags are not added if disabled."""
+        client = create_client(etag=False)
+        res = client.get("/v2/pets")
+        assert "ETag" not in res.headers
+
+    def test_operation_disabled(self, create_client):
+        """Entity tags are disabled for individual operation."""
+        client = create_client(extension=False)
+        res = client.get("/v2/pets")
+        assert "ETag" not in res.headers
+
+    def test_operation_enabled(self, create_client):
+        """Entity tags are enabled for individual operation."""
+        client = create_client(etag=False, extension=True)
+        res = client.get("/v2/pets")
+        assert "ETag" in res.headers
+
+    def test_cached(self, create_client):
+        """Entity tags set via `check_etag()` are kept for cached
+        responses.
+        """
+        state["version"] = 3
+        client = create_client(cache=True)
+        res = client.get("/v2/pets")
+        assert res.headers["ETag"] == '"3"'
+        res = client.get("/v2/pets")
+        assert res.headers["ETag"] == '"3"'
+        res = client.get("/v2/pets", headers={"If-None-Match": '"3"'})
+        assert res.status_code == 304
+        assert state["calls"] == 1
+
+    def test_if_match(self, create_client):
+        """Writes are only performed if current version matches."""
+        state["version"] = 3
+        client = create_client()
+        res = client.post("/v2/pets", headers={"If-Match": '"3"'})
+        assert res.status_code == 201
+        res = client.post("/v2/pets", headers={"If-Match": '"2"'})
+        assert res.status_code == 412
+
+    def test_if_match_weak(self, create_client):
+        """Weak entity tags do not satisfy preconditions of writes."""
+        state["version"] = 3
+        client = create_client()
+        res = client.post("/v2/pets", headers={"If-Match": 'W/"3"'})
+        assert res.status_code == 412
+
+    def test_if_match_no_resource(self, create_client):
+        """Writes to missing resources fail if a version is expected."""
+        client = create_client()
+        res = client.post("/v2/pets", headers={"If-Match": "*"})
+        assert res.status_code == 412
+
+    def test_if_none_match_write(self, create_client):
+        """Writes fail if resource must not exist."""
+        state["version"] = 3
+        client = create_client()
+        res = client.post("/v2/pets", headers={"If-None-Match": "*"})
+        assert res.status_code == 412
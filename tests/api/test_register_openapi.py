@@ -3,15 +3,22 @@ instance.
 """
 
 from copy import deepcopy
+import os
 from pathlib import Path
 
 from connexion import App
 from connexion.exceptions import InvalidSpecification
+import mongomock
 import pytest
+import yaml
 from yaml import YAMLError
 
+from foca.api import spec_passes
 from foca.api.register_openapi import register_openapi
+from foca.api.spec_passes import register_spec_pass, SpecPass
+from foca.config.config_parser import ConfigParser
 from foca.models.config import SpecConfig
+from foca.utils.db import paginate
 
 # Define mock data
 DIR = Path(__file__).parents[1].resolve() / "test_files"
@@ -87,6 +94,36 @@ SPEC_CONFIG_3_DISABLE_AUTH = deepcopy(SPEC_CONFIG_3)
 SPEC_CONFIG_3_DISABLE_AUTH['disable_auth'] = True
 
 
+@pytest.fixture(autouse=True)
+def spec_configs_tmp_path(monkeypatch, tmp_path):
+    """Write processed specs to temporary directory."""
+    for name, spec_config in [
+        ("2", SPEC_CONFIG_2),
+        ("3", SPEC_CONFIG_3),
+        ("3_pathitemparam", SPEC_CONFIG_3_PATHITEMPARAM),
+        ("2_json", SPEC_CONFIG_2_JSON),
+        ("2_list", SPEC_CONFIG_2_LIST),
+        ("2_multi", SPEC_CONFIG_2_MULTI),
+        ("2_disable_auth", SPEC_CONFIG_2_DISABLE_AUTH),
+        ("3_disable_auth", SPEC_CONFIG_3_DISABLE_AUTH),
+    ]:
+        monkeypatch.setitem(
+            spec_config,
+            "path_out",
+            tmp_path / f"openapi_{name}.modified.yaml",
+        )
+
+
+class TimeoutPass(SpecPass):
+    """Pass adding timeouts to Operation Objects."""
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+
+    def visit_operation(self, path, method, operation):
+        operation["x-timeout"] = self.timeout
+
+
 class TestRegisterOpenAPI:
 
     def test_openapi_2_yaml(self):
@@ -188,3 +225,217 @@ class TestRegisterOpenAPI:
         spec_configs = [SpecConfig(**SPEC_CONFIG_3_DISABLE_AUTH)]
         res = register_openapi(app=app, specs=spec_configs)
         assert isinstance(res, App)
+
+    def test_openapi_pagination_secret(self):
+        """Successfully register OpenAPI 3 YAML specs with Connexion app;
+        key for signing page tokens used by default.
+        """
+        app = App(__name__)
+        spec_config = deepcopy(SPEC_CONFIG_3)
+        spec_config['pagination'] = {'secret': 'secret'}
+        register_openapi(app=app, specs=[SpecConfig(**spec_config)])
+        collection = mongomock.MongoClient().db.pets
+        collection.insert_many([{'id': index} for index in range(3)])
+        with app.app.test_request_context('/v2/pets'):
+            page = paginate(collection, limit=2)
+        assert paginate(
+            collection,
+            page_token=page.next_page_token,
+            secret='secret',
+        ).items[0]['id'] == 2
+
+    def test_openapi_workers(self):
+        """Successfully register OpenAPI 2 and 3 YAML specs with Connexion
+        app, loaded concurrently; specs registered in order.
+        """
+        app = App(__name__)
+        spec_configs = [
+            SpecConfig(**SPEC_CONFIG_3),
+            SpecConfig(**SPEC_CONFIG_2),
+        ]
+        res = register_openapi(app=app, specs=spec_configs, workers=2)
+        assert isinstance(res, App)
+        assert list(res.app.blueprints) == ['/v2', '/v1']
+
+    def test_openapi_workers_not_found(self):
+        """Registration failing because spec file is unavailable; specs
+        loaded concurrently.
+        """
+        app = App(__name__)
+        spec_configs = [
+            SpecConfig(**SPEC_CONFIG_3),
+            SpecConfig(path=PATH_NOT_FOUND),
+        ]
+        with pytest.raises(OSError):
+            register_openapi(app=app, specs=spec_configs, workers=2)
+
+
+class TestProcessedSpecCache:
+
+    def test_cache_written(self, tmp_path):
+        """Processed specs are written to `path_out`, prefixed with hash."""
+        app = App(__name__)
+        spec_config = deepcopy(SPEC_CONFIG_3)
+        spec_config['path_out'] = tmp_path / "specs.modified.yaml"
+        register_openapi(app=app, specs=[SpecConfig(**spec_config)])
+        with open(spec_config['path_out']) as spec_file:
+            assert spec_file.readline().startswith("# foca-spec-hash: ")
+
+    def test_cache_hit(self, tmp_path, monkeypatch):
+        """Processed specs are loaded from `path_out` if hash matches."""
+        spec_config = deepcopy(SPEC_CONFIG_3)
+        spec_config['path_out'] = tmp_path / "specs.modified.yaml"
+        register_openapi(app=App(__name__), specs=[SpecConfig(**spec_config)])
+        mtime = spec_config['path_out'].stat().st_mtime_ns
+
+        def _fail(*args):
+            raise AssertionError("specs parsed despite cache hit")
+
+        monkeypatch.setattr(ConfigParser, "merge_yaml", staticmethod(_fail))
+        res = register_openapi(
+            app=App(__name__),
+            specs=[SpecConfig(**spec_config)],
+        )
+        assert isinstance(res, App)
+        assert spec_config['path_out'].stat().st_mtime_ns == mtime
+
+    def test_cache_invalidated(self, tmp_path):
+        """Processed specs are regenerated if settings change."""
+        spec_config = deepcopy(SPEC_CONFIG_3)
+        spec_config['path_out'] = tmp_path / "specs.modified.yaml"
+        register_openapi(app=App(__name__), specs=[SpecConfig(**spec_config)])
+        header = spec_config['path_out'].read_text().splitlines()[0]
+        spec_config['disable_auth'] = True
+        register_openapi(app=App(__name__), specs=[SpecConfig(**spec_config)])
+        content = spec_config['path_out'].read_text()
+        assert content.splitlines()[0] != header
+        assert "securitySchemes" not in content
+
+    def test_cache_invalidated_custom_pass(self, tmp_path, monkeypatch):
+        """Processed specs are regenerated if custom passes change."""
+        monkeypatch.setattr(spec_passes, "_custom_passes", [])
+        spec_config = deepcopy(SPEC_CONFIG_3)
+        spec_config['path_out'] = tmp_path / "specs.modified.yaml"
+        register_spec_pass(TimeoutPass(timeout=10))
+        register_openapi(app=App(__name__), specs=[SpecConfig(**spec_config)])
+        assert "x-timeout: 10" in spec_config['path_out'].read_text()
+        monkeypatch.setattr(spec_passes, "_custom_passes", [])
+        register_spec_pass(TimeoutPass(timeout=20))
+        register_openapi(app=App(__name__), specs=[SpecConfig(**spec_config)])
+        assert "x-timeout: 20" in spec_config['path_out'].read_text()
+
+    def test_cache_corrupt(self, tmp_path):
+        """Corrupt processed specs are regenerated."""
+        spec_config = deepcopy(SPEC_CONFIG_3)
+        spec_config['path_out'] = tmp_path / "specs.modified.yaml"
+        register_openapi(app=App(__name__), specs=[SpecConfig(**spec_config)])
+        header = spec_config['path_out'].read_text().splitlines()[0]
+        spec_config['path_out'].write_text(f"{header}\n- not a spec\n")
+        res = register_openapi(
+            app=App(__name__),
+            specs=[SpecConfig(**spec_config)],
+        )
+        assert isinstance(res, App)
+        assert "paths" in spec_config['path_out'].read_text()
+
+    @pytest.mark.parametrize("path_out", [
+        "does/not/exist.yaml",
+        "file/specs.modified.yaml",
+    ])
+    def test_cache_not_writable(self, tmp_path, caplog, path_out):
+        """Registration succeeding although processed specs cannot be
+        written.
+        """
+        (tmp_path / "file").write_text("")
+        spec_config = deepcopy(SPEC_CONFIG_3)
+        spec_config['path_out'] = tmp_path / path_out
+        res = register_openapi(
+            app=App(__name__),
+            specs=[SpecConfig(**spec_config)],
+        )
+        assert isinstance(res, App)
+        assert any(
+            rule.rule.endswith("/pets") for rule in res.app.url_map.iter_rules()
+        )
+        assert not spec_config['path_out'].exists()
+        assert "could not be written" in caplog.text
+
+    @pytest.mark.skipif(
+        os.geteuid() == 0,
+        reason="file permissions are not enforced for root",
+    )
+    def test_cache_read_only(self, tmp_path, caplog):
+        """Registration succeeding although directory of processed specs is
+        not writable.
+        """
+        spec_config = deepcopy(SPEC_CONFIG_3)
+        spec_config['path_out'] = tmp_path / "specs.modified.yaml"
+        tmp_path.chmod(0o500)
+        try:
+            res = register_openapi(
+                app=App(__name__),
+                specs=[SpecConfig(**spec_config)],
+            )
+        finally:
+            tmp_path.chmod(0o700)
+        assert isinstance(res, App)
+        assert not spec_config['path_out'].exists()
+        assert "could not be written" in caplog.text
+
+    def test_cache_not_serializable(self, tmp_path):
+        """Registration failing because processed specs cannot be
+        serialized.
+        """
+        spec_config = deepcopy(SPEC_CONFIG_2)
+        spec_config['path_out'] = tmp_path / "specs.modified.yaml"
+        spec_config['append'] = [{"x-not-serializable": YAMLError}]
+        with pytest.raises(YAMLError):
+            register_openapi(
+                app=App(__name__),
+                specs=[SpecConfig(**spec_config)],
+            )
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestDereference:
+
+    @pytest.fixture
+    def spec_config(self, tmp_path):
+        """Specification config for specs referencing another file."""
+        spec = yaml.safe_load(PATH_SPECS_3_YAML_ORIGINAL.read_text())
+        error = spec['components']['schemas']['Error']
+        spec['components']['schemas']['Error'] = {
+            "$ref": "errors.yaml#/Error",
+        }
+        with open(tmp_path / "errors.yaml", "w") as errors_file:
+            yaml.safe_dump({"Error": error}, errors_file)
+        with open(tmp_path / "specs.yaml", "w") as spec_file:
+            yaml.safe_dump(spec, spec_file)
+        spec_config = deepcopy(SPEC_CONFIG_3)
+        spec_config['path'] = tmp_path / "specs.yaml"
+        spec_config['path_out'] = tmp_path / "specs.modified.yaml"
+        spec_config['dereference'] = True
+        return spec_config
+
+    def test_dereference(self, spec_config):
+        """Successfully register dereferenced OpenAPI 3 YAML specs with
+        Connexion app.
+        """
+        res = register_openapi(
+            app=App(__name__),
+            specs=[SpecConfig(**spec_config)],
+        )
+        assert isinstance(res, App)
+        lines = spec_config['path_out'].read_text().splitlines()
+        assert lines[1].startswith("# foca-spec-refs: ")
+        assert "$ref" not in "\n".join(lines)
+
+    def test_dereference_cache_invalidated(self, spec_config, tmp_path):
+        """Dereferenced specs are regenerated if referenced files change."""
+        register_openapi(app=App(__name__), specs=[SpecConfig(**spec_config)])
+        errors = yaml.safe_load((tmp_path / "errors.yaml").read_text())
+        errors['Error']['description'] = "An error."
+        with open(tmp_path / "errors.yaml", "w") as errors_file:
+            yaml.safe_dump(errors, errors_file)
+        register_openapi(app=App(__name__), specs=[SpecConfig(**spec_config)])
+        assert "An error." in spec_config['path_out'].read_text()
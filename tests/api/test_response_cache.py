@@ -0,0 +1,248 @@
+"""Tests for the declarative caching of API responses."""
+
+from flask import Flask
+import pytest
+
+import controllers
+
+from foca.api.response_cache import (
+    _is_cacheable,
+    CACHE_EXTENSION,
+    CachingResolver,
+    get_response_cache,
+    invalidate_response_cache,
+    METRIC_RESPONSE_CACHE,
+)
+from foca.models.config import (
+    OperationCacheConfig,
+    ResponseCacheConfig,
+)
+from foca.security.access_control.register_access_control import (
+    check_permissions,
+)
+from foca.utils.cache import LRUCache
+from foca.utils.metrics import metrics
+
+# Define mock data
+SECURED = {
+    "disable_auth": False,
+    "add_security_fields": {"x-bearerInfoFunc": "controllers.bearer_info"},
+}
+OPERATION_ID = "controllers.listPets"
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Reset shared metrics registry."""
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def add_cache(settings, method="get"):
+    """Get function adding caching field to the operation for listing or
+    creating pets.
+    """
+    def _modify_spec(spec):
+        spec['paths']['/pets'][method][CACHE_EXTENSION] = settings
+
+    return _modify_spec
+
+
+def get_count(result, operation_id=OPERATION_ID):
+    """Get number of cache hits or misses for operation."""
+    return metrics.get_counter(
+        METRIC_RESPONSE_CACHE,
+        operation_id=operation_id,
+        result=result,
+    )
+
+
+class TestCachingResolver:
+
+    def test_cached(self, create_client):
+        """Repeated requests are served from cache."""
+        client = create_client(modify_spec=add_cache(True))
+        for _ in range(3):
+            res = client.get("/v2/pets")
+            assert res.status_code == 200
+            assert res.json == {}
+        assert get_count("miss") == 1
+        assert get_count("hit") == 2
+
+    def test_query(self, create_client):
+        """Responses are cached per query."""
+        client = create_client(modify_spec=add_cache({"ttl": 10}))
+        client.get("/v2/pets?limit=1")
+        client.get("/v2/pets?limit=2")
+        client.get("/v2/pets?limit=1")
+        assert get_count("miss") == 2
+        assert get_count("hit") == 1
+
+    def test_vary(self, create_client):
+        """Responses are cached per value of selected headers."""
+        client = create_client(
+            modify_spec=add_cache({"vary": ["Accept-Language"]}),
+        )
+        client.get("/v2/pets", headers={"Accept-Language": "en"})
+        client.get("/v2/pets", headers={"Accept-Language": "de"})
+        client.get("/v2/pets", headers={"Accept-Language": "en"})
+        client.get("/v2/pets", headers={"Accept-Encoding": "gzip"})
+        assert get_count("miss") == 3
+        assert get_count("hit") == 1
+
+    def test_claims(self, create_client):
+        """Responses are cached per value of selected token claims, as
+        validated by Connexion.
+        """
+        client = create_client(
+            modify_spec=add_cache({"claims": ["group"]}),
+            **SECURED,
+        )
+        for token in ["dogs-alice", "cats-bob", "dogs-carol"]:
+            res = client.get(
+                "/v2/pets",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            assert res.status_code == 200
+        assert get_count("miss") == 2
+        assert get_count("hit") == 1
+
+    def test_caller(self, create_client):
+        """Responses to authenticated requests are cached per caller."""
+        client = create_client(modify_spec=add_cache(True), **SECURED)
+        for token in ["alice", "bob", "alice"]:
+            res = client.get(
+                "/v2/pets",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            assert res.status_code == 200
+        assert get_count("miss") == 2
+        assert get_count("hit") == 1
+
+    def test_caller_unauthenticated(self, create_client):
+        """Unauthenticated requests are rejected before the cache."""
+        client = create_client(modify_spec=add_cache(True), **SECURED)
+        client.get("/v2/pets", headers={"Authorization": "Bearer alice"})
+        res = client.get("/v2/pets")
+        assert res.status_code == 401
+        assert get_count("hit") == 0
+
+    def test_access_control_warning(self, create_client, caplog):
+        """Caching operations with access checks is warned about."""
+        controllers.listPets = check_permissions(controllers.listPets)
+        try:
+            create_client(modify_spec=add_cache(True))
+        finally:
+            controllers.listPets = controllers.listPets.__wrapped__
+        assert "may be served to callers without access" in caplog.text
+
+    def test_expiry(self, create_client):
+        """Responses expire after their time to live."""
+        client = create_client(modify_spec=add_cache(10))
+        cache = get_response_cache(client.application)
+        time = 0.0
+        cache.timer = lambda: time
+        client.get("/v2/pets")
+        time = 10.0
+        client.get("/v2/pets")
+        assert get_count("miss") == 2
+
+    def test_max_entries(self, create_client):
+        """Cache size is limited."""
+        client = create_client(
+            modify_spec=add_cache(True),
+            response_cache=ResponseCacheConfig(max_entries=1),
+        )
+        client.get("/v2/pets?limit=1")
+        client.get("/v2/pets?limit=2")
+        assert len(get_response_cache(client.application)) == 1
+
+    def test_not_get(self, create_client):
+        """Field is ignored for operations other than GET."""
+        client = create_client(modify_spec=add_cache(True, method="post"))
+        client.post("/v2/pets")
+        client.post("/v2/pets")
+        assert get_count("miss", "controllers.createPets") == 0
+        assert len(get_response_cache(client.application)) == 0
+
+    def test_disabled(self, create_client):
+        """Responses are not cached if field is false."""
+        client = create_client(modify_spec=add_cache(False))
+        client.get("/v2/pets")
+        assert get_count("miss") == 0
+
+    def test_invalid(self, create_client):
+        """Invalid field is rejected."""
+        with pytest.raises(ValueError):
+            create_client(modify_spec=add_cache({"ttl": -1}))
+
+    def test_copy(self):
+        """Changes to returned responses do not affect cached responses."""
+        resolver = CachingResolver(cache=LRUCache())
+        view = resolver._cache_view(
+            function=lambda: {"pets": ["Rex"]},
+            operation_id=OPERATION_ID,
+            conf=OperationCacheConfig(),
+        )
+        with Flask(__name__).test_request_context("/pets"):
+            view()["pets"].append("Fido")
+            cached = view()
+            cached["pets"].append("Fido")
+            assert view() == {"pets": ["Rex"]}
+        assert get_count("hit") == 2
+
+    def test_iterator(self):
+        """Iterators are not cached."""
+        resolver = CachingResolver(cache=LRUCache())
+        view = resolver._cache_view(
+            function=lambda: (iter(["Rex"]), 200),
+            operation_id=OPERATION_ID,
+            conf=OperationCacheConfig(),
+        )
+        with Flask(__name__).test_request_context("/pets"):
+            assert list(view()[0]) == ["Rex"]
+            assert list(view()[0]) == ["Rex"]
+        assert len(resolver.cache) == 0
+
+
+@pytest.mark.parametrize("result,expected", [
+    ({}, True),
+    (({}, 200, {"X-Foo": "bar"}), True),
+    (({}, 404), False),
+    ((pet for pet in ["Rex"]), False),
+    ((iter([]), 200), False),
+])
+def test_is_cacheable(result, expected):
+    """Only bodies of successful responses that are not iterators are
+    cacheable.
+    """
+    assert _is_cacheable(result) is expected
+
+
+class TestInvalidateResponseCache:
+
+    def test_tag(self, create_client):
+        """Responses are removed by tag."""
+        client = create_client(modify_spec=add_cache({"tags": ["pets"]}))
+        client.get("/v2/pets")
+        with client.application.app_context():
+            assert invalidate_response_cache("owners") == 0
+            assert invalidate_response_cache("pets") == 1
+        client.get("/v2/pets")
+        assert get_count("miss") == 2
+
+    def test_operation_id(self, create_client):
+        """Responses are removed by operation identifier."""
+        client = create_client(modify_spec=add_cache(True))
+        client.get("/v2/pets")
+        with client.application.app_context():
+            assert invalidate_response_cache(operation_id=OPERATION_ID) == 1
+
+    def test_all(self, create_client):
+        """All responses are removed."""
+        client = create_client(modify_spec=add_cache(True))
+        client.get("/v2/pets?limit=1")
+        client.get("/v2/pets?limit=2")
+        with client.application.app_context():
+            assert invalidate_response_cache() == 2
@@ -0,0 +1,218 @@
+"""Tests for transformation passes applied to OpenAPI specifications."""
+
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+
+from foca.api import spec_passes
+from foca.api.spec_passes import (
+    AppendPass,
+    apply_spec_passes,
+    DisableAuthPass,
+    get_spec_passes,
+    OperationFieldsPass,
+    PAGINATE_EXTENSION,
+    PaginationPass,
+    register_spec_pass,
+    SecurityFieldsPass,
+    SpecPass,
+)
+from foca.models.config import PaginationConfig, SpecConfig
+
+# Define mock data
+SPEC = {
+    "openapi": "3.0.0",
+    "security": [{"bearerAuth": []}],
+    "paths": {
+        "/pets": {
+            "parameters": [{"name": "limit", "in": "query"}],
+            "get": {"operationId": "listPets", "security": []},
+            "post": {"operationId": "createPets"},
+        },
+        "/pets/{petId}": {
+            "get": {"operationId": "showPetById"},
+        },
+    },
+    "components": {
+        "securitySchemes": {
+            "bearerAuth": {"type": "http", "scheme": "bearer"},
+        },
+    },
+}
+PATH = Path("/path/to/specs.yaml")
+
+
+class CountingPass(SpecPass):
+    """Pass counting visits."""
+
+    def __init__(self):
+        self.visits = {"root": 0, "path_item": 0, "operation": 0}
+
+    def visit_root(self, spec):
+        self.visits["root"] += 1
+
+    def visit_path_item(self, path, path_item):
+        self.visits["path_item"] += 1
+
+    def visit_operation(self, path, method, operation):
+        self.visits["operation"] += 1
+
+
+@pytest.fixture
+def custom_passes(monkeypatch):
+    """Empty registry of custom passes."""
+    registry = []
+    monkeypatch.setattr(spec_passes, "_custom_passes", registry)
+    return registry
+
+
+class TestSpecPasses:
+
+    def test_append(self):
+        """Root fields are added/replaced."""
+        spec = deepcopy(SPEC)
+        apply_spec_passes(spec, [AppendPass(append=[
+            {"info": {"title": "Pets"}},
+            {"info": {"title": "Petstore"}},
+        ])])
+        assert spec["info"] == {"title": "Petstore"}
+
+    def test_operation_fields(self):
+        """Fields are added to Operation Objects only."""
+        spec = deepcopy(SPEC)
+        apply_spec_passes(spec, [OperationFieldsPass(fields={"x-a": "b"})])
+        assert spec["paths"]["/pets"]["get"]["x-a"] == "b"
+        assert spec["paths"]["/pets/{petId}"]["get"]["x-a"] == "b"
+        assert spec["paths"]["/pets"]["parameters"] == (
+            SPEC["paths"]["/pets"]["parameters"]
+        )
+
+    def test_security_fields(self):
+        """Fields are added to security schemes."""
+        spec = deepcopy(SPEC)
+        apply_spec_passes(spec, [SecurityFieldsPass(fields={"x-a": "b"})])
+        assert spec["components"]["securitySchemes"]["bearerAuth"]["x-a"] == (
+            "b"
+        )
+
+    def test_disable_auth(self):
+        """Security schemes and requirements are removed."""
+        spec = deepcopy(SPEC)
+        apply_spec_passes(spec, [DisableAuthPass()])
+        assert "security" not in spec
+        assert "securitySchemes" not in spec["components"]
+        assert "security" not in spec["paths"]["/pets"]["get"]
+
+    def test_pagination(self):
+        """Pagination parameters and headers are added to operations with
+        pagination field, unless defined.
+        """
+        spec = deepcopy(SPEC)
+        for path in ("/pets", "/pets/{petId}"):
+            spec["paths"][path]["get"][PAGINATE_EXTENSION] = True
+        spec["paths"]["/pets"]["get"]["responses"] = {
+            "200": {"description": "Pets"},
+            "default": {"description": "Error"},
+        }
+        apply_spec_passes(spec, [PaginationPass(
+            conf=PaginationConfig(default_limit=20, max_limit=50),
+        )])
+        operation = spec["paths"]["/pets"]["get"]
+        assert operation["parameters"] == [{
+            "name": "page_token",
+            "in": "query",
+            "required": False,
+            "description": operation["parameters"][0]["description"],
+            "schema": {"type": "string"},
+        }]
+        assert "X-Next-Page-Token" in operation["responses"]["200"]["headers"]
+        assert "headers" not in operation["responses"]["default"]
+        limit = spec["paths"]["/pets/{petId}"]["get"]["parameters"][0]
+        assert limit["name"] == "limit"
+        assert limit["schema"]["maximum"] == 50
+        assert limit["schema"]["default"] == 20
+        assert "parameters" not in spec["paths"]["/pets"]["post"]
+
+    def test_pagination_openapi_2(self):
+        """Parameters and headers are added in OpenAPI 2.x format."""
+        spec = {
+            "swagger": "2.0",
+            "paths": {"/pets": {"get": {
+                PAGINATE_EXTENSION: True,
+                "responses": {"200": {"description": "Pets"}},
+            }}},
+        }
+        apply_spec_passes(spec, [PaginationPass(conf=PaginationConfig())])
+        operation = spec["paths"]["/pets"]["get"]
+        assert operation["parameters"][0]["type"] == "integer"
+        assert operation["parameters"][0]["default"] == 100
+        assert operation["responses"]["200"]["headers"][
+            "X-Next-Page-Token"]["type"] == "string"
+
+    def test_single_walk(self):
+        """Each object is visited once per pass."""
+        passes = [CountingPass(), CountingPass()]
+        apply_spec_passes(deepcopy(SPEC), passes)
+        for spec_pass in passes:
+            assert spec_pass.visits == {
+                "root": 1,
+                "path_item": 2,
+                "operation": 3,
+            }
+
+    def test_no_paths(self):
+        """Specifications without paths are supported."""
+        spec_pass = CountingPass()
+        assert apply_spec_passes({"paths": None}, [spec_pass]) == {
+            "paths": None,
+        }
+        assert spec_pass.visits["root"] == 1
+
+    def test_name(self):
+        """Passes are named after their class."""
+        assert CountingPass().name == f"{__name__}.CountingPass"
+
+    def test_get_spec_passes(self, custom_passes):
+        """Built-in passes are configured from specification config."""
+        spec = SpecConfig(
+            path=PATH,
+            append=[{}],
+            add_operation_fields={"x-a": "b"},
+            add_security_fields={"x-a": "b"},
+        )
+        res = get_spec_passes(spec)
+        assert [type(p) for p in res] == [
+            AppendPass,
+            OperationFieldsPass,
+            SecurityFieldsPass,
+        ]
+
+    def test_get_spec_passes_pagination(self, custom_passes):
+        """Pagination pass is configured from specification config."""
+        spec = SpecConfig(path=PATH, pagination={"default_limit": 10})
+        res = get_spec_passes(spec)
+        assert [type(p) for p in res] == [PaginationPass]
+        assert res[0].get_cache_key() == {
+            "default_limit": 10,
+            "max_limit": 1000,
+        }
+
+    def test_get_spec_passes_disable_auth(self, custom_passes):
+        """Security fields are not added if authorization is disabled."""
+        spec = SpecConfig(
+            path=PATH,
+            add_security_fields={"x-a": "b"},
+            disable_auth=True,
+        )
+        res = get_spec_passes(spec)
+        assert [type(p) for p in res] == [DisableAuthPass]
+
+    def test_register_spec_pass(self, custom_passes):
+        """Custom passes are applied after built-in passes."""
+        spec_pass = CountingPass()
+        register_spec_pass(spec_pass)
+        spec = SpecConfig(path=PATH, disable_auth=True)
+        res = get_spec_passes(spec)
+        assert res[-1] is spec_pass
+        assert len(res) == 2
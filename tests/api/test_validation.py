@@ -0,0 +1,263 @@
+"""Tests for the validation of API requests and responses."""
+
+import json
+
+from connexion.exceptions import NonConformingResponseBody
+from jsonschema import ValidationError
+import pytest
+
+from foca.api import validation
+from foca.api.validation import (
+    compile_schema,
+    CompiledResponseValidator,
+    METRIC_RESPONSE_VALIDATION,
+    SAMPLE_RATE_EXTENSION,
+)
+from foca.utils.metrics import metrics
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Reset shared metrics registry."""
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+PET_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+    },
+}
+
+
+def modify_spec(sample_rate=None, request_schema=None):
+    """Get function modifying petstore specs.
+
+    Controllers return empty objects, which conform to the modified
+    specification for ``listPets``, but not for ``createPets``.
+    """
+    def _modify_spec(spec):
+        spec['paths']['/pets']['get']['responses']['200']['content'][
+            'application/json'
+        ]['schema'] = {"type": "object"}
+        if request_schema is not None:
+            spec['paths']['/pets']['post']['requestBody'] = {
+                "content": {"application/json": {"schema": request_schema}},
+            }
+        if sample_rate is not None:
+            spec['paths']['/pets']['post'][SAMPLE_RATE_EXTENSION] = sample_rate
+
+    return _modify_spec
+
+
+class MockOperation:
+    """Mock Connexion operation with a single response schema."""
+
+    operation_id = "listPets"
+
+    def __init__(self):
+        self.calls = 0
+
+    def response_definition(self, status_code, content_type):
+        return {}
+
+    def response_schema(self, status_code, content_type):
+        self.calls += 1
+        return PET_SCHEMA
+
+    def json_loads(self, data):
+        return json.loads(data)
+
+
+def get_count(result, operation_id="controllers.createPets"):
+    """Get number of validation results for operation."""
+    return metrics.get_counter(
+        METRIC_RESPONSE_VALIDATION,
+        operation_id=operation_id,
+        result=result,
+    )
+
+
+class TestSampledResponseValidator:
+
+    def test_invalid_counted(self, create_client):
+        """Invalid responses are counted and passed on."""
+        client = create_client(
+            modify_spec=modify_spec(),
+            response_validation={"sample_rate": 1.0},
+        )
+        res = client.post("/v2/pets")
+        assert res.status_code == 200
+        assert get_count("invalid") == 1
+
+    def test_invalid_fail(self, create_client):
+        """Invalid responses are replaced by error response."""
+        client = create_client(
+            modify_spec=modify_spec(),
+            response_validation={"sample_rate": 1.0, "fail": True},
+        )
+        res = client.post("/v2/pets")
+        assert res.status_code == 500
+        assert get_count("invalid") == 1
+
+    def test_valid_counted(self, create_client):
+        """Valid responses are counted."""
+        client = create_client(
+            modify_spec=modify_spec(),
+            response_validation={"sample_rate": 1.0},
+        )
+        res = client.get("/v2/pets")
+        assert res.status_code == 200
+        assert get_count("valid", operation_id="controllers.listPets") == 1
+
+    def test_skipped(self, create_client):
+        """Responses that are not sampled are not validated."""
+        client = create_client(
+            modify_spec=modify_spec(),
+            response_validation={"sample_rate": 0.000001},
+        )
+        for _ in range(5):
+            client.post("/v2/pets")
+        assert get_count("skipped") == 5
+        assert get_count("invalid") == 0
+
+    def test_operation_sample_rate(self, create_client):
+        """Sample rate is overridden by Operation Object field."""
+        client = create_client(
+            modify_spec=modify_spec(sample_rate=0),
+            response_validation={"sample_rate": 1.0},
+        )
+        res = client.post("/v2/pets")
+        assert res.status_code == 200
+        assert get_count("invalid") == 0
+        assert get_count("skipped") == 0
+
+    def test_disabled(self, create_client):
+        """Responses are not validated if sampling is not configured."""
+        client = create_client(modify_spec=modify_spec())
+        res = client.post("/v2/pets")
+        assert res.status_code == 200
+        assert metrics.snapshot()["counters"] == {}
+
+
+class TestCompileSchema:
+
+    def test_compiled(self):
+        """Schemas are compiled if possible."""
+        validate = compile_schema(PET_SCHEMA)
+        assert validate.__module__ == validation.__name__
+        validate({"name": "Rex"})
+        with pytest.raises(ValidationError) as exc:
+            validate({"tags": ["a", 1]})
+        assert list(exc.value.path) == ["tags", 1]
+
+    @pytest.mark.parametrize("schema,instance", [
+        (PET_SCHEMA, {"name": "Rex", "tags": ["a"]}),
+        (PET_SCHEMA, {"name": 1}),
+        (PET_SCHEMA, {"tags": ["a", 1]}),
+        (PET_SCHEMA, []),
+        ({"type": "integer", "minimum": 1}, 0),
+        ({"type": "integer"}, True),
+        ({"required": ["name"]}, {}),
+        ({"type": "string", "format": "date-time"}, "notadate"),
+        ({"type": "string", "format": "date-time"}, 1),
+    ])
+    def test_compiled_same_as_uncompiled(self, schema, instance):
+        """Compiled and uncompiled validation functions accept and reject
+        the same instances, with the same errors.
+        """
+        errors = []
+        for compiled in (True, False):
+            validate = compile_schema(schema, compiled=compiled)
+            try:
+                validate(instance)
+            except ValidationError as exc:
+                errors.append((exc.message, list(exc.path)))
+            else:
+                errors.append(None)
+        assert errors[0] == errors[1]
+
+    def test_not_compiled_format(self):
+        """Schemas with formats are not compiled."""
+        schema = {"type": "string", "format": "date-time"}
+        validate = compile_schema(schema)
+        assert validate.__module__ != validation.__name__
+        validate("notadate")
+
+    def test_not_compiled_openapi_keywords(self):
+        """Schemas with OpenAPI-specific keywords are not compiled."""
+        schema = {"type": "string", "nullable": True}
+        validate = compile_schema(schema)
+        assert validate.__module__ != validation.__name__
+        validate(None)
+        with pytest.raises(ValidationError):
+            validate(1)
+
+    def test_not_compiled_disabled(self):
+        """Schemas are not compiled if compilation is disabled."""
+        validate = compile_schema(PET_SCHEMA, compiled=False)
+        assert validate.__module__ != validation.__name__
+        with pytest.raises(ValidationError):
+            validate({"name": 1})
+
+    def test_not_compiled_unavailable(self, monkeypatch):
+        """Schemas are not compiled if ``fastjsonschema`` is unavailable."""
+        monkeypatch.setattr(validation, "fastjsonschema", None)
+        validate = compile_schema(PET_SCHEMA)
+        assert validate.__module__ != validation.__name__
+        with pytest.raises(ValidationError):
+            validate({"name": 1})
+
+
+class TestCompiledValidators:
+
+    def test_request_body_invalid(self, create_client):
+        """Invalid request bodies are rejected."""
+        client = create_client(
+            modify_spec=modify_spec(request_schema=PET_SCHEMA),
+            compiled_validation=True,
+        )
+        res = client.post("/v2/pets", json={"name": 1})
+        assert res.status_code == 400
+        assert "'name'" in res.json["detail"]
+
+    def test_request_body_valid(self, create_client):
+        """Valid request bodies are accepted."""
+        client = create_client(
+            modify_spec=modify_spec(request_schema=PET_SCHEMA),
+            compiled_validation=True,
+        )
+        res = client.post("/v2/pets", json={"name": "Rex"})
+        assert res.status_code == 200
+
+    def test_response_sampled(self, create_client):
+        """Compiled validators are used for sampled response validation."""
+        client = create_client(
+            modify_spec=modify_spec(),
+            response_validation={"sample_rate": 1.0},
+            compiled_validation=True,
+        )
+        for _ in range(2):
+            client.post("/v2/pets")
+            client.get("/v2/pets")
+        assert get_count("invalid") == 2
+        assert get_count("valid", operation_id="controllers.listPets") == 2
+
+    def test_response_validator_cached(self):
+        """Validation functions are created once per status code and
+        content type.
+        """
+        operation = MockOperation()
+        validator = CompiledResponseValidator(operation, "application/json")
+        for _ in range(3):
+            assert validator.validate_response(
+                b'{"name": "Rex"}', 200, {}, "/pets"
+            )
+        assert operation.calls == 1
+        assert list(validator._validators) == [("200", "application/json")]
+        with pytest.raises(NonConformingResponseBody):
+            validator.validate_response(b'{"name": 1}', 200, {}, "/pets")
+        assert operation.calls == 1
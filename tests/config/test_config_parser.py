@@ -100,6 +100,60 @@ def test_merge_yaml_with_two_args():
     assert 'put' in res['paths']['/pets/{petId}']
 
 
+def test_merge_yaml_with_two_args_nested(tmp_path):
+    """Test merge_yaml merges nested dictionaries, keeping siblings and
+    overriding leaves.
+    """
+    base = tmp_path / "base.yaml"
+    base.write_text(
+        "db:\n"
+        "  host: mongodb\n"
+        "  connection:\n"
+        "    max_pool_size: 10\n"
+        "    compressors: [zstd, zlib]\n"
+        "log:\n"
+        "  version: 1\n"
+    )
+    addition = tmp_path / "addition.yaml"
+    addition.write_text(
+        "db:\n"
+        "  connection:\n"
+        "    max_pool_size: 20\n"
+        "    compressors: [snappy]\n"
+        "    auth_source: admin\n"
+    )
+    res = ConfigParser.merge_yaml(base, addition)
+    assert res == {
+        'db': {
+            'host': 'mongodb',
+            'connection': {
+                'max_pool_size': 20,
+                'compressors': ['snappy'],
+                'auth_source': 'admin',
+            },
+        },
+        'log': {'version': 1},
+    }
+
+
+def test_merge_yaml_with_empty_file(tmp_path):
+    """Test merge_yaml with an empty YAML file."""
+    empty_file = tmp_path / "empty.yaml"
+    empty_file.touch()
+    yaml_list = [Path(PATH), empty_file]
+    res = ConfigParser.merge_yaml(*yaml_list)
+    assert res == ConfigParser.parse_yaml(Path(PATH))
+
+
+def test_deep_merge():
+    """Test deep_merge with nested dictionaries, lists and scalars."""
+    target = {'a': {'b': 1, 'c': [1, 2]}, 'd': 1}
+    source = {'a': {'c': [3], 'e': 2}, 'd': {'f': 3}}
+    res = ConfigParser.deep_merge(target, source)
+    assert res is target
+    assert res == {'a': {'b': 1, 'c': [3], 'e': 2}, 'd': {'f': 3}}
+
+
 def test_parse_custom_config_valid_model():
     """Test ``.parse_custom_config()`` with a valid model class."""
     conf = ConfigParser(config_file=Path(TEST_FILE))
@@ -0,0 +1,114 @@
+"""
+Tests for config_reloader.py
+"""
+
+import os
+from pathlib import Path
+import shutil
+
+import pytest
+import yaml
+
+from foca import Foca
+from foca.config.config_reloader import ConfigReloader
+from foca.factories.connexion_app import create_connexion_app
+from foca.models.config import Config
+
+DIR = Path(__file__).parent.parent / "test_files"
+TEST_FILE = DIR / "conf_log.yaml"
+
+
+@pytest.fixture
+def conf_file(tmp_path):
+    """Copy of a valid config file."""
+    path = tmp_path / "config.yaml"
+    shutil.copy2(TEST_FILE, path)
+    return path
+
+
+@pytest.fixture
+def reloader(conf_file):
+    """Config reloader for a Connexion app."""
+    app = create_connexion_app(Config())
+    return ConfigReloader(app=app.app, config_file=conf_file)
+
+
+def update_conf_file(path, conf):
+    """Overwrite config file and make sure that its modification time
+    changes.
+    """
+    stat = os.stat(path)
+    with open(path, "w") as _file:
+        yaml.safe_dump(conf, _file)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_check_unchanged(reloader):
+    """Test that nothing is reloaded if the config file is unchanged."""
+    conf = reloader.app.config.foca
+    assert reloader.check() is False
+    assert reloader.app.config.foca is conf
+
+
+def test_check_live_section(reloader, conf_file):
+    """Test that changes to live sections are applied."""
+    conf = reloader.app.config.foca
+    raw = yaml.safe_load(conf_file.read_text())
+    raw["log"]["root"]["level"] = 20
+    raw["security"] = {"auth": {"required": False}}
+    update_conf_file(conf_file, raw)
+    assert reloader.check() is True
+    new_conf = reloader.app.config.foca
+    assert new_conf is not conf
+    assert new_conf.log.root.level == 20
+    assert new_conf.security.auth.required is False
+    assert conf.log.root.level == 10
+    assert conf.security.auth.required is True
+    assert new_conf.security.cors is conf.security.cors
+
+
+def test_reload_restart_required(reloader, conf_file):
+    """Test that changes requiring a restart are reported, not applied."""
+    conf = reloader.app.config.foca
+    raw = yaml.safe_load(conf_file.read_text())
+    raw["server"] = {"port": 9999}
+    raw["security"] = {"cors": {"enabled": False}}
+    update_conf_file(conf_file, raw)
+    report = reloader.reload()
+    assert report == {
+        "applied": [],
+        "restart_required": ["security.cors", "server"],
+    }
+    assert reloader.app.config.foca is conf
+    assert reloader.app.config.foca.server.port == 8080
+
+
+def test_reload_invalid(reloader, conf_file):
+    """Test that invalid configurations are not applied."""
+    conf = reloader.app.config.foca
+    raw = yaml.safe_load(conf_file.read_text())
+    raw["log"]["root"]["level"] = 99
+    update_conf_file(conf_file, raw)
+    report = reloader.reload()
+    assert report == {"applied": [], "restart_required": []}
+    assert reloader.app.config.foca is conf
+
+
+def test_start_stop(reloader):
+    """Test starting and stopping of watcher thread."""
+    reloader.start()
+    assert reloader._thread is not None
+    assert reloader._thread.is_alive()
+    reloader.stop()
+    assert reloader._thread is None
+
+
+def test_foca_create_app_reload(conf_file):
+    """Test that config reloader is started by FOCA if enabled."""
+    raw = yaml.safe_load(conf_file.read_text())
+    raw["reload"] = {"enabled": True, "interval": 60}
+    update_conf_file(conf_file, raw)
+    foca = Foca(config_file=conf_file)
+    foca.create_app()
+    assert isinstance(foca.config_reloader, ConfigReloader)
+    foca.config_reloader.stop()
@@ -0,0 +1,167 @@
+"""Tests for change_streams.py"""
+
+from threading import Event
+
+from flask import Flask
+from pymongo.errors import AutoReconnect, OperationFailure
+
+from foca.database.change_streams import (
+    ChangeStreamWatcher,
+    get_change_stream_watcher,
+)
+from foca.database.document_cache import CachedCollection
+from foca.database.register_mongodb import register_mongodb
+from foca.models.config import MongoConfig
+
+TIMEOUT = 5
+
+
+class Stream:
+    """Minimal change stream returning given changes, then nothing."""
+
+    def __init__(self, changes):
+        self.changes = list(changes)
+        self.alive = True
+        self.resume_token = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.alive = False
+
+    def try_next(self):
+        if not self.changes:
+            return None
+        change = self.changes.pop(0)
+        if isinstance(change, Exception):
+            raise change
+        self.resume_token = change['_id']
+        return change
+
+
+class Collection:
+    """Minimal collection opening given change streams in turn."""
+
+    name = 'pets'
+    full_name = 'my_db.pets'
+
+    def __init__(self, *streams):
+        self.streams = list(streams)
+        self.calls = []
+
+    def watch(self, **kwargs):
+        self.calls.append(kwargs)
+        if not self.streams:
+            return Stream([])
+        stream = self.streams.pop(0)
+        if isinstance(stream, Exception):
+            raise stream
+        return stream
+
+
+def watch(collection, count, poll_interval=0.01):
+    """Watch collection until subscriber was notified `count` times."""
+    changes = []
+    done = Event()
+
+    def callback(change):
+        changes.append(change)
+        if len(changes) >= count:
+            done.set()
+
+    watcher = ChangeStreamWatcher(collection, poll_interval=poll_interval)
+    watcher.subscribe(callback)
+    watcher.start()
+    assert done.wait(TIMEOUT)
+    watcher.stop(TIMEOUT)
+    return watcher, changes
+
+
+def test_watcher_publishes_changes():
+    """Changes are published, preceded by a full invalidation."""
+    collection = Collection(Stream([{'_id': 'a'}, {'_id': 'b'}]))
+    watcher, changes = watch(collection, 3)
+    assert changes == [None, {'_id': 'a'}, {'_id': 'b'}]
+    assert watcher.resume_token == 'b'
+    assert not watcher.polling
+
+
+def test_watcher_resumes():
+    """Failed change streams are resumed after the last change."""
+    collection = Collection(
+        Stream([{'_id': 'a'}, AutoReconnect('connection lost')]),
+        Stream([{'_id': 'b'}]),
+    )
+    _, changes = watch(collection, 3)
+    assert changes == [None, {'_id': 'a'}, {'_id': 'b'}]
+    assert collection.calls[1]['start_after'] == 'a'
+
+
+def test_watcher_history_lost():
+    """Subscribers are notified if a change stream cannot be resumed."""
+    collection = Collection(
+        Stream([{'_id': 'a'}, OperationFailure('history lost', code=286)]),
+        Stream([{'_id': 'b'}]),
+    )
+    _, changes = watch(collection, 4)
+    assert changes == [None, {'_id': 'a'}, None, {'_id': 'b'}]
+    assert collection.calls[1]['start_after'] is None
+
+
+def test_watcher_polling():
+    """Subscribers are notified periodically on standalone servers."""
+    collection = Collection(OperationFailure('not supported', code=40573))
+    watcher, changes = watch(collection, 2)
+    assert changes == [None, None]
+    assert watcher.polling
+    assert len(collection.calls) == 1
+
+
+def test_watcher_subscriber_error():
+    """Failing subscribers do not affect other subscribers."""
+    collection = Collection(Stream([{'_id': 'a'}]))
+    done = Event()
+    watcher = ChangeStreamWatcher(collection)
+
+    def fail(change):
+        raise ValueError(change)
+
+    watcher.subscribe(fail)
+    watcher.subscribe(lambda change: change and done.set())
+    watcher.start()
+    assert done.wait(TIMEOUT)
+    watcher.stop(TIMEOUT)
+
+
+def test_get_change_stream_watcher():
+    """A single watcher is created per app and collection."""
+    app = Flask(__name__)
+    collection = Collection()
+    res = get_change_stream_watcher(app=app, collection=collection)
+    assert get_change_stream_watcher(app=app, collection=collection) is res
+    assert res.collection is collection
+    assert get_change_stream_watcher(
+        app=Flask(__name__),
+        collection=collection,
+    ) is not res
+
+
+def test_register_mongodb_watch(monkeypatch):
+    """Document caches of watched collections are cleared on changes."""
+    monkeypatch.setattr(ChangeStreamWatcher, 'start', lambda self: None)
+    app = Flask(__name__)
+    conf = MongoConfig(dbs={'my_db': {'collections': {
+        'pets': {'cache': {'watch': True, 'poll_interval': 5}},
+        'owners': {'cache': {}},
+    }}})
+    register_mongodb(app=app, conf=conf)
+    pets = conf.dbs['my_db'].collections['pets'].client
+    assert isinstance(pets, CachedCollection)
+    watchers = app.extensions['foca_change_streams']
+    assert list(watchers) == ['my_db.pets']
+    watcher = watchers['my_db.pets']
+    assert watcher.poll_interval == 5
+    pets.cache.set('key', 'value')
+    watcher._publish({'_id': 'a'})
+    assert len(pets.cache) == 0
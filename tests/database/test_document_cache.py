@@ -0,0 +1,150 @@
+"""Tests for document_cache.py"""
+
+from flask import Flask
+from pymongo import ReadPreference
+from pymongo.collection import Collection
+import pytest
+
+from foca.database.document_cache import CachedCollection, METRIC_DB_CACHE
+from foca.database.register_mongodb import register_mongodb
+from foca.models.config import DocumentCacheConfig, MongoConfig
+from foca.utils.metrics import metrics
+
+LABELS = {'database': 'my_db', 'collection': 'pets'}
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Reset shared metrics registry."""
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    """Replace database lookups and writes, recording lookups."""
+    calls = []
+
+    def find_one(self, filter=None, *args, **kwargs):
+        calls.append(filter)
+        if filter == {'id': 1}:
+            return {'id': 1, 'name': 'Rex'}
+        return None
+
+    monkeypatch.setattr(Collection, 'find_one', find_one)
+    monkeypatch.setattr(Collection, 'insert_one', lambda self, doc: None)
+    return calls
+
+
+def create_collection(**kwargs):
+    """Create cached collection without connecting to a server."""
+    conf = MongoConfig(dbs={'my_db': {'collections': {'pets': {}}}})
+    register_mongodb(app=Flask(__name__), conf=conf)
+    collection = conf.dbs['my_db'].collections['pets'].client
+    return CachedCollection(collection, DocumentCacheConfig(**kwargs))
+
+
+def get_count(result):
+    """Get number of cache hits or misses."""
+    return metrics.get_counter(METRIC_DB_CACHE, result=result, **LABELS)
+
+
+def test_find_one_cached(lookups):
+    """Repeated lookups are served from cache."""
+    pets = create_collection()
+    for _ in range(3):
+        assert pets.find_one({'id': 1}, {'_id': False}) == {
+            'id': 1, 'name': 'Rex'
+        }
+    assert lookups == [{'id': 1}]
+    assert get_count('miss') == 1
+    assert get_count('hit') == 2
+
+
+def test_find_one_copies(lookups):
+    """Cached documents are not modified by callers."""
+    pets = create_collection()
+    pets.find_one({'id': 1})['name'] = 'Fido'
+    assert pets.find_one({'id': 1})['name'] == 'Rex'
+
+
+def test_find_one_not_found(lookups):
+    """Lookups of missing documents are cached."""
+    pets = create_collection()
+    assert pets.find_one({'id': 2}) is None
+    assert pets.find_one({'id': 2}) is None
+    assert len(lookups) == 1
+
+
+def test_find_one_projection(lookups):
+    """Lookups are cached per filter and projection."""
+    pets = create_collection()
+    pets.find_one({'id': 1})
+    pets.find_one({'id': 1}, projection={'name': True})
+    pets.find_one({'id': 1}, {'name': True})
+    pets.find_one({'id': {'$in': [1, 2]}})
+    assert len(lookups) == 3
+
+
+def test_find_one_types(lookups):
+    """Lookups are cached per type of values."""
+    pets = create_collection()
+    pets.find_one({'id': 1})
+    pets.find_one({'id': True})
+    pets.find_one({'id': 1.0})
+    pets.find_one({'id': 1})
+    assert lookups == [{'id': 1}] * 3
+    assert get_count('hit') == 1
+
+
+def test_find_one_not_cacheable(lookups):
+    """Lookups with other arguments bypass the cache."""
+    pets = create_collection()
+    pets.find_one({'id': 1}, sort=[('id', 1)])
+    pets.find_one({'id': 1}, sort=[('id', 1)])
+    assert len(lookups) == 2
+    assert get_count('miss') == 0
+
+
+def test_find_one_expiry(lookups):
+    """Cached lookups expire after their time to live."""
+    pets = create_collection(ttl=10)
+    time = 0.0
+    pets.cache.timer = lambda: time
+    pets.find_one({'id': 1})
+    time = 10.0
+    pets.find_one({'id': 1})
+    assert len(lookups) == 2
+
+
+def test_max_entries(lookups):
+    """Cache size is limited."""
+    pets = create_collection(max_entries=1)
+    pets.find_one({'id': 1})
+    pets.find_one({'id': 2})
+    assert len(pets.cache) == 1
+
+
+def test_write_invalidates(lookups):
+    """Writes via the cached collection clear the cache."""
+    pets = create_collection()
+    pets.find_one({'id': 1})
+    pets.insert_one({'id': 2})
+    assert len(pets.cache) == 0
+    pets.find_one({'id': 1})
+    assert len(lookups) == 2
+
+
+def test_options_kept():
+    """Options of the wrapped collection are kept."""
+    conf = MongoConfig(dbs={'my_db': {'collections': {'pets': {
+        'read_preference': 'secondary',
+        'cache': {'max_entries': 10},
+    }}}})
+    register_mongodb(app=Flask(__name__), conf=conf)
+    pets = conf.dbs['my_db'].collections['pets'].client
+    assert isinstance(pets, CachedCollection)
+    assert pets.full_name == 'my_db.pets'
+    assert pets.read_preference == ReadPreference.SECONDARY
+    assert pets.cache.max_entries == 10
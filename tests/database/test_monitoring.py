@@ -0,0 +1,149 @@
+"""Tests for monitoring.py"""
+
+import logging
+
+from flask import Flask
+import pytest
+
+from foca.database.monitoring import (
+    CommandMonitor,
+    METRIC_DB_COMMAND_DURATION,
+    METRIC_DB_COMMAND_FAILURES,
+    redact,
+)
+from foca.database.register_mongodb import get_mongo_client
+from foca.models.config import MongoConfig, MongoMonitoringConfig
+from foca.utils.metrics import metrics
+
+LABELS = {
+    'database': 'my_db',
+    'collection': 'pets',
+    'command': 'find',
+}
+
+
+class Event:
+    """Minimal command event."""
+
+    def __init__(self, command, duration_micros=0, request_id=1):
+        self.command = command
+        self.command_name = next(iter(command))
+        self.database_name = 'my_db'
+        self.connection_id = ('mongodb', 27017)
+        self.request_id = request_id
+        self.duration_micros = duration_micros
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Reset shared metrics registry."""
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_command_monitor_succeeded():
+    """Durations of commands are recorded."""
+    monitor = CommandMonitor(MongoMonitoringConfig())
+    command = {'find': 'pets', 'filter': {'name': 'Rex'}}
+    monitor.started(Event(command))
+    monitor.succeeded(Event(command, duration_micros=2000))
+    histogram = metrics.get_histogram(METRIC_DB_COMMAND_DURATION, **LABELS)
+    assert histogram['count'] == 1
+    assert histogram['sum'] == 0.002
+    assert metrics.get_counter(METRIC_DB_COMMAND_FAILURES, **LABELS) == 0
+
+
+def test_command_monitor_failed():
+    """Failed commands are counted."""
+    monitor = CommandMonitor(MongoMonitoringConfig())
+    command = {'find': 'pets', 'filter': {}}
+    monitor.started(Event(command))
+    monitor.failed(Event(command, duration_micros=1000))
+    assert metrics.get_counter(METRIC_DB_COMMAND_FAILURES, **LABELS) == 1
+    assert metrics.get_histogram(
+        METRIC_DB_COMMAND_DURATION, **LABELS
+    )['count'] == 1
+
+
+def test_command_monitor_get_more():
+    """Collection of getMore commands is recorded."""
+    monitor = CommandMonitor(MongoMonitoringConfig())
+    command = {'getMore': 12345, 'collection': 'pets'}
+    monitor.started(Event(command))
+    monitor.succeeded(Event(command))
+    assert metrics.get_histogram(
+        METRIC_DB_COMMAND_DURATION,
+        database='my_db',
+        collection='pets',
+        command='getMore',
+    )['count'] == 1
+
+
+def test_command_monitor_unknown():
+    """Completion of unknown commands is ignored."""
+    monitor = CommandMonitor(MongoMonitoringConfig())
+    monitor.succeeded(Event({'find': 'pets'}))
+    assert metrics.snapshot()['histograms'] == {}
+
+
+def test_command_monitor_slow(caplog):
+    """Slow commands are logged with redacted filters and request ID."""
+    monitor = CommandMonitor(MongoMonitoringConfig(slow_query_ms=10))
+    command = {'find': 'pets', 'filter': {'name': 'Rex'}, 'limit': 1}
+    app = Flask(__name__)
+    with app.test_request_context(headers={'X-Request-ID': 'abc'}):
+        monitor.started(Event(command))
+    with caplog.at_level(logging.WARNING):
+        monitor.succeeded(Event(command, duration_micros=20000))
+    assert "Slow MongoDB command 'find' on 'my_db.pets'" in caplog.text
+    assert "request: abc" in caplog.text
+    assert "{'filter': {'name': '?'}}" in caplog.text
+    assert "Rex" not in caplog.text
+
+
+def test_command_monitor_not_slow(caplog):
+    """Fast commands are not logged."""
+    monitor = CommandMonitor(MongoMonitoringConfig(slow_query_ms=10))
+    command = {'find': 'pets', 'filter': {}}
+    monitor.started(Event(command))
+    with caplog.at_level(logging.WARNING):
+        monitor.succeeded(Event(command, duration_micros=5000))
+    assert caplog.text == ""
+
+
+def test_command_monitor_slow_disabled(caplog):
+    """No commands are logged if threshold is not set."""
+    monitor = CommandMonitor(MongoMonitoringConfig(slow_query_ms=None))
+    command = {'find': 'pets', 'filter': {}}
+    monitor.started(Event(command))
+    with caplog.at_level(logging.WARNING):
+        monitor.succeeded(Event(command, duration_micros=10 ** 7))
+    assert caplog.text == ""
+
+
+def test_redact():
+    """Values are redacted, field names and operators are kept."""
+    res = redact([
+        {'$match': {'age': {'$gt': 3}}},
+        {'$project': {'name': 1}},
+    ])
+    assert res == [
+        {'$match': {'age': {'$gt': '?'}}},
+        {'$project': {'name': '?'}},
+    ]
+
+
+def test_get_mongo_client_monitoring():
+    """Command monitor is registered with client."""
+    res = get_mongo_client(app=Flask(__name__), conf=MongoConfig())
+    listeners = res.options.event_listeners
+    assert any(isinstance(item, CommandMonitor) for item in listeners)
+
+
+def test_get_mongo_client_monitoring_disabled():
+    """No command monitor is registered if monitoring is disabled."""
+    conf = MongoConfig(monitoring={'enabled': False})
+    res = get_mongo_client(app=Flask(__name__), conf=conf)
+    listeners = res.options.event_listeners
+    assert not any(isinstance(item, CommandMonitor) for item in listeners)
@@ -0,0 +1,162 @@
+"""Tests for register_async_mongodb.py"""
+
+import asyncio
+
+from flask import Flask
+from pymongo import ReadPreference
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
+import pytest
+
+from foca.database.register_async_mongodb import (
+    _AsyncClient,
+    _LoopProxy,
+    AsyncHandle,
+    register_async_mongodb,
+)
+from foca.models.config import MongoConfig
+
+MONGO_DICT = {
+    'host': 'mongodb',
+    'port': 27017,
+    'connection': {'max_pool_size': 10},
+    'async_clients': True,
+    'dbs': {
+        'my_db': {
+            'read_preference': 'secondaryPreferred',
+            'collections': {
+                'my_collection': {
+                    'read_concern': 'majority',
+                },
+            },
+        },
+    },
+}
+
+
+def test_register_async_mongodb():
+    """Asynchronous handles are added to database and collection
+    configurations.
+    """
+    app = Flask(__name__)
+    conf = register_async_mongodb(app=app, conf=MongoConfig(**MONGO_DICT))
+    db_conf = conf.dbs['my_db']
+    coll_conf = db_conf.collections['my_collection']
+    assert isinstance(db_conf.async_client, AsyncHandle)
+    assert isinstance(coll_conf.async_client, AsyncHandle)
+    assert db_conf.client is None
+    assert len(app.extensions['foca_async_mongo_clients']) == 1
+
+
+def test_async_handle_get():
+    """Handles resolve to asynchronous databases and collections with the
+    configured options.
+    """
+    app = Flask(__name__)
+    conf = register_async_mongodb(app=app, conf=MongoConfig(**MONGO_DICT))
+    db_conf = conf.dbs['my_db']
+    db = db_conf.async_client.get()
+    coll = db_conf.collections['my_collection'].async_client.get()
+    assert isinstance(db.__wrapped__, AsyncDatabase)
+    assert isinstance(coll.__wrapped__, AsyncCollection)
+    assert db.name == 'my_db'
+    assert coll.full_name == 'my_db.my_collection'
+    assert db.read_preference == ReadPreference.SECONDARY_PREFERRED
+    assert coll.read_preference == ReadPreference.SECONDARY_PREFERRED
+    assert coll.read_concern.level == 'majority'
+    assert db.client.__wrapped__ is coll.database.client.__wrapped__
+    assert db.client.options.pool_options.max_pool_size == 10
+
+
+def test_async_handle_delegation():
+    """Attribute and item access are delegated to resolved handle."""
+    app = Flask(__name__)
+    conf = register_async_mongodb(app=app, conf=MongoConfig(**MONGO_DICT))
+    handle = conf.dbs['my_db'].async_client
+    coll = handle['other_collection']
+    assert handle.name == 'my_db'
+    assert coll.full_name == 'my_db.other_collection'
+    assert isinstance(coll.__wrapped__, AsyncCollection)
+
+
+def test_async_client_shared():
+    """A single client is shared by all requests, each running in its own
+    event loop, and run in a background event loop.
+    """
+    app = Flask(__name__)
+    conf = register_async_mongodb(app=app, conf=MongoConfig(**MONGO_DICT))
+    handle = conf.dbs['my_db'].collections['my_collection'].async_client
+
+    async def get_client():
+        return handle.database.client.__wrapped__
+
+    clients = [asyncio.run(get_client()) for _ in range(5)]
+    assert all(client is clients[0] for client in clients)
+    client = app.extensions['foca_async_mongo_clients'][
+        'mongodb://mongodb:27017/'
+    ]
+    assert clients[0] is client.get()
+    client.close()
+    assert clients[0]._closed
+
+
+class Pets():
+    """Asynchronous object recording the event loops running its
+    coroutines.
+    """
+
+    async def find_one(self, filter):
+        return filter, asyncio.get_running_loop()
+
+    async def fail(self):
+        raise ValueError("Query failed.")
+
+    def find(self):
+        return self
+
+    def __aiter__(self):
+        self._items = iter(["Rex", "Fido"])
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._items), asyncio.get_running_loop()
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def test_loop_proxy():
+    """Coroutines are run in the background event loop and awaited in the
+    event loop of the caller.
+    """
+    client = _AsyncClient(uri='mongodb://mongodb:27017/', options={})
+    pets = _LoopProxy(Pets(), client)
+
+    async def query():
+        found, loop = await pets.find_one({'id': 1})
+        assert found == {'id': 1}
+        assert loop is client.loop
+        assert loop is not asyncio.get_running_loop()
+        names = [name async for name, _ in pets.find()]
+        assert names == ['Rex', 'Fido']
+        with pytest.raises(ValueError):
+            await pets.fail()
+
+    for _ in range(2):
+        asyncio.run(query())
+    client.close()
+
+
+def test_loop_proxy_no_event_loop():
+    """Operations cannot be awaited outside of an event loop."""
+    client = _AsyncClient(uri='mongodb://mongodb:27017/', options={})
+    with pytest.raises(RuntimeError):
+        _LoopProxy(Pets(), client).find_one({})
+    client.close()
+
+
+def test_register_async_mongodb_no_databases():
+    """No handles are added if no databases are configured."""
+    app = Flask(__name__)
+    conf = register_async_mongodb(app=app, conf=MongoConfig())
+    assert conf.dbs is None
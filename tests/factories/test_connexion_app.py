@@ -1,5 +1,7 @@
 """Tests for foca.factories.connexion_app."""
 
+import logging
+
 from connexion import App
 
 from foca.models.config import Config
@@ -38,3 +40,17 @@ def test_create_connexion_app_with_config():
     """Test Connexion app creation with config."""
     cnx_app = create_connexion_app(CONFIG)
     assert isinstance(cnx_app, App)
+
+
+def test_create_connexion_app_logs_caller(caplog):
+    """Test that calling function is logged at debug level."""
+    with caplog.at_level(logging.DEBUG, logger="foca.factories.connexion_app"):
+        create_connexion_app()
+    assert "test_create_connexion_app_logs_caller" in caplog.text
+
+
+def test_create_connexion_app_with_compression():
+    """Test Connexion app creation with response compression."""
+    config = Config(server={"compression": {"enabled": True}})
+    cnx_app = create_connexion_app(config)
+    assert len(cnx_app.app.after_request_funcs[None]) == 1
@@ -4,6 +4,7 @@ from pathlib import Path
 import sys
 
 from pydantic import ValidationError
+from pymongo import MongoClient
 import pytest
 
 from foca.models.config import (
@@ -13,6 +14,10 @@ from foca.models.config import (
     ExceptionConfig,
     IndexConfig,
     MongoConfig,
+    OperationCacheConfig,
+    PaginationConfig,
+    ResponseCacheConfig,
+    ResponseValidationConfig,
     SpecConfig,
 )
 
@@ -270,6 +275,25 @@ def test_collection_config_with_data():
     assert isinstance(res, CollectionConfig)
 
 
+def test_collection_config_with_client():
+    """Test creation of the CollectionConfig model with a client."""
+    client = MongoClient(connect=False).db.collection
+    res = CollectionConfig(client=client)
+    assert res.client is client
+
+
+def test_collection_config_with_invalid_client():
+    """Test creation of the CollectionConfig model with an invalid client."""
+    with pytest.raises(ValidationError):
+        CollectionConfig(client=MongoClient(connect=False).db)
+
+
+def test_db_config_with_invalid_client():
+    """Test creation of the DBConfig model with an invalid client."""
+    with pytest.raises(ValidationError):
+        DBConfig(client=MongoClient(connect=False).db.collection)
+
+
 def test_db_config_empty():
     """Test basic creation of the DBConfig model."""
     res = DBConfig()
@@ -385,3 +409,38 @@ def test_SpecConfig_extra_arg():
     """Test SpecConfig instantiation; extra argument."""
     with pytest.raises(ValidationError):
         SpecConfig(non_existing=PATH)
+
+
+def test_SpecConfig_response_validation():
+    """Test SpecConfig instantiation; sampled response validation."""
+    res = SpecConfig(path=PATH, response_validation={"sample_rate": 0.1})
+    assert isinstance(res.response_validation, ResponseValidationConfig)
+    assert res.response_validation.sample_rate == 0.1
+
+
+def test_ResponseValidationConfig_invalid_sample_rate():
+    """Test ResponseValidationConfig instantiation; sample rate out of
+    range.
+    """
+    with pytest.raises(ValidationError):
+        ResponseValidationConfig(sample_rate=1.5)
+
+
+def test_ResponseCacheConfig_invalid_max_entries():
+    """Test ResponseCacheConfig instantiation; no entries."""
+    with pytest.raises(ValidationError):
+        ResponseCacheConfig(max_entries=0)
+
+
+def test_OperationCacheConfig_invalid_ttl():
+    """Test OperationCacheConfig instantiation; negative time to live."""
+    with pytest.raises(ValidationError):
+        OperationCacheConfig(ttl=-1)
+
+
+def test_PaginationConfig_default_exceeds_max():
+    """Test PaginationConfig instantiation; default limit exceeds maximum
+    limit.
+    """
+    with pytest.raises(ValidationError):
+        PaginationConfig(default_limit=200, max_limit=100)
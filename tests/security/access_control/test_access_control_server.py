@@ -190,7 +190,7 @@ class TestGetAllPermissions(BaseTestAccessControl):
         data['id'] = MOCK_ID
         with app.app_context():
             res = getAllPermissions.__wrapped__()
-            assert res == [data]
+            assert res.json == [data]
 
     def test_getAllPermissions_filters(self):
         """Test for getting a list of all available permissions.
@@ -214,7 +214,7 @@ class TestGetAllPermissions(BaseTestAccessControl):
         data['id'] = MOCK_ID
         with app.app_context():
             res = getAllPermissions.__wrapped__(limit=1)
-            assert res == [data]
+            assert res.json == [data]
 
 
 class TestPostPermission(BaseTestAccessControl):
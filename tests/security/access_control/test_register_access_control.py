@@ -1,20 +1,25 @@
 """Tests for registering access control"""
 
+from connexion import App
 from flask import Flask
 import mongomock
 from pymongo import MongoClient
 from unittest import TestCase
 import pytest
 
+from foca.security.access_control import access_control_server
 from foca.security.access_control.register_access_control import (
-    check_permissions
+    check_permissions,
+    register_permission_specs,
 )
 from foca.security.access_control.foca_casbin_adapter.adapter import Adapter
 from foca.errors.exceptions import Forbidden
 from foca.models.config import AccessControlConfig, Config, MongoConfig
 from tests.mock_data import (
     ACCESS_CONTROL_CONFIG,
+    MOCK_ID,
     MOCK_REQUEST,
+    MOCK_RULE,
     MONGO_CONFIG,
     MOCK_PERMISSION
 )
@@ -110,3 +115,41 @@ class TestRegisterAccessControl(TestCase):
         ):
             with pytest.raises(Forbidden):
                 mock_func()
+
+
+def test_register_permission_specs_streamed(monkeypatch):
+    """Permissions are streamed without being validated, while other
+    responses are still validated.
+    """
+    transformed = []
+
+    def _to_user_permission(permission):
+        transformed.append(permission)
+        return _transform(permission)
+
+    _transform = access_control_server._to_user_permission
+    monkeypatch.setattr(
+        access_control_server, '_to_user_permission', _to_user_permission
+    )
+    app = App(__name__)
+    access_control = AccessControlConfig(**ACCESS_CONTROL_CONFIG)
+    app.app.config.foca = Config(db=MongoConfig(**MONGO_CONFIG))
+    app.app.config.foca.security.access_control = access_control
+    collection = mongomock.MongoClient().db.collection
+    collection.insert_many([
+        {**MOCK_RULE, 'id': f'{MOCK_ID}_{index}'} for index in range(2000)
+    ])
+    app.app.config.foca.db.dbs[access_control.db_name].collections[
+        access_control.collection_name
+    ].client = collection
+    register_permission_specs(app=app, access_control_config=access_control)
+    client = app.app.test_client()
+    res = client.get('/admin/access-control/permissions', buffered=False)
+    assert res.status_code == 200
+    assert res.is_streamed
+    assert 0 < len(transformed) < 2000
+    assert res.json[0]['id'] == f'{MOCK_ID}_1999'
+    assert len(transformed) == 2000
+    collection.insert_one({**MOCK_RULE, 'id': 'invalid', 'ptype': 1})
+    res = client.get('/admin/access-control/permissions/invalid')
+    assert res.status_code == 500
@@ -1,8 +1,11 @@
 """Tests for `foca.py` module."""
 
+import json
 from pathlib import Path
 import pytest
 import shutil
+import subprocess
+import sys
 
 from celery import Celery
 from connexion import App
@@ -15,10 +18,10 @@ from yaml import (
 )
 
 from foca import Foca
+from foca.database.register_async_mongodb import AsyncHandle
 
 DIR = Path(__file__).parent / "test_files"
 PATH_SPECS_2_YAML_ORIGINAL = str(DIR / "openapi_2_petstore.original.yaml")
-PATH_SPECS_2_YAML_MODIFIED = str(DIR / "openapi_2_petstore.modified.yaml")
 EMPTY_CONF = DIR / "empty_conf.yaml"
 INVALID_CONF = DIR / "invalid_conf.yaml"
 VALID_DB_CONF = DIR / "conf_db.yaml"
@@ -48,6 +51,22 @@ def create_modified_api_conf(path, temp_dir, api_specs_in, api_specs_out):
     return temp_path
 
 
+def test_foca_import_lazy():
+    """Ensure that optional subsystems are not imported with FOCA."""
+    statement = (
+        "import sys; from foca import Foca; "
+        "print(','.join(m for m in ['casbin', 'celery', 'flask_authz', "
+        "'flask_pymongo', 'pymongo'] if m in sys.modules))"
+    )
+    res = subprocess.run(
+        [sys.executable, "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert res.stdout.strip() == ""
+
+
 def test_foca_constructor_empty_conf():
     """Empty config."""
     with pytest.raises(ValidationError):
@@ -98,13 +117,26 @@ def test_foca_create_app_api(tmpdir):
         API_CONF,
         tmpdir,
         PATH_SPECS_2_YAML_ORIGINAL,
-        PATH_SPECS_2_YAML_MODIFIED,
+        str(Path(tmpdir) / "openapi_2_petstore.modified.yaml"),
     )
     foca = Foca(config_file=temp_file)
     app = foca.create_app()
     assert isinstance(app, App)
 
 
+def test_foca_create_app_profiling(monkeypatch, tmpdir):
+    """Ensure startup profile is written if enabled via environment."""
+    output = Path(tmpdir) / "profile.json"
+    monkeypatch.setenv("FOCA_PROFILE_STARTUP", "true")
+    monkeypatch.setenv("FOCA_PROFILE_STARTUP_OUTPUT", str(output))
+    foca = Foca()
+    foca.create_app()
+    with open(output) as _file:
+        profile = json.load(_file)
+    phases = [phase["name"] for phase in profile["phases"]]
+    assert phases[:2] == ["parse_config", "create_connexion_app"]
+
+
 def test_foca_db():
     """Ensure a Connexion app instance is returned; valid 'db' field."""
     foca = Foca(config_file=VALID_DB_CONF)
@@ -116,6 +148,21 @@ def test_foca_db():
     assert isinstance(app, App)
 
 
+def test_foca_db_async_clients(tmp_path):
+    """Ensure asynchronous handles are registered if enabled."""
+    conf = safe_load(VALID_DB_CONF.read_text())
+    conf["db"]["async_clients"] = True
+    config_file = tmp_path / "conf_db_async.yaml"
+    config_file.write_text(safe_dump(conf))
+    foca = Foca(config_file=config_file)
+    app = foca.create_app()
+    my_db = app.app.config.foca.db.dbs["my-db"]
+    my_coll = my_db.collections["my-col-1"]
+    assert isinstance(my_db.client, Database)
+    assert isinstance(my_db.async_client, AsyncHandle)
+    assert isinstance(my_coll.async_client, AsyncHandle)
+
+
 def test_foca_cors_config_flag_enabled():
     """Ensures CORS config flag is set correctly (enabled)."""
     foca = Foca(config_file=VALID_CORS_CONF_ENABLED)
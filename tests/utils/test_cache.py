@@ -0,0 +1,84 @@
+"""Unit tests for utils.cache.py"""
+
+import pytest
+
+from foca.utils.cache import LRUCache
+
+
+class MockTimer:
+    """Manually advanced timer."""
+
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+class TestLRUCache:
+
+    def test_get_set(self):
+        """Values are returned until they are replaced."""
+        cache = LRUCache()
+        assert cache.get("a") is None
+        assert cache.get("a", 0) == 0
+        cache.set("a", 1)
+        cache.set("a", 2)
+        assert cache.get("a") == 2
+        assert len(cache) == 1
+
+    def test_evict_least_recently_used(self):
+        """Least recently used entries are evicted first."""
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_expiry(self):
+        """Entries expire after their time to live."""
+        timer = MockTimer()
+        cache = LRUCache(ttl=10, timer=timer)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=20)
+        timer.time = 10
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        timer.time = 20
+        assert cache.get("b") is None
+        assert len(cache) == 0
+
+    def test_no_expiry(self):
+        """Entries do not expire if no time to live is set."""
+        timer = MockTimer()
+        cache = LRUCache(timer=timer)
+        cache.set("a", 1)
+        timer.time = 1e9
+        assert cache.get("a") == 1
+
+    def test_invalidate(self):
+        """Entries are removed by key and tag."""
+        cache = LRUCache()
+        cache.set("a", 1, tags=["x"])
+        cache.set("b", 2, tags=["x", "y"])
+        cache.set("c", 3, tags=["z"])
+        cache.set("d", 4)
+        assert cache.invalidate(tags=["y"]) == 1
+        assert cache.invalidate(keys=["d", "e"], tags=["x"]) == 2
+        assert cache.get("c") == 3
+        assert len(cache) == 1
+
+    def test_clear(self):
+        """All entries are removed."""
+        cache = LRUCache()
+        cache.set("a", 1)
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_max_entries(self):
+        """At least one entry is required."""
+        with pytest.raises(ValueError):
+            LRUCache(max_entries=0)
@@ -1,8 +1,21 @@
 """Tests for the database utilties module."""
 
+import json
+
+from flask import Blueprint, Flask
 import mongomock
+import pytest
+from werkzeug.exceptions import BadRequest
 
-from foca.utils.db import find_id_latest, find_one_latest
+from foca.utils.db import (
+    find_id_latest,
+    find_one_latest,
+    NEXT_PAGE_TOKEN_HEADER,
+    paginate,
+    register_page_token_secret,
+    SequenceAllocator,
+    stream_json_array,
+)
 
 
 def test_find_one_latest():
@@ -41,3 +54,244 @@ def test_find_id_latest_returns_None():
     """Test that find_one_latest return empty if collection is empty."""
     collection = mongomock.MongoClient().db.collection
     assert find_id_latest(collection) is None
+
+
+def test_sequence_allocator():
+    """Test that SequenceAllocator hands out identifiers in order."""
+    collection = mongomock.MongoClient().db.counters
+    ids = SequenceAllocator(collection, 'pets', start=1)
+    assert [ids.next() for _ in range(3)] == [1, 2, 3]
+    assert collection.find_one({'_id': 'pets'})['value'] == 3
+
+
+def test_sequence_allocator_blocks():
+    """Test that SequenceAllocator instances reserve disjoint blocks."""
+    collection = mongomock.MongoClient().db.counters
+    ids1 = SequenceAllocator(collection, 'pets', block_size=3)
+    ids2 = SequenceAllocator(collection, 'pets', block_size=3)
+    res1 = [ids1.next() for _ in range(4)]
+    res2 = [ids2.next() for _ in range(2)]
+    assert res1 == [0, 1, 2, 3]
+    assert res2 == [6, 7]
+    assert ids1.reserve(2) == range(9, 11)
+    assert SequenceAllocator(collection, 'owners').next() == 0
+
+
+def test_sequence_allocator_invalid():
+    """Test that SequenceAllocator rejects non-positive block sizes."""
+    collection = mongomock.MongoClient().db.counters
+    with pytest.raises(ValueError):
+        SequenceAllocator(collection, 'pets', block_size=0)
+    with pytest.raises(ValueError):
+        SequenceAllocator(collection, 'pets').reserve(0)
+
+
+def test_stream_json_array():
+    """Test that stream_json_array returns documents as JSON array."""
+    collection = mongomock.MongoClient().db.collection
+    collection.insert_many([{'_id': i, 'name': f'pet_{i}'} for i in range(3)])
+    res = stream_json_array(collection.find({}, {'_id': False}))
+    assert res.is_streamed
+    assert res.mimetype == 'application/json'
+    assert json.loads(res.get_data()) == [
+        {'name': 'pet_0'}, {'name': 'pet_1'}, {'name': 'pet_2'},
+    ]
+
+
+def test_stream_json_array_empty():
+    """Test that stream_json_array returns empty array if there are no
+    documents.
+    """
+    collection = mongomock.MongoClient().db.collection
+    res = stream_json_array(collection.find())
+    assert res.get_data() == b'[]\n'
+
+
+def test_stream_json_array_chunks():
+    """Test that stream_json_array sends documents in chunks and closes
+    cursor.
+    """
+    class Cursor(list):
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    cursor = Cursor([{'id': i} for i in range(10)])
+    res = stream_json_array(
+        cursor,
+        transform=lambda doc: doc['id'],
+        chunk_size=4,
+    )
+    chunks = list(res.response)
+    assert len(chunks) == 6
+    assert json.loads(''.join(chunks)) == list(range(10))
+    assert cursor.closed
+
+
+def test_stream_json_array_request_context():
+    """Test that stream_json_array can be returned from view function."""
+    app = Flask(__name__)
+
+    @app.route('/pets')
+    def find_pets():
+        return stream_json_array(
+            iter([{'name': 'Rex'}]),
+            transform=lambda doc: {**doc, 'app': app.name},
+        )
+
+    res = app.test_client().get('/pets')
+    assert res.json == [{'name': 'Rex', 'app': __name__}]
+
+
+def create_pets():
+    """Create collection of pets with duplicate sort key values."""
+    collection = mongomock.MongoClient().db.pets
+    collection.insert_many([
+        {'id': index % 4, 'name': f'pet{index}', 'tag': 'dog'}
+        for index in range(10)
+    ])
+    return collection
+
+
+def test_paginate():
+    """Test that paginate returns all documents once, in order."""
+    collection = create_pets()
+    names = []
+    page_token = None
+    for _ in range(4):
+        page = paginate(
+            collection,
+            sort=[('id', -1)],
+            limit=3,
+            page_token=page_token,
+            projection={'_id': False, 'tag': False},
+            secret='secret',
+        )
+        names.extend(doc['name'] for doc in page.items)
+        assert all(set(doc) == {'id', 'name'} for doc in page.items)
+        page_token = page.next_page_token
+    assert page_token is None
+    assert page.headers == {}
+    expected = collection.find().sort([('id', -1), ('_id', -1)])
+    assert names == [doc['name'] for doc in expected]
+
+
+@pytest.mark.parametrize('direction', [1, -1])
+def test_paginate_null_sort_keys(direction):
+    """Test that documents with null or missing sort keys are returned."""
+    collection = create_pets()
+    collection.insert_many([
+        {'id': None, 'name': 'null1'},
+        {'name': 'missing'},
+        {'id': None, 'name': 'null2'},
+    ])
+    names = []
+    page_token = None
+    while True:
+        page = paginate(
+            collection,
+            sort=[('id', direction)],
+            limit=2,
+            page_token=page_token,
+            secret='secret',
+        )
+        names.extend(doc['name'] for doc in page.items)
+        page_token = page.next_page_token
+        if page_token is None:
+            break
+    expected = collection.find().sort([('id', direction), ('_id', direction)])
+    assert names == [doc['name'] for doc in expected]
+    assert len(names) == 13
+
+
+def test_paginate_projection():
+    """Test that sort keys not included in projection are stripped."""
+    collection = create_pets()
+    page = paginate(
+        collection,
+        filter={'id': 1},
+        sort=[('id', 1), ('name', 1)],
+        limit=1,
+        projection=['tag'],
+        secret='secret',
+    )
+    assert set(page.items[0]) == {'_id', 'tag'}
+    assert NEXT_PAGE_TOKEN_HEADER in page.headers
+
+
+def test_paginate_invalid_token():
+    """Test that tampered tokens and tokens for other queries are
+    rejected.
+    """
+    collection = create_pets()
+    page = paginate(collection, limit=2, secret='secret')
+    payload, signature = page.next_page_token.split('.')
+    with pytest.raises(BadRequest):
+        paginate(collection, page_token=f'{payload}x.{signature}',
+                 secret='secret')
+    with pytest.raises(BadRequest):
+        paginate(collection, page_token=page.next_page_token, secret='other')
+    with pytest.raises(BadRequest):
+        paginate(
+            collection,
+            filter={'tag': 'dog'},
+            page_token=page.next_page_token,
+            secret='secret',
+        )
+    with pytest.raises(BadRequest):
+        paginate(collection, page_token='invalid', secret='secret')
+
+
+def test_paginate_app_secret():
+    """Test that the app's secret key is used by default."""
+    collection = create_pets()
+    app = Flask(__name__)
+    with app.app_context():
+        with pytest.raises(ValueError):
+            paginate(collection)
+        app.secret_key = 'secret'
+        page = paginate(collection, limit=5)
+    assert len(page.items) == 5
+    assert paginate(
+        collection,
+        page_token=page.next_page_token,
+        secret='secret',
+    ).next_page_token is None
+
+
+def test_paginate_blueprint_secret(monkeypatch):
+    """Test that the key registered for the blueprint is used by default."""
+    collection = create_pets()
+    monkeypatch.setenv('PAGE_TOKEN_SECRET', 'secret')
+    app = Flask(__name__)
+    app.secret_key = 'other'
+    blueprint = Blueprint('pets', __name__, url_prefix='/pets')
+    blueprint.add_url_rule('/', 'list', lambda: '')
+    app.register_blueprint(blueprint)
+    register_page_token_secret(
+        app=app,
+        blueprint='pets',
+        secret='ignored',
+        secret_env='PAGE_TOKEN_SECRET',
+    )
+    with app.test_request_context('/pets/'):
+        page = paginate(collection, limit=5)
+    with pytest.raises(BadRequest):
+        paginate(collection, page_token=page.next_page_token, secret='other')
+    assert paginate(
+        collection,
+        page_token=page.next_page_token,
+        secret='secret',
+    ).next_page_token is None
+
+
+def test_register_page_token_secret_env_unset(monkeypatch):
+    """Test that a missing environment variable is reported."""
+    monkeypatch.delenv('PAGE_TOKEN_SECRET', raising=False)
+    with pytest.raises(ValueError):
+        register_page_token_secret(
+            app=Flask(__name__),
+            blueprint='pets',
+            secret_env='PAGE_TOKEN_SECRET',
+        )
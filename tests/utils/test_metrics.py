@@ -0,0 +1,61 @@
+"""Unit tests for utils.metrics.py"""
+
+from threading import Thread
+
+from foca.utils.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry:
+
+    def test_increment(self):
+        """Counters are incremented per set of labels."""
+        registry = MetricsRegistry()
+        registry.increment("requests", method="GET")
+        registry.increment("requests", 2, method="GET")
+        registry.increment("requests", method="POST")
+        assert registry.get_counter("requests", method="GET") == 3
+        assert registry.get_counter("requests", method="POST") == 1
+        assert registry.get_counter("requests", method="PUT") == 0
+
+    def test_increment_threads(self):
+        """Counters are incremented consistently from multiple threads."""
+        registry = MetricsRegistry()
+
+        def _increment():
+            for _ in range(1000):
+                registry.increment("requests")
+
+        threads = [Thread(target=_increment) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert registry.get_counter("requests") == 4000
+
+    def test_observe(self):
+        """Observations are summarized in histogram."""
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 5.0):
+            registry.observe("latency", value, operation="find")
+        res = registry.get_histogram("latency", operation="find")
+        assert res == {
+            "count": 4,
+            "sum": 6.25,
+            "min": 0.05,
+            "max": 5.0,
+            "buckets": {0.1: 1, 1.0: 2, float("inf"): 1},
+        }
+        assert registry.get_histogram("latency") is None
+
+    def test_snapshot_and_reset(self):
+        """Snapshot lists all metrics; reset removes them."""
+        registry = MetricsRegistry()
+        registry.increment("requests", method="GET")
+        registry.observe("latency", 0.2)
+        res = registry.snapshot()
+        assert res["counters"] == {
+            "requests": [{"labels": {"method": "GET"}, "value": 1}],
+        }
+        assert res["histograms"]["latency"][0]["value"]["count"] == 1
+        registry.reset()
+        assert registry.snapshot() == {"counters": {}, "histograms": {}}
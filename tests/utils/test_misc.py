@@ -4,7 +4,7 @@ import string
 
 import pytest
 
-from foca.utils.misc import generate_id
+from foca.utils.misc import (generate_id, get_caller)
 
 
 class TestGenerateId:
@@ -68,3 +68,16 @@ class TestGenerateId:
         length = -1
         with pytest.raises(TypeError):
             generate_id(length=length)
+
+
+class TestGetCaller:
+
+    def test_caller(self):
+        """Caller of calling function is returned."""
+        def callee():
+            return get_caller()
+        assert callee() == f"{__file__}:test_caller"
+
+    def test_too_deep(self):
+        """Placeholder is returned if call stack is not deep enough."""
+        assert get_caller(depth=10**6) == "<unknown>"
@@ -0,0 +1,58 @@
+"""Tests for the startup profiling utilities module."""
+
+import builtins
+import importlib
+import json
+
+from foca.utils.profiling import StartupProfiler
+
+
+def test_phase():
+    """Test that a phase is profiled and import hooks are restored."""
+    original_import = builtins.__import__
+    original_import_module = importlib.import_module
+    profiler = StartupProfiler()
+    with profiler.phase("test"):
+        import json  # noqa: F401, F811
+        importlib.import_module("json")
+        data = [0] * 10000  # noqa: F841
+    assert builtins.__import__ is original_import
+    assert importlib.import_module is original_import_module
+    assert len(profiler.phases) == 1
+    phase = profiler.phases[0]
+    assert phase["name"] == "test"
+    assert phase["wall_time"] >= phase["import_time"] >= 0
+    assert phase["imported_modules"] >= 0
+    assert phase["memory_peak"] > 0
+
+
+def test_phase_disabled():
+    """Test that nothing is recorded if profiler is disabled."""
+    profiler = StartupProfiler(enabled=False)
+    with profiler.phase("test"):
+        pass
+    profiler.record("other", 1.0)
+    assert profiler.phases == []
+    assert profiler.finish() is None
+
+
+def test_record():
+    """Test recording of externally timed phase."""
+    profiler = StartupProfiler()
+    profiler.record("test", 1.5)
+    assert profiler.phases[0]["wall_time"] == 1.5
+    assert profiler.phases[0]["import_time"] is None
+
+
+def test_finish_output(tmp_path):
+    """Test that profile is written to file."""
+    output = tmp_path / "profile.json"
+    profiler = StartupProfiler(output=output)
+    profiler.record("first", 1.0)
+    with profiler.phase("second"):
+        pass
+    report = profiler.finish()
+    assert report is not None
+    assert report["total"]["wall_time"] >= 1.0
+    with open(output) as _file:
+        assert json.load(_file) == report